@@ -21,6 +21,7 @@ from .base import (
     # Utilities — safe to reuse from user code
     AsyncMixin,
     async_wrap,
+    prefetch,
     retry,
     # TypedDicts — describe values returned by service methods
     InstanceDict,
@@ -69,6 +70,7 @@ __all__ = [
     # Utilities
     "AsyncMixin",
     "async_wrap",
+    "prefetch",
     "retry",
     # TypedDicts
     "InstanceDict",
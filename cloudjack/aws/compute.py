@@ -133,6 +133,45 @@ class Compute(ComputeService):
         except ClientError as e:
             _handle(e, f"Failed to terminate instance '{instance_id}'")
 
+    def start_instances(self, instance_ids: list[str]) -> None:
+        """Start several EC2 instances with a single ``StartInstances`` call.
+
+        Raises:
+            InstanceNotFoundError: If any instance does not exist.
+        """
+        if not instance_ids:
+            return
+        try:
+            self.client.start_instances(InstanceIds=instance_ids)
+        except ClientError as e:
+            _handle(e, f"Failed to start instances {instance_ids}")
+
+    def stop_instances(self, instance_ids: list[str]) -> None:
+        """Stop several EC2 instances with a single ``StopInstances`` call.
+
+        Raises:
+            InstanceNotFoundError: If any instance does not exist.
+        """
+        if not instance_ids:
+            return
+        try:
+            self.client.stop_instances(InstanceIds=instance_ids)
+        except ClientError as e:
+            _handle(e, f"Failed to stop instances {instance_ids}")
+
+    def terminate_instances(self, instance_ids: list[str]) -> None:
+        """Terminate several EC2 instances with a single ``TerminateInstances`` call.
+
+        Raises:
+            InstanceNotFoundError: If any instance does not exist.
+        """
+        if not instance_ids:
+            return
+        try:
+            self.client.terminate_instances(InstanceIds=instance_ids)
+        except ClientError as e:
+            _handle(e, f"Failed to terminate instances {instance_ids}")
+
     def list_instances(self, **kwargs: Any) -> list[InstanceDict]:
         """List EC2 instances.
 
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterable
 from typing import Any, NoReturn, cast
 
 import boto3
 from botocore.exceptions import ClientError
 
-from cloudjack.base.dns import DNSService
+from cloudjack.base.dns import DNSService, RecordChange, split_record_changes
 from cloudjack.base.exceptions import (
     DNSError,
     ZoneNotFoundError,
@@ -23,11 +24,25 @@ _ERROR_MAP: dict[str, type[DNSError]] = {
 }
 
 
+# Route 53 per-request limits on ResourceRecord elements and on the total
+# characters in their values; UPSERT changes count twice towards both.
+_MAX_BATCH_RECORDS = 1000
+_MAX_BATCH_CHARS = 32_000
+
+
 def _handle(e: ClientError, msg: str) -> NoReturn:
     exc = _ERROR_MAP.get(e.response["Error"]["Code"])
     raise (exc or DNSError)(msg) from e
 
 
+def _change_weight(change: RecordChange) -> tuple[int, int]:
+    """Cost of one change against ``(_MAX_BATCH_RECORDS, _MAX_BATCH_CHARS)``."""
+    action, record = change
+    factor = 2 if action == "UPSERT" else 1
+    values = record["values"]
+    return factor * len(values), factor * sum(len(v) for v in values)
+
+
 class DNS(DNSService):
     """AWS Route 53 DNS service.
 
@@ -69,7 +84,7 @@ class DNS(DNSService):
                     "PrivateZone": kwargs.get("private", False),
                 },
             )
-            return resp["HostedZone"]["Id"].split("/")[-1]  # type: ignore[no-any-return]
+            return resp["HostedZone"]["Id"].rpartition("/")[2]  # type: ignore[no-any-return]
         except ClientError as e:
             _handle(e, f"Failed to create zone '{zone_name}'")
 
@@ -103,7 +118,7 @@ class DNS(DNSService):
             for page in paginator.paginate():
                 zones.extend(
                     {
-                        "zone_id": z["Id"].split("/")[-1],
+                        "zone_id": z["Id"].rpartition("/")[2],
                         "name": z["Name"],
                         "record_count": z.get("ResourceRecordSetCount", 0),
                         "private": z.get("Config", {}).get("PrivateZone", False),
@@ -116,6 +131,53 @@ class DNS(DNSService):
 
     # --- Record management ---
 
+    def _change_batch(
+        self, zone_id: str, changes: list[RecordChange], what: str
+    ) -> None:
+        """Submit ``(action, record)`` pairs as Route 53 change batches.
+
+        Changes that fit Route 53's per-request limits go in one atomic
+        batch; larger sets are split by :func:`split_record_changes` and
+        submitted in order.
+
+        Args:
+            zone_id: Hosted zone ID.
+            changes: Route 53 action (``UPSERT``, ``CREATE``, ``DELETE``) and
+                record for each change.
+            what: Description used in the error message.
+
+        Raises:
+            DNSError: On Route 53 API failure. Batches before the failing
+                one stay applied.
+        """
+        batches = split_record_changes(
+            changes, _change_weight, (_MAX_BATCH_RECORDS, _MAX_BATCH_CHARS)
+        )
+        for done, batch in enumerate(batches):
+            try:
+                self.client.change_resource_record_sets(
+                    HostedZoneId=zone_id,
+                    ChangeBatch={
+                        "Changes": [
+                            {
+                                "Action": action,
+                                "ResourceRecordSet": {
+                                    "Name": record["name"],
+                                    "Type": record["type"],
+                                    "TTL": record.get("ttl", 300),
+                                    "ResourceRecords": [
+                                        {"Value": v} for v in record["values"]
+                                    ],
+                                },
+                            }
+                            for action, record in batch
+                        ]
+                    },
+                )
+            except ClientError as e:
+                suffix = f" ({done} of {len(batches)} batches applied)" if done else ""
+                _handle(e, f"Failed to {what} in zone '{zone_id}'{suffix}")
+
     def _change_record(
         self,
         zone_id: str,
@@ -125,43 +187,13 @@ class DNS(DNSService):
         values: list[str],
         ttl: int,
     ) -> None:
-        """Apply a Route 53 change batch (UPSERT / DELETE).
-
-        Args:
-            zone_id: Hosted zone ID.
-            action: Route 53 action (``UPSERT``, ``CREATE``, ``DELETE``).
-            record_name: FQDN of the record.
-            record_type: DNS record type (A, CNAME, MX, …).
-            values: Record values.
-            ttl: Time-to-live in seconds.
-
-        Raises:
-            DNSError: On Route 53 API failure.
-        """
-        try:
-            self.client.change_resource_record_sets(
-                HostedZoneId=zone_id,
-                ChangeBatch={
-                    "Changes": [
-                        {
-                            "Action": action,
-                            "ResourceRecordSet": {
-                                "Name": record_name,
-                                "Type": record_type,
-                                "TTL": ttl,
-                                "ResourceRecords": [
-                                    {"Value": v} for v in values
-                                ],
-                            },
-                        }
-                    ]
-                },
-            )
-        except ClientError as e:
-            _handle(
-                e,
-                f"Failed to {action.lower()} record '{record_name}' in zone '{zone_id}'",
-            )
+        """Apply a single-record change batch (UPSERT / DELETE)."""
+        record: RecordDict = {
+            "name": record_name, "type": record_type, "ttl": ttl, "values": values,
+        }
+        self._change_batch(
+            zone_id, [(action, record)], f"{action.lower()} record '{record_name}'"
+        )
 
     def create_record(
         self,
@@ -205,6 +237,33 @@ class DNS(DNSService):
         """
         self._change_record(zone_id, "DELETE", record_name, record_type, values, ttl)
 
+    def apply_record_changes(
+        self,
+        zone_id: str,
+        adds: Iterable[RecordDict] = (),
+        deletes: Iterable[RecordDict] = (),
+    ) -> None:
+        """Apply record upserts and deletions as Route 53 change batches.
+
+        Everything goes in one atomic batch when it fits within 1000 record
+        values and 32,000 value characters (upserts count twice). Larger
+        sets are split into batches applied in order; a record name's
+        delete and upsert always share a batch.
+
+        Args:
+            zone_id: Hosted zone ID.
+            adds: Records to upsert (``name``, ``type``, ``values``, ``ttl``).
+            deletes: Records to delete; must match the existing record.
+
+        Raises:
+            DNSError: On Route 53 API failure. Nothing from the failing
+                batch is applied; earlier batches stay applied.
+        """
+        changes: list[RecordChange] = (
+            [("DELETE", r) for r in deletes] + [("UPSERT", r) for r in adds]
+        )
+        self._change_batch(zone_id, changes, f"apply {len(changes)} record change(s)")
+
     def list_records(self, zone_id: str) -> list[RecordDict]:
         """List all DNS records in a Route 53 hosted zone.
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Iterator
 from typing import Any, NoReturn, cast
 
 import boto3
@@ -107,15 +108,18 @@ class Logging(LoggingService):
         Raises:
             LoggingError: On CloudWatch API failure.
         """
+        return list(self.iter_log_groups(prefix))
+
+    def iter_log_groups(self, prefix: str = "") -> Iterator[str]:
+        """Yield CloudWatch log group names as each page arrives."""
         try:
             params: dict[str, Any] = {}
             if prefix:
                 params["logGroupNamePrefix"] = prefix
-            groups: list[str] = []
             paginator = self.client.get_paginator("describe_log_groups")
             for page in paginator.paginate(**params):
-                groups.extend(g["logGroupName"] for g in page.get("logGroups", []))
-            return groups
+                for g in page.get("logGroups", []):
+                    yield g["logGroupName"]
         except ClientError as e:
             _handle(e, "Failed to list log groups")
 
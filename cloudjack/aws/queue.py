@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from itertools import islice
 from typing import Any, NoReturn, cast
 
 import boto3
@@ -24,6 +26,30 @@ _ERROR_MAP: dict[str, type[QueueError]] = {
     "QueueAlreadyExists": QueueAlreadyExistsError,
 }
 
+# SQS batch actions accept at most 10 entries per request, and a
+# SendMessageBatch payload may not exceed 256 KiB in total.
+_BATCH_SIZE = 10
+_MAX_BATCH_BYTES = 256 * 1024
+
+
+def _send_batches(bodies: list[str]) -> list[list[tuple[int, str]]]:
+    """Group ``(index, body)`` pairs into SendMessageBatch-sized chunks."""
+    batches: list[list[tuple[int, str]]] = []
+    current: list[tuple[int, str]] = []
+    current_bytes = 0
+    for i, body in enumerate(bodies):
+        size = len(body.encode("utf-8"))
+        if current and (
+            len(current) == _BATCH_SIZE or current_bytes + size > _MAX_BATCH_BYTES
+        ):
+            batches.append(current)
+            current, current_bytes = [], 0
+        current.append((i, body))
+        current_bytes += size
+    if current:
+        batches.append(current)
+    return batches
+
 
 def _handle(e: ClientError, msg: str) -> NoReturn:
     exc = _ERROR_MAP.get(e.response["Error"]["Code"])
@@ -139,6 +165,61 @@ class Queue(QueueService):
         except ClientError as e:
             raise MessageError(f"Failed to send message to '{queue_id}'") from e
 
+    def send_message_batch(
+        self, queue_id: str, bodies: list[str], **kwargs: Any
+    ) -> list[str]:
+        """Send several messages to an SQS queue via ``SendMessageBatch``.
+
+        Bodies are grouped into batches of at most 10 entries and 256 KiB
+        and sent in order. Sending stops at the first failed request or
+        rejected entry. Batches before it have already been delivered, and
+        their message IDs are not returned.
+
+        Args:
+            queue_id: Queue URL.
+            bodies: Message body strings.
+            **kwargs: ``delay_seconds``, ``message_attributes`` (applied to
+                every message).
+
+        Returns:
+            SQS-assigned message IDs, in the same order as *bodies*.
+
+        Raises:
+            MessageError: If a request fails or any entry is rejected. The
+                message says how many bodies were sent before the failure.
+        """
+        extra: dict[str, Any] = {}
+        if "delay_seconds" in kwargs:
+            extra["DelaySeconds"] = kwargs["delay_seconds"]
+        if "message_attributes" in kwargs:
+            extra["MessageAttributes"] = kwargs["message_attributes"]
+        message_ids: list[str] = [""] * len(bodies)
+        sent = 0
+        for batch in _send_batches(bodies):
+            try:
+                resp = self.client.send_message_batch(
+                    QueueUrl=queue_id,
+                    Entries=[
+                        {"Id": str(i), "MessageBody": body, **extra}
+                        for i, body in batch
+                    ],
+                )
+            except ClientError as e:
+                raise MessageError(
+                    f"Failed to send messages to '{queue_id}' "
+                    f"({sent} of {len(bodies)} sent)"
+                ) from e
+            successful = resp.get("Successful", [])
+            sent += len(successful)
+            if resp.get("Failed"):
+                raise MessageError(
+                    f"Failed to send {len(resp['Failed'])} message(s) "
+                    f"to '{queue_id}' ({sent} of {len(bodies)} sent)"
+                )
+            for entry in successful:
+                message_ids[int(entry["Id"])] = entry["MessageId"]
+        return message_ids
+
     def receive_messages(
         self, queue_id: str, max_messages: int = 1, **kwargs: Any
     ) -> list[MessageDict]:
@@ -195,3 +276,37 @@ class Queue(QueueService):
             )
         except ClientError as e:
             raise MessageError(f"Failed to delete message from '{queue_id}'") from e
+
+    def delete_messages(self, queue_id: str, receipt_handles: Iterable[str]) -> None:
+        """Delete (acknowledge) many messages via ``DeleteMessageBatch``.
+
+        Handles are sent in batches of up to 10 (the SQS limit).
+
+        Args:
+            queue_id: Queue URL.
+            receipt_handles: Handles from :meth:`receive_messages`.
+
+        Raises:
+            MessageError: If a request fails or any entry is rejected.
+                Rejected entries are counted across every batch, but a
+                request that fails outright stops at that batch, leaving
+                later handles undeleted.
+        """
+        failed = 0
+        handles = iter(receipt_handles)
+        try:
+            while batch := list(islice(handles, _BATCH_SIZE)):
+                resp = self.client.delete_message_batch(
+                    QueueUrl=queue_id,
+                    Entries=[
+                        {"Id": str(i), "ReceiptHandle": handle}
+                        for i, handle in enumerate(batch)
+                    ],
+                )
+                failed += len(resp.get("Failed", []))
+        except ClientError as e:
+            raise MessageError(f"Failed to delete messages from '{queue_id}'") from e
+        if failed:
+            raise MessageError(
+                f"Failed to delete {failed} message(s) from '{queue_id}'"
+            )
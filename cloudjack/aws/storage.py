@@ -1,6 +1,8 @@
 """AWS S3 implementation of the StorageService interface."""
 
 import boto3
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from typing import Any, NoReturn
 from botocore.exceptions import ClientError
 
@@ -21,6 +23,12 @@ _ERROR_MAP = {
     "BucketAlreadyOwnedByYou": BucketAlreadyExistsError,
 }
 
+# S3 DeleteObjects accepts at most 1000 keys per request.
+_DELETE_BATCH_SIZE = 1000
+
+# Failed keys quoted in a delete_objects error; the rest are only counted.
+_MAX_KEYS_IN_ERROR = 5
+
 
 def _handle_client_error(e: ClientError, message: str) -> NoReturn:
     """Raise a mapped exception or a generic StorageError."""
@@ -184,6 +192,50 @@ class Storage(StorageService):
         except ClientError as e:
             _handle_client_error(e, f"Failed to delete '{object_name}' from '{bucket_name}'.")
 
+    def delete_objects(
+        self, bucket_name: str, object_names: Iterable[str]
+    ) -> list[str]:
+        """Delete many objects from an S3 bucket via ``DeleteObjects``.
+
+        Keys are sent in batches of up to 1000, so deleting *N* objects costs
+        ``ceil(N / 1000)`` requests instead of *N*.
+
+        Args:
+            bucket_name: The name of the bucket containing the objects.
+            object_names: The S3 object keys to delete.
+
+        Returns:
+            The list of deleted object keys.
+
+        Raises:
+            BucketNotFoundError: If the bucket does not exist.
+            StorageError: If any key could not be deleted. Keys rejected
+                individually are collected across every batch, but a request
+                that fails outright stops at that batch, leaving later keys
+                untouched.
+        """
+        deleted: list[str] = []
+        failed: list[str] = []
+        keys = iter(object_names)
+        try:
+            while batch := list(islice(keys, _DELETE_BATCH_SIZE)):
+                response = self.client.delete_objects(
+                    Bucket=bucket_name,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": False},
+                )
+                deleted.extend(obj["Key"] for obj in response.get("Deleted", []))
+                failed.extend(err["Key"] for err in response.get("Errors", []))
+        except ClientError as e:
+            _handle_client_error(e, f"Failed to delete objects from '{bucket_name}'.")
+        if failed:
+            shown = ", ".join(failed[:_MAX_KEYS_IN_ERROR])
+            more = len(failed) - _MAX_KEYS_IN_ERROR
+            raise StorageError(
+                f"Failed to delete {len(failed)} object(s) from '{bucket_name}': "
+                f"{shown}{f' and {more} more' if more > 0 else ''}."
+            )
+        return deleted
+
     def list_objects(self, bucket_name: str, prefix: str = "") -> list[str]:
         """List objects in an S3 bucket, optionally filtered by prefix.
 
@@ -196,16 +248,24 @@ class Storage(StorageService):
         Returns:
             A list of object keys.
 
+        Raises:
+            BucketNotFoundError: If the bucket does not exist.
+            StorageError: If listing fails for any other reason.
+        """
+        return list(self.iter_objects(bucket_name, prefix))
+
+    def iter_objects(self, bucket_name: str, prefix: str = "") -> Iterator[str]:
+        """Yield object keys as each ``ListObjectsV2`` page arrives.
+
         Raises:
             BucketNotFoundError: If the bucket does not exist.
             StorageError: If listing fails for any other reason.
         """
         try:
-            keys: list[str] = []
             paginator = self.client.get_paginator("list_objects_v2")
             for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
-                keys.extend(obj["Key"] for obj in page.get("Contents", []))
-            return keys
+                for obj in page.get("Contents", []):
+                    yield obj["Key"]
         except ClientError as e:
             _handle_client_error(e, f"Failed to list objects in '{bucket_name}'.")
 
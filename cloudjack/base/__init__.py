@@ -38,6 +38,7 @@ from .exceptions import (
 )
 from .iam import IAMService
 from .logging_service import LoggingService
+from .prefetch import prefetch
 from .queue import QueueService
 from .retry import retry
 from .secret_manager import SecretManagerService
@@ -74,6 +75,7 @@ __all__ = [
     # Utilities
     "AsyncMixin",
     "async_wrap",
+    "prefetch",
     "retry",
     # Return-shape TypedDicts
     "InstanceDict",
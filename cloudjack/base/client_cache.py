@@ -78,6 +78,14 @@ class ClientCache:
             return cached
 
     def clear(self) -> None:
-        """Flush all cached service instances."""
+        """Flush all cached service instances.
+
+        Instances that hold resources (such as a worker pool) are closed.
+        """
         with self._lock:
+            evicted = list(self._cache.values())
             self._cache.clear()
+        for instance in evicted:
+            close = getattr(instance, "close", None)
+            if callable(close):
+                close()
@@ -2,8 +2,10 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, Callable
 
+from cloudjack.base.exceptions import ComputeError, InstanceNotFoundError
 from cloudjack.base.types import InstanceDict
 
 
@@ -47,6 +49,33 @@ class ComputeService(ABC):
             Instance ID.
         """
 
+    def create_instances(
+        self,
+        names: list[str],
+        instance_type: str,
+        image_id: str,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Launch several identically configured instances.
+
+        The default implementation calls :meth:`create_instance` once per
+        name and stops at the first failure; providers with a native bulk
+        API override it.
+
+        Args:
+            names: Display name for each instance.
+            instance_type: Machine type shared by every instance.
+            image_id: OS image shared by every instance.
+            **kwargs: Same options as :meth:`create_instance`.
+
+        Returns:
+            Instance IDs, in the same order as *names*.
+        """
+        return [
+            self.create_instance(name, instance_type, image_id, **kwargs)
+            for name in names
+        ]
+
     @abstractmethod
     def start_instance(self, instance_id: str) -> None:
         """Start a stopped instance."""
@@ -59,6 +88,60 @@ class ComputeService(ABC):
     def terminate_instance(self, instance_id: str) -> None:
         """Terminate (destroy) an instance."""
 
+    # --- Bulk lifecycle ---
+
+    def start_instances(self, instance_ids: list[str]) -> None:
+        """Start several stopped instances.
+
+        Every instance is attempted even if some fail; failures are reported
+        together afterwards.
+
+        Raises:
+            InstanceNotFoundError: If every failure was a missing instance.
+            ComputeError: If any other instance failed to start.
+        """
+        self._run_bulk(self.start_instance, instance_ids, "start")
+
+    def stop_instances(self, instance_ids: list[str]) -> None:
+        """Stop several running instances (keep disks).
+
+        See :meth:`start_instances` for failure semantics.
+        """
+        self._run_bulk(self.stop_instance, instance_ids, "stop")
+
+    def terminate_instances(self, instance_ids: list[str]) -> None:
+        """Terminate (destroy) several instances.
+
+        See :meth:`start_instances` for failure semantics.
+        """
+        self._run_bulk(self.terminate_instance, instance_ids, "terminate")
+
+    def _run_bulk(
+        self, fn: Callable[[str], None], instance_ids: list[str], action: str
+    ) -> None:
+        """Apply *fn* to each ID in turn; providers override to parallelise."""
+        errors: dict[str, Exception] = {}
+        for instance_id in instance_ids:
+            try:
+                fn(instance_id)
+            except ComputeError as e:
+                errors[instance_id] = e
+        self._raise_bulk_errors(action, errors)
+
+    @staticmethod
+    def _raise_bulk_errors(action: str, errors: dict[str, Exception]) -> None:
+        """Raise one exception summarising the per-instance *errors*, if any."""
+        if not errors:
+            return
+        exc_class: type[ComputeError] = (
+            InstanceNotFoundError
+            if all(isinstance(e, InstanceNotFoundError) for e in errors.values())
+            else ComputeError
+        )
+        raise exc_class(
+            f"Failed to {action} {len(errors)} instance(s): {', '.join(errors)}"
+        ) from next(iter(errors.values()))
+
     @abstractmethod
     def list_instances(self, **kwargs: Any) -> list[InstanceDict]:
         """List instances.
@@ -73,9 +156,19 @@ class ComputeService(ABC):
                 ``[{"Name": "instance-state-name", "Values": ["running"]}]``
                 *(AWS)*.
             zone (str): Compute zone to list instances from *(GCP)*.
+            zones (list[str]): Several zones, listed concurrently *(GCP)*.
+            all_zones (bool): List every zone in the project *(GCP)*.
             filter (str): GCP API filter string *(GCP)*.
         """
 
+    def iter_instances(self, **kwargs: Any) -> Iterator[InstanceDict]:
+        """Yield instances one at a time; takes the same options as :meth:`list_instances`.
+
+        Providers that page through results override this to yield rows as
+        each page arrives. The default just iterates :meth:`list_instances`.
+        """
+        yield from self.list_instances(**kwargs)
+
     @abstractmethod
     def get_instance(self, instance_id: str) -> InstanceDict:
         """Return details for a single instance.
@@ -99,6 +192,18 @@ class ComputeService(ABC):
             self.create_instance, name, instance_type, image_id, **kwargs
         )
 
+    async def acreate_instances(
+        self,
+        names: list[str],
+        instance_type: str,
+        image_id: str,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Async variant of :meth:`create_instances` (runs in a worker thread)."""
+        return await asyncio.to_thread(
+            self.create_instances, names, instance_type, image_id, **kwargs
+        )
+
     async def astart_instance(self, instance_id: str) -> None:
         """Async variant of :meth:`start_instance` (runs in a worker thread)."""
         return await asyncio.to_thread(self.start_instance, instance_id)
@@ -111,6 +216,18 @@ class ComputeService(ABC):
         """Async variant of :meth:`terminate_instance` (runs in a worker thread)."""
         return await asyncio.to_thread(self.terminate_instance, instance_id)
 
+    async def astart_instances(self, instance_ids: list[str]) -> None:
+        """Async variant of :meth:`start_instances` (runs in a worker thread)."""
+        return await asyncio.to_thread(self.start_instances, instance_ids)
+
+    async def astop_instances(self, instance_ids: list[str]) -> None:
+        """Async variant of :meth:`stop_instances` (runs in a worker thread)."""
+        return await asyncio.to_thread(self.stop_instances, instance_ids)
+
+    async def aterminate_instances(self, instance_ids: list[str]) -> None:
+        """Async variant of :meth:`terminate_instances` (runs in a worker thread)."""
+        return await asyncio.to_thread(self.terminate_instances, instance_ids)
+
     async def alist_instances(self, **kwargs: Any) -> list[InstanceDict]:
         """Async variant of :meth:`list_instances` (runs in a worker thread)."""
         return await asyncio.to_thread(self.list_instances, **kwargs)
@@ -7,6 +7,7 @@ silently passing bad values to SDK clients.
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, overload
@@ -22,6 +23,11 @@ else:
     # accepts any credentials object the caller passes in.
     GCPCredentialsType = Any
 
+# Broad OAuth scope accepted by every GCP API cloudjack calls.  Credentials
+# that already carry scopes are passed through unchanged by the SDK clients
+# instead of being re-scoped (and thus copied) per client.
+CLOUD_PLATFORM_SCOPE = "https://www.googleapis.com/auth/cloud-platform"
+
 
 class AWSConfig(BaseModel):
     """Configuration for AWS services.
@@ -77,6 +83,16 @@ class GCPConfig(BaseModel):
     credentials_path: str | None = Field(
         default=None, description="Path to service account JSON key file"
     )
+    max_concurrency: int = Field(
+        default=32,
+        ge=1,
+        description="Worker threads used to fan out bulk operations",
+    )
+    secret_ttl: float = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds a fetched secret is served from cache; 0 disables caching",
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -104,14 +120,27 @@ class GCPConfig(BaseModel):
             path = Path(self.credentials_path)
             if not path.exists():
                 raise ValueError(f"Credentials file not found: {self.credentials_path}")
-            from google.oauth2 import service_account  # lazy import
-
-            self.credentials = service_account.Credentials.from_service_account_file(
-                str(path)
+            self.credentials = _load_service_account(
+                str(path.resolve()), path.stat().st_mtime_ns
             )
         return self
 
 
+@functools.lru_cache(maxsize=16)
+def _load_service_account(path: str, mtime_ns: int) -> Any:
+    """Load (once per file version) a cloud-platform-scoped key file.
+
+    Every config built from the same key file gets the same credentials
+    object, so all services share one cached access token.  *mtime_ns* is
+    part of the cache key so a rotated key file is picked up.
+    """
+    from google.oauth2 import service_account  # lazy import
+
+    return service_account.Credentials.from_service_account_file(
+        path, scopes=[CLOUD_PLATFORM_SCOPE]
+    )
+
+
 # Map provider names to their config models for dynamic validation
 CONFIG_REGISTRY: dict[str, type[BaseModel]] = {
     "aws": AWSConfig,
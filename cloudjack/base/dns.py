@@ -2,10 +2,71 @@
 
 import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 from cloudjack.base.types import RecordDict, ZoneDict
 
+# An ``(action, record)`` pair in a provider change batch.
+RecordChange = tuple[str, RecordDict]
+
+
+def split_record_changes(
+    changes: Sequence[RecordChange],
+    weigh: Callable[[RecordChange], tuple[int, ...]],
+    limits: tuple[int, ...],
+) -> list[list[RecordChange]]:
+    """Split *changes* into batches whose summed weights stay within *limits*.
+
+    Changes to the same record name are kept together and in their original
+    order, so a delete and the add that replaces it land in the same batch.
+    Only a name whose changes exceed the limits on their own is split, over
+    consecutive batches.
+
+    Args:
+        changes: ``(action, record)`` pairs in the order they must apply.
+        weigh: Cost of one change against each limit.
+        limits: Maximum summed cost per batch, one entry per ``weigh`` value.
+
+    Returns:
+        Non-empty batches, to be submitted in order.
+    """
+    groups: dict[str, list[RecordChange]] = {}
+    for change in changes:
+        groups.setdefault(change[1]["name"], []).append(change)
+
+    batches: list[list[RecordChange]] = []
+    batch: list[RecordChange] = []
+    used = [0] * len(limits)
+
+    def fits(cost: Sequence[int]) -> bool:
+        return all(u + c <= m for u, c, m in zip(used, cost, limits))
+
+    def add(change: RecordChange, cost: Sequence[int]) -> None:
+        batch.append(change)
+        for i, c in enumerate(cost):
+            used[i] += c
+
+    def close() -> None:
+        nonlocal batch
+        if batch:
+            batches.append(batch)
+            batch = []
+            used[:] = [0] * len(limits)
+
+    for group in groups.values():
+        costs = [weigh(change) for change in group]
+        total = [sum(col) for col in zip(*costs)]
+        if not fits(total):
+            close()
+        for change, cost in zip(group, costs):
+            if not fits(cost):
+                close()
+            add(change, cost)
+    close()
+    return batches
+
 
 class DNSService(ABC):
     """Abstract interface for DNS zone and record management.
@@ -93,6 +154,39 @@ class DNSService(ABC):
             ttl: Time-to-live (required by some providers for exact match).
         """
 
+    def apply_record_changes(
+        self,
+        zone_id: str,
+        adds: Iterable[RecordDict] = (),
+        deletes: Iterable[RecordDict] = (),
+    ) -> None:
+        """Apply several record additions and deletions to one zone.
+
+        Providers with change batches (Route 53, Cloud DNS) submit everything
+        as a single atomic change when it fits within the provider's
+        per-change limits. Larger sets are split into several changes applied
+        in order, keeping each record name's changes together; if one fails,
+        the changes before it stay applied. The default implementation
+        applies the deletions and then the additions one at a time.
+
+        Args:
+            zone_id: Zone identifier.
+            adds: Records to create or upsert. Each has ``name``, ``type``,
+                ``values`` and optionally ``ttl`` (default ``300``).
+            deletes: Records to delete, in the same shape; ``ttl`` and
+                ``values`` must match the existing record.
+        """
+        for record in deletes:
+            self.delete_record(
+                zone_id, record["name"], record["type"], record["values"],
+                record.get("ttl", 300),
+            )
+        for record in adds:
+            self.create_record(
+                zone_id, record["name"], record["type"], record["values"],
+                record.get("ttl", 300),
+            )
+
     @abstractmethod
     def list_records(self, zone_id: str) -> list[RecordDict]:
         """List records in a zone.
@@ -100,6 +194,40 @@ class DNSService(ABC):
         Each dict contains at least ``name``, ``type``, ``ttl``, ``values``.
         """
 
+    def iter_zone_records(
+        self, zone_ids: Iterable[str] | None = None, max_workers: int = 8
+    ) -> Iterator[tuple[str, list[RecordDict]]]:
+        """List the records of many zones concurrently.
+
+        Zones are fetched on up to *max_workers* threads, and each
+        ``(zone_id, records)`` pair is yielded as soon as that zone
+        finishes, so results arrive in completion order rather than input
+        order.  Stopping iteration early cancels zones not yet started.
+
+        Args:
+            zone_ids: Zones to read; defaults to every zone from
+                :meth:`list_zones`.
+            max_workers: Maximum number of zones fetched at once.
+
+        Raises:
+            ZoneNotFoundError: If a zone disappears while being read.
+            DNSError: On API failure for any zone.
+        """
+        if zone_ids is None:
+            zone_ids = [z["zone_id"] for z in self.list_zones()]
+        pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="cloudjack-dns"
+        )
+        try:
+            futures = {
+                pool.submit(self.list_records, zone_id): zone_id
+                for zone_id in zone_ids
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
     # --- Async variants ---
 
     async def acreate_zone(self, zone_name: str, **kwargs: Any) -> str:
@@ -141,6 +269,17 @@ class DNSService(ABC):
             self.delete_record, zone_id, record_name, record_type, values, ttl
         )
 
+    async def aapply_record_changes(
+        self,
+        zone_id: str,
+        adds: Iterable[RecordDict] = (),
+        deletes: Iterable[RecordDict] = (),
+    ) -> None:
+        """Async variant of :meth:`apply_record_changes` (runs in a worker thread)."""
+        return await asyncio.to_thread(
+            self.apply_record_changes, zone_id, adds, deletes
+        )
+
     async def alist_records(self, zone_id: str) -> list[RecordDict]:
         """Async variant of :meth:`list_records` (runs in a worker thread)."""
         return await asyncio.to_thread(self.list_records, zone_id)
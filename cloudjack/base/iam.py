@@ -2,6 +2,7 @@
 
 import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from cloudjack.base.types import PolicyDict, RoleDict
@@ -56,6 +57,14 @@ class IAMService(ABC):
             parent (str): Override the default project scope *(GCP)*.
         """
 
+    def iter_roles(self, **kwargs: Any) -> Iterator[RoleDict]:
+        """Yield roles one at a time; takes the same options as :meth:`list_roles`.
+
+        Providers that page through results override this to yield rows as
+        each page arrives. The default just iterates :meth:`list_roles`.
+        """
+        yield from self.list_roles(**kwargs)
+
     # --- Policy management ---
 
     @abstractmethod
@@ -77,6 +86,21 @@ class IAMService(ABC):
                 policy, default ``False`` *(AWS)*.
         """
 
+    def attach_policies(
+        self, bindings: Iterable[tuple[str, str]], **kwargs: Any
+    ) -> None:
+        """Attach several ``(role_name, policy_identifier)`` pairs.
+
+        The default implementation calls :meth:`attach_policy` for each
+        pair; providers that can batch the change override it.
+
+        Args:
+            bindings: ``(role_name, policy_identifier)`` pairs.
+            **kwargs: Passed through to :meth:`attach_policy`.
+        """
+        for role_name, policy_identifier in bindings:
+            self.attach_policy(role_name, policy_identifier, **kwargs)
+
     @abstractmethod
     def detach_policy(self, role_name: str, policy_identifier: str, **kwargs: Any) -> None:
         """Detach a managed policy from a role.
@@ -94,6 +118,21 @@ class IAMService(ABC):
                 policy, default ``False`` *(AWS)*.
         """
 
+    def detach_policies(
+        self, bindings: Iterable[tuple[str, str]], **kwargs: Any
+    ) -> None:
+        """Detach several ``(role_name, policy_identifier)`` pairs.
+
+        The default implementation calls :meth:`detach_policy` for each
+        pair; providers that can batch the change override it.
+
+        Args:
+            bindings: ``(role_name, policy_identifier)`` pairs.
+            **kwargs: Passed through to :meth:`detach_policy`.
+        """
+        for role_name, policy_identifier in bindings:
+            self.detach_policy(role_name, policy_identifier, **kwargs)
+
     @abstractmethod
     def list_policies(self, **kwargs: Any) -> list[PolicyDict]:
         """List available managed policies.
@@ -134,6 +173,12 @@ class IAMService(ABC):
             self.attach_policy, role_name, policy_identifier, **kwargs
         )
 
+    async def aattach_policies(
+        self, bindings: Iterable[tuple[str, str]], **kwargs: Any
+    ) -> None:
+        """Async variant of :meth:`attach_policies` (runs in a worker thread)."""
+        return await asyncio.to_thread(self.attach_policies, bindings, **kwargs)
+
     async def adetach_policy(
         self, role_name: str, policy_identifier: str, **kwargs: Any
     ) -> None:
@@ -142,6 +187,12 @@ class IAMService(ABC):
             self.detach_policy, role_name, policy_identifier, **kwargs
         )
 
+    async def adetach_policies(
+        self, bindings: Iterable[tuple[str, str]], **kwargs: Any
+    ) -> None:
+        """Async variant of :meth:`detach_policies` (runs in a worker thread)."""
+        return await asyncio.to_thread(self.detach_policies, bindings, **kwargs)
+
     async def alist_policies(self, **kwargs: Any) -> list[PolicyDict]:
         """Async variant of :meth:`list_policies` (runs in a worker thread)."""
         return await asyncio.to_thread(self.list_policies, **kwargs)
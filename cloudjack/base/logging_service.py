@@ -2,6 +2,7 @@
 
 import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from cloudjack.base.types import LogEntryDict
@@ -34,6 +35,13 @@ class LoggingService(ABC):
     def list_log_groups(self, prefix: str = "") -> list[str]:
         """List log group names, optionally filtered by *prefix*."""
 
+    def iter_log_groups(self, prefix: str = "") -> Iterator[str]:
+        """Yield log group names one at a time, optionally filtered by *prefix*.
+
+        The default just iterates :meth:`list_log_groups`.
+        """
+        yield from self.list_log_groups(prefix)
+
     # --- Log operations ---
 
     @abstractmethod
@@ -58,6 +66,28 @@ class LoggingService(ABC):
             labels (dict): Dict of key-value labels to attach *(GCP)*.
         """
 
+    def write_logs(
+        self,
+        log_group: str,
+        messages: Iterable[str],
+        *,
+        severity: str = "INFO",
+        **kwargs: Any,
+    ) -> None:
+        """Write several entries with the same severity and options.
+
+        Providers with a batch write API override this to send one request;
+        the default calls :meth:`write_log` once per message.
+
+        Args:
+            log_group: Target log group name.
+            messages: Log message strings.
+            severity: Log severity applied to every entry.
+            **kwargs: Same as :meth:`write_log`.
+        """
+        for message in messages:
+            self.write_log(log_group, message, severity=severity, **kwargs)
+
     @abstractmethod
     def read_logs(
         self,
@@ -108,6 +138,19 @@ class LoggingService(ABC):
             self.write_log, log_group, message, severity=severity, **kwargs
         )
 
+    async def awrite_logs(
+        self,
+        log_group: str,
+        messages: Iterable[str],
+        *,
+        severity: str = "INFO",
+        **kwargs: Any,
+    ) -> None:
+        """Async variant of :meth:`write_logs` (runs in a worker thread)."""
+        return await asyncio.to_thread(
+            self.write_logs, log_group, messages, severity=severity, **kwargs
+        )
+
     async def aread_logs(
         self,
         log_group: str,
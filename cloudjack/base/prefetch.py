@@ -0,0 +1,78 @@
+"""
+Bounded read-ahead for slow iterators.
+
+Wraps an iterator whose ``next()`` blocks on the network (a page of a
+paginated listing, a pull RPC) so the next items are fetched on a
+background thread while the caller is still working on the current one.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# How long the producer waits on a full buffer before re-checking whether
+# the consumer has gone away.
+_PUT_POLL_INTERVAL = 0.1
+
+
+def prefetch(iterable: Iterable[T], depth: int = 2) -> Iterator[T]:
+    """Yield from *iterable* while a worker thread reads up to *depth* items ahead.
+
+    The worker starts on the first ``next()``, so wrapping stays lazy. An
+    exception raised by *iterable* is re-raised to the caller at the point
+    where the item would have appeared. Closing the generator early stops
+    the worker after the item it is currently fetching.
+
+    Args:
+        iterable: Source to read from; consumed on the worker thread.
+        depth: Maximum number of items fetched but not yet yielded.
+
+    Raises:
+        ValueError: If *depth* is less than 1.
+    """
+    if depth < 1:
+        raise ValueError("depth must be at least 1")
+    return _prefetch(iterable, depth)
+
+
+def _prefetch(iterable: Iterable[T], depth: int) -> Iterator[T]:
+    # Entries are (True, item), (False, exception) or (False, None) at the end.
+    buffer: queue.Queue[tuple[bool, Any]] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry: tuple[bool, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=_PUT_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def fill() -> None:
+        try:
+            for item in iterable:
+                if not put((True, item)):
+                    return
+        except BaseException as e:  # handed to the consumer thread
+            put((False, e))
+            return
+        put((False, None))
+
+    threading.Thread(target=fill, name="cloudjack-prefetch", daemon=True).start()
+    try:
+        while True:
+            ok, value = buffer.get()
+            if ok:
+                yield value
+            elif value is None:
+                return
+            else:
+                raise value
+    finally:
+        stop.set()
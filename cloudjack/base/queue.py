@@ -2,6 +2,7 @@
 
 import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from cloudjack.base.types import MessageDict
@@ -46,6 +47,13 @@ class QueueService(ABC):
     def list_queues(self, prefix: str = "") -> list[str]:
         """List queue identifiers, optionally filtered by *prefix*."""
 
+    def iter_queues(self, prefix: str = "") -> Iterator[str]:
+        """Yield queue identifiers one at a time, optionally filtered by *prefix*.
+
+        The default just iterates :meth:`list_queues`.
+        """
+        yield from self.list_queues(prefix)
+
     # --- Messaging ---
 
     @abstractmethod
@@ -65,6 +73,28 @@ class QueueService(ABC):
             Provider-assigned message ID.
         """
 
+    def send_message_batch(
+        self, queue_id: str, bodies: list[str], **kwargs: Any
+    ) -> list[str]:
+        """Publish several messages, batching requests up to provider limits.
+
+        Providers with a native batch API override this; the default calls
+        :meth:`send_message` once per body.
+
+        Args:
+            queue_id: Queue identifier.
+            bodies: Message bodies (strings).
+
+        Keyword Args:
+            message_attributes (dict): Metadata attributes applied to every
+                message *(AWS, GCP)*.
+            delay_seconds (int): Per-message delivery delay *(AWS)*.
+
+        Returns:
+            Provider-assigned message IDs, in the same order as *bodies*.
+        """
+        return [self.send_message(queue_id, body, **kwargs) for body in bodies]
+
     @abstractmethod
     def receive_messages(
         self, queue_id: str, max_messages: int = 1, **kwargs: Any
@@ -95,6 +125,20 @@ class QueueService(ABC):
             receipt_handle: Handle returned by :meth:`receive_messages`.
         """
 
+    def delete_messages(self, queue_id: str, receipt_handles: Iterable[str]) -> None:
+        """Acknowledge / delete many messages after processing.
+
+        Providers with a native batch API override this to acknowledge
+        several handles per request; the default implementation falls back
+        to calling :meth:`delete_message` once per handle.
+
+        Args:
+            queue_id: Queue identifier.
+            receipt_handles: Handles returned by :meth:`receive_messages`.
+        """
+        for receipt_handle in receipt_handles:
+            self.delete_message(queue_id, receipt_handle)
+
     # --- Async variants ---
 
     async def acreate_queue(self, queue_name: str, **kwargs: Any) -> str:
@@ -113,6 +157,14 @@ class QueueService(ABC):
         """Async variant of :meth:`send_message` (runs in a worker thread)."""
         return await asyncio.to_thread(self.send_message, queue_id, body, **kwargs)
 
+    async def asend_message_batch(
+        self, queue_id: str, bodies: list[str], **kwargs: Any
+    ) -> list[str]:
+        """Async variant of :meth:`send_message_batch` (runs in a worker thread)."""
+        return await asyncio.to_thread(
+            self.send_message_batch, queue_id, bodies, **kwargs
+        )
+
     async def areceive_messages(
         self, queue_id: str, max_messages: int = 1, **kwargs: Any
     ) -> list[MessageDict]:
@@ -124,3 +176,9 @@ class QueueService(ABC):
     async def adelete_message(self, queue_id: str, receipt_handle: str) -> None:
         """Async variant of :meth:`delete_message` (runs in a worker thread)."""
         return await asyncio.to_thread(self.delete_message, queue_id, receipt_handle)
+
+    async def adelete_messages(
+        self, queue_id: str, receipt_handles: Iterable[str]
+    ) -> None:
+        """Async variant of :meth:`delete_messages` (runs in a worker thread)."""
+        return await asyncio.to_thread(self.delete_messages, queue_id, receipt_handles)
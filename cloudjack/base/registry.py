@@ -0,0 +1,44 @@
+"""
+Lazily-importing service registry.
+
+Lets a provider list its services by dotted path so that asking for one
+service imports only that service's module (and the SDK it depends on),
+rather than every SDK the provider supports.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterator, Mapping
+
+
+class LazyServiceRegistry(Mapping[str, type]):
+    """Read-only ``service name -> class`` mapping that imports on lookup.
+
+    Membership tests and iteration never import anything; only indexing
+    does, and each resolved class is memoised.
+
+    Args:
+        paths: Map of service name to ``"package.module:ClassName"``.
+    """
+
+    def __init__(self, paths: Mapping[str, str]) -> None:
+        self._paths = dict(paths)
+        self._resolved: dict[str, type] = {}
+
+    def __getitem__(self, service_name: str) -> type:
+        cls = self._resolved.get(service_name)
+        if cls is None:
+            module_path, _, attr = self._paths[service_name].partition(":")
+            cls = getattr(importlib.import_module(module_path), attr)
+            self._resolved[service_name] = cls
+        return cls
+
+    def __contains__(self, service_name: object) -> bool:
+        return service_name in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
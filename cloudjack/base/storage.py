@@ -2,6 +2,7 @@
 
 import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 
@@ -43,6 +44,14 @@ class StorageService(ABC):
 
     # --- Object operations ---
 
+    def iter_buckets(self) -> Iterator[str]:
+        """Yield bucket names one at a time.
+
+        Providers that page through results override this to yield names as
+        each page arrives. The default just iterates :meth:`list_buckets`.
+        """
+        yield from self.list_buckets()
+
     @abstractmethod
     def upload_object_from_file(
         self, bucket_name: str, object_name: str, file_path: str
@@ -69,6 +78,21 @@ class StorageService(ABC):
         """
         pass
 
+    def upload_files(
+        self, bucket_name: str, items: Iterable[tuple[str, str]]
+    ) -> None:
+        """Upload several local files.
+
+        Providers override this to run the uploads concurrently; the default
+        calls :meth:`upload_object_from_file` once per item.
+
+        Args:
+            bucket_name: Target bucket.
+            items: ``(object_name, file_path)`` pairs.
+        """
+        for object_name, file_path in items:
+            self.upload_object_from_file(bucket_name, object_name, file_path)
+
     @abstractmethod
     def download_file(self, bucket_name: str, object_name: str, destination: str) -> None:
         """Download an object to a local file.
@@ -80,6 +104,21 @@ class StorageService(ABC):
         """
         pass
 
+    def download_files(
+        self, bucket_name: str, items: Iterable[tuple[str, str]]
+    ) -> None:
+        """Download several objects to local files.
+
+        Providers override this to run the downloads concurrently; the
+        default calls :meth:`download_file` once per item.
+
+        Args:
+            bucket_name: Source bucket.
+            items: ``(object_name, destination)`` pairs.
+        """
+        for object_name, destination in items:
+            self.download_file(bucket_name, object_name, destination)
+
     @abstractmethod
     def delete_object(self, bucket_name: str, object_name: str) -> None:
         """Delete an object from a storage bucket.
@@ -90,6 +129,28 @@ class StorageService(ABC):
         """
         pass
 
+    def delete_objects(
+        self, bucket_name: str, object_names: Iterable[str]
+    ) -> list[str]:
+        """Delete many objects from a storage bucket.
+
+        Providers with a native bulk-delete API override this to issue one
+        request per batch; the default implementation falls back to calling
+        :meth:`delete_object` once per key.
+
+        Args:
+            bucket_name: Bucket containing the objects.
+            object_names: Object keys to delete.
+
+        Returns:
+            The list of deleted object keys.
+        """
+        deleted: list[str] = []
+        for object_name in object_names:
+            self.delete_object(bucket_name, object_name)
+            deleted.append(object_name)
+        return deleted
+
     @abstractmethod
     def list_objects(self, bucket_name: str, prefix: str = "") -> list[str]:
         """List object keys in a bucket.
@@ -103,6 +164,14 @@ class StorageService(ABC):
         """
         pass
 
+    def iter_objects(self, bucket_name: str, prefix: str = "") -> Iterator[str]:
+        """Yield object keys one at a time; takes the same arguments as :meth:`list_objects`.
+
+        Providers that page through results override this to yield keys as
+        each page arrives. The default just iterates :meth:`list_objects`.
+        """
+        yield from self.list_objects(bucket_name, prefix)
+
     @abstractmethod
     def get_object(self, bucket_name: str, object_name: str) -> bytes:
         """Read the contents of an object.
@@ -178,6 +247,12 @@ class StorageService(ABC):
             self.upload_object_from_bytes, bucket_name, object_name, data
         )
 
+    async def aupload_files(
+        self, bucket_name: str, items: Iterable[tuple[str, str]]
+    ) -> None:
+        """Async variant of :meth:`upload_files` (runs in a worker thread)."""
+        return await asyncio.to_thread(self.upload_files, bucket_name, items)
+
     async def adownload_file(
         self, bucket_name: str, object_name: str, destination: str
     ) -> None:
@@ -186,10 +261,22 @@ class StorageService(ABC):
             self.download_file, bucket_name, object_name, destination
         )
 
+    async def adownload_files(
+        self, bucket_name: str, items: Iterable[tuple[str, str]]
+    ) -> None:
+        """Async variant of :meth:`download_files` (runs in a worker thread)."""
+        return await asyncio.to_thread(self.download_files, bucket_name, items)
+
     async def adelete_object(self, bucket_name: str, object_name: str) -> None:
         """Async variant of :meth:`delete_object` (runs in a worker thread)."""
         return await asyncio.to_thread(self.delete_object, bucket_name, object_name)
 
+    async def adelete_objects(
+        self, bucket_name: str, object_names: Iterable[str]
+    ) -> list[str]:
+        """Async variant of :meth:`delete_objects` (runs in a worker thread)."""
+        return await asyncio.to_thread(self.delete_objects, bucket_name, object_names)
+
     async def alist_objects(self, bucket_name: str, prefix: str = "") -> list[str]:
         """Async variant of :meth:`list_objects` (runs in a worker thread)."""
         return await asyncio.to_thread(self.list_objects, bucket_name, prefix)
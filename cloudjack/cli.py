@@ -4,16 +4,30 @@ Usage examples::
 
     cloudjack --provider aws --service storage list-buckets
     cloudjack --provider gcp --service secret_manager get-secret --name my-secret
+
+Shell loops that call ``cloudjack`` many times can start a long-lived
+daemon with ``cloudjack --daemon``.  Invocations that pass ``--use-daemon``
+(or an explicit ``--socket``) forward their operation over a Unix socket
+and reuse the daemon's already-initialised SDK clients; when no daemon is
+listening the CLI runs in-process.  Without either flag every invocation
+runs in-process.
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
 import inspect
 import json
+import os
+import socket
+import socketserver
+import stat
 import sys
-from typing import Any
+from collections.abc import Iterator
+from typing import Any, get_args
 
+from cloudjack.base.config import CONFIG_REGISTRY
 from cloudjack.base import (
     StorageService,
     ComputeService,
@@ -22,8 +36,35 @@ from cloudjack.base import (
     LoggingService,
     QueueService,
     SecretManagerService,
+    existing_cloud_providers,
+    existing_services,
+)
+
+# Derived from the Literal types so the CLI can never drift from the set of
+# providers/services the factory actually supports.
+_PROVIDERS: tuple[str, ...] = get_args(existing_cloud_providers)
+_SERVICES: tuple[str, ...] = get_args(existing_services)
+
+# Default daemon socket; override with ``--socket`` or ``CLOUDJACK_SOCKET``.
+_DEFAULT_SOCKET = os.environ.get(
+    "CLOUDJACK_SOCKET", os.path.join(os.path.expanduser("~"), ".cloudjack.sock")
 )
 
+# Environment variables the SDKs read for credentials, profile, region and
+# project.  A forwarded request is refused unless the daemon sees the same
+# values as the caller, so it never runs under another account.
+_CREDENTIAL_ENV_PREFIXES = ("AWS_", "GOOGLE_", "GCLOUD_", "CLOUDSDK_")
+
+# Operation parameters that name local files, as (parameter, holds pairs).
+# Pair parameters are ``(object_name, path)`` lists.  The caller makes these
+# absolute before forwarding so they don't resolve against the daemon's cwd.
+_LOCAL_PATH_PARAMS: dict[tuple[str, str], tuple[str, bool]] = {
+    ("storage", "upload_object_from_file"): ("file_path", False),
+    ("storage", "upload_files"): ("items", True),
+    ("storage", "download_file"): ("destination", False),
+    ("storage", "download_files"): ("items", True),
+}
+
 # Map service name → service-interface class. The allowlist of invocable
 # operations per service is derived from the interface's public sync methods,
 # so the CLI cannot be tricked into calling internal helpers via getattr.
@@ -54,9 +95,16 @@ def _allowed_operations(service: str) -> set[str]:
     return names
 
 
+class OperationError(Exception):
+    """An operation could not be dispatched or raised while running."""
+
+
+@functools.lru_cache(maxsize=1)
 def _build_parser() -> argparse.ArgumentParser:
     """Build the argparse parser for the ``cloudjack`` CLI.
 
+    The parser is built once and reused by subsequent :func:`main` calls.
+
     Returns:
         Configured :class:`~argparse.ArgumentParser`.
     """
@@ -66,17 +114,12 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--provider", "-p",
-        required=True,
-        choices=["aws", "gcp"],
+        choices=_PROVIDERS,
         help="Cloud provider",
     )
     parser.add_argument(
         "--service", "-s",
-        required=True,
-        choices=[
-            "secret_manager", "storage", "queue",
-            "compute", "dns", "iam", "logging",
-        ],
+        choices=_SERVICES,
         help="Cloud service",
     )
     parser.add_argument(
@@ -87,6 +130,7 @@ def _build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "operation",
+        nargs="?",
         help="Operation to perform (method name, e.g. list-buckets)",
     )
     parser.add_argument(
@@ -100,15 +144,267 @@ def _build_parser() -> argparse.ArgumentParser:
         default="{}",
         help="JSON keyword arguments for the operation",
     )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run a long-lived server that keeps SDK clients warm",
+    )
+    parser.add_argument(
+        "--use-daemon",
+        action="store_true",
+        help="Forward the operation to a running daemon",
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help=(
+            "Unix socket path of the daemon (default: ~/.cloudjack.sock); "
+            "implies --use-daemon"
+        ),
+    )
     return parser
 
 
+def execute_operation(
+    provider: str,
+    service: str,
+    config: dict[str, Any],
+    operation: str,
+    args: list[Any],
+    kwargs: dict[str, Any],
+) -> Any:
+    """Create (or reuse) a service client and invoke *operation* on it.
+
+    Clients come from :func:`~cloudjack.factory.universal_factory`, so a
+    long-lived process (the daemon) reuses one instance per config.
+
+    Raises:
+        OperationError: If the client cannot be created, the operation is not
+            part of the service interface, or the operation itself fails.
+    """
+    # Lazy-import to avoid loading all SDKs unconditionally
+    from cloudjack.factory import universal_factory
+
+    try:
+        svc = universal_factory(service, provider, config)  # type: ignore[call-overload]
+    except ValueError as e:
+        raise OperationError(f"Error: {e}") from e
+
+    # Convert operation-name to method_name and validate against the
+    # service-interface allowlist so callers can't invoke arbitrary attributes.
+    method_name = operation.replace("-", "_")
+    allowed = _allowed_operations(service)
+    if method_name not in allowed:
+        raise OperationError(
+            f"Unknown operation '{operation}' for {provider}/{service}. "
+            f"Allowed: {', '.join(sorted(allowed))}"
+        )
+    method = getattr(svc, method_name)
+
+    try:
+        result = method(*args, **kwargs)
+        # Drain streaming (``iter_*``) operations so the output is JSON.
+        if isinstance(result, Iterator):
+            result = list(result)
+        return result
+    except Exception as e:
+        raise OperationError(f"Operation failed: {e}") from e
+
+
+# --- Daemon mode ---
+
+
+def _credential_env() -> dict[str, str]:
+    """Return the credential-related environment variables of this process."""
+    return {
+        name: value
+        for name, value in sorted(os.environ.items())
+        if name.startswith(_CREDENTIAL_ENV_PREFIXES)
+    }
+
+
+def _absolute_paths(
+    service: str, operation: str, args: list[Any], kwargs: dict[str, Any]
+) -> tuple[list[Any], dict[str, Any]]:
+    """Return *args* / *kwargs* with local file parameters made absolute.
+
+    Arguments that don't bind to the interface signature are returned
+    unchanged; the daemon reports the error when it runs the operation.
+    """
+    method_name = operation.replace("-", "_")
+    spec = _LOCAL_PATH_PARAMS.get((service, method_name))
+    if spec is None:
+        return args, kwargs
+    param, pairs = spec
+    method = getattr(_SERVICE_INTERFACES[service], method_name)
+    try:
+        bound = inspect.signature(method).bind(None, *args, **kwargs)
+    except TypeError:
+        return args, kwargs
+    if param in bound.arguments:
+        value = bound.arguments[param]
+        if pairs:
+            bound.arguments[param] = [
+                [name, os.path.abspath(path)] for name, path in value
+            ]
+        else:
+            bound.arguments[param] = os.path.abspath(value)
+    return list(bound.args[1:]), dict(bound.kwargs)
+
+
+def _prepare_forward(request: dict[str, Any]) -> dict[str, Any]:
+    """Resolve *request* in the caller's context before it is forwarded.
+
+    Missing config fields are filled from the caller's environment, local
+    paths are made absolute, and the caller's credential environment is
+    attached so the daemon can refuse the request if its own differs.
+    """
+    config = dict(request["config"])
+    model = CONFIG_REGISTRY.get(request["provider"])
+    if model is not None:
+        config = model.resolve_from_env(config)  # type: ignore[attr-defined]
+    if config.get("credentials_path"):
+        config["credentials_path"] = os.path.abspath(config["credentials_path"])
+    args, kwargs = _absolute_paths(
+        request["service"], request["operation"], request["args"], request["kwargs"]
+    )
+    return request | {
+        "config": config,
+        "args": args,
+        "kwargs": kwargs,
+        "env": _credential_env(),
+    }
+
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    """Serve one newline-delimited JSON request per connection."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            # Closed without a request, e.g. serve() probing for a live daemon.
+            return
+        try:
+            req = json.loads(line)
+            own_env = _credential_env()
+            if req["env"] != own_env:
+                differing = sorted(
+                    name
+                    for name in req["env"].keys() | own_env.keys()
+                    if req["env"].get(name) != own_env.get(name)
+                )
+                raise OperationError(
+                    "Daemon environment differs from the caller "
+                    f"({', '.join(differing)}); restart the daemon or run "
+                    "without --use-daemon"
+                )
+            result = execute_operation(
+                req["provider"],
+                req["service"],
+                req["config"],
+                req["operation"],
+                req["args"],
+                req["kwargs"],
+            )
+            resp: dict[str, Any] = {"ok": True, "result": result}
+        except OperationError as e:
+            resp = {"ok": False, "error": str(e)}
+        except (ValueError, KeyError, TypeError) as e:
+            resp = {"ok": False, "error": f"Invalid daemon request: {e}"}
+        except Exception as e:
+            # Always answer: a dropped connection would leave the client
+            # unable to tell whether the operation ran.
+            resp = {"ok": False, "error": f"Daemon error: {e}"}
+        self.wfile.write(json.dumps(resp, default=str).encode() + b"\n")
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """Unlink *socket_path* if it is a socket left behind by a dead daemon.
+
+    Raises:
+        OperationError: If *socket_path* is not a socket, or a daemon is
+            still accepting connections on it.
+    """
+    if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+        raise OperationError(f"{socket_path} exists and is not a socket")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+            return
+    raise OperationError(f"A daemon is already running on {socket_path}")
+
+
+def serve(socket_path: str = _DEFAULT_SOCKET) -> None:
+    """Run the CLI daemon on *socket_path* until interrupted.
+
+    The socket is created with owner-only permissions. Requests are served
+    on worker threads and share the process-wide
+    :class:`~cloudjack.base.client_cache.ClientCache`.
+
+    Raises:
+        OperationError: If *socket_path* exists and is not a stale socket.
+    """
+    if os.path.lexists(socket_path):
+        _remove_stale_socket(socket_path)
+    old_umask = os.umask(0o177)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(socket_path, _DaemonHandler)
+    finally:
+        os.umask(old_umask)
+    server.daemon_threads = True
+    try:
+        with server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def _forward(socket_path: str, request: dict[str, Any]) -> dict[str, Any] | None:
+    """Send *request* to a running daemon; return ``None`` if none is listening.
+
+    Only a failed ``connect()`` counts as "no daemon". Once the request is
+    on the wire the operation may already have run, so it must not be
+    retried in-process.
+
+    Raises:
+        OperationError: If the daemon accepted the connection but no
+            complete reply came back.
+    """
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return None
+        try:
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+        except OSError as e:
+            raise OperationError(f"Lost connection to daemon on {socket_path}: {e}") from e
+    if not line.endswith(b"\n"):
+        raise OperationError(f"Incomplete reply from daemon on {socket_path}")
+    try:
+        resp: dict[str, Any] = json.loads(line)
+    except ValueError as e:
+        raise OperationError(f"Malformed reply from daemon on {socket_path}: {e}") from e
+    return resp
+
+
 def main(argv: list[str] | None = None) -> None:
     """CLI entry point.
 
     Parses arguments, creates a service client via the universal factory,
     and invokes the requested operation.  Results are printed as JSON
-    (dicts/lists) or plain text.
+    (dicts/lists) or plain text.  With ``--use-daemon`` or ``--socket``,
+    and a daemon listening, the operation is forwarded to it instead of
+    running in-process.
 
     Args:
         argv: Optional argument list (defaults to ``sys.argv``).
@@ -116,6 +412,17 @@ def main(argv: list[str] | None = None) -> None:
     parser = _build_parser()
     ns = parser.parse_args(argv)
 
+    socket_path = ns.socket or _DEFAULT_SOCKET
+    if ns.daemon:
+        try:
+            serve(socket_path)
+        except OperationError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+        return
+    if not (ns.provider and ns.service and ns.operation):
+        parser.error("--provider, --service and an operation are required")
+
     try:
         config: dict[str, Any] = json.loads(ns.config)
     except json.JSONDecodeError as e:
@@ -128,33 +435,32 @@ def main(argv: list[str] | None = None) -> None:
         print(f"Invalid --kwargs JSON: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Lazy-import to avoid loading all SDKs unconditionally
-    from cloudjack.factory import universal_factory
-
-    try:
-        svc = universal_factory(ns.service, ns.provider, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Convert operation-name to method_name and validate against the
-    # service-interface allowlist so callers can't invoke arbitrary attributes.
-    method_name = ns.operation.replace("-", "_")
-    allowed = _allowed_operations(ns.service)
-    if method_name not in allowed:
-        print(
-            f"Unknown operation '{ns.operation}' for {ns.provider}/{ns.service}. "
-            f"Allowed: {', '.join(sorted(allowed))}",
-            file=sys.stderr,
-        )
-        sys.exit(1)
-    method = getattr(svc, method_name)
-
-    try:
-        result = method(*ns.args, **kwargs)
-    except Exception as e:
-        print(f"Operation failed: {e}", file=sys.stderr)
+    request = {
+        "provider": ns.provider,
+        "service": ns.service,
+        "config": config,
+        "operation": ns.operation,
+        "args": ns.args,
+        "kwargs": kwargs,
+    }
+    resp: dict[str, Any] | None = None
+    if ns.use_daemon or ns.socket is not None:
+        try:
+            resp = _forward(socket_path, _prepare_forward(request))
+        except OperationError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+    if resp is None:
+        try:
+            result = execute_operation(**request)
+        except OperationError as e:
+            print(e, file=sys.stderr)
+            sys.exit(1)
+    elif not resp["ok"]:
+        print(resp["error"], file=sys.stderr)
         sys.exit(1)
+    else:
+        result = resp["result"]
 
     # Pretty-print result
     if result is None:
@@ -15,6 +15,7 @@ is used.
 from __future__ import annotations
 
 import importlib
+from collections.abc import Mapping
 from typing import Literal, overload
 
 from cloudjack.base import (
@@ -39,17 +40,28 @@ ConfigInput = dict | AWSConfig | GCPConfig | None
 
 
 # Provider → (module path, install-extra name). The module must export a
-# ``SERVICE_REGISTRY: dict[str, type]`` at top level.
+# ``SERVICE_REGISTRY: Mapping[str, type]`` at top level.
 _PROVIDER_MODULES: dict[str, tuple[str, str]] = {
     "aws": ("cloudjack.aws.factory", "aws"),
     "gcp": ("cloudjack.gcp.factory", "gcp"),
 }
 
 # Cache of resolved service registries so we only import each provider once.
-_registry_cache: dict[str, dict[str, type]] = {}
+_registry_cache: dict[str, Mapping[str, type]] = {}
 
 
-def _load_service_registry(cloud_provider: str) -> dict[str, type]:
+def _missing_extra(cloud_provider: str, exc: ImportError) -> ImportError:
+    """Build the "install the optional extra" error for *cloud_provider*."""
+    extra = _PROVIDER_MODULES[cloud_provider][1]
+    return ImportError(
+        f"Cloud provider '{cloud_provider}' is not installed. "
+        f"Install the optional dependency group with: "
+        f"pip install 'cloudjack[{extra}]'  "
+        f"(underlying import error: {exc})"
+    )
+
+
+def _load_service_registry(cloud_provider: str) -> Mapping[str, type]:
     """Import the provider factory on demand and return its SERVICE_REGISTRY.
 
     Raises:
@@ -65,19 +77,14 @@ def _load_service_registry(cloud_provider: str) -> dict[str, type]:
     entry = _PROVIDER_MODULES.get(cloud_provider)
     if entry is None:
         raise ValueError(f"Unsupported cloud provider: {cloud_provider}")
-    module_path, extra = entry
+    module_path = entry[0]
 
     try:
         module = importlib.import_module(module_path)
     except ImportError as exc:
-        raise ImportError(
-            f"Cloud provider '{cloud_provider}' is not installed. "
-            f"Install the optional dependency group with: "
-            f"pip install 'cloudjack[{extra}]'  "
-            f"(underlying import error: {exc})"
-        ) from exc
-
-    registry: dict[str, type] = module.SERVICE_REGISTRY
+        raise _missing_extra(cloud_provider, exc) from exc
+
+    registry: Mapping[str, type] = module.SERVICE_REGISTRY
     _registry_cache[cloud_provider] = registry
     return registry
 
@@ -103,6 +110,22 @@ def _resolve_config(
     return validate_config(cloud_provider, config)
 
 
+def _share_credentials(config: AWSConfig | GCPConfig) -> AWSConfig | GCPConfig:
+    """Give GCP services without explicit credentials one shared ADC object.
+
+    Without this, every GCP client runs its own ADC discovery and mints its
+    own access token.  The cache key is computed before this step, so it is
+    unaffected.
+    """
+    if isinstance(config, GCPConfig) and config.credentials is None:
+        from cloudjack.gcp.credentials import default_credentials
+
+        credentials = default_credentials()
+        if credentials is not None:
+            return config.model_copy(update={"credentials": credentials})
+    return config
+
+
 @overload
 def universal_factory(
     service_name: Literal["secret_manager"],
@@ -205,7 +228,11 @@ def universal_factory(
             f"Unsupported service '{service_name}' for provider '{cloud_provider}'"
         )
 
-    service_class = provider_services[service_name]
+    try:
+        # Registries may import the service module (and its SDK) on lookup.
+        service_class = provider_services[service_name]
+    except ImportError as exc:
+        raise _missing_extra(cloud_provider, exc) from exc
     config_obj = _resolve_config(cloud_provider, config)
     # exclude_none so callers who pass {"region_name": None} share a cache
     # entry with callers who omit the key entirely.
@@ -215,5 +242,5 @@ def universal_factory(
         cloud_provider,
         service_name,
         config_dict,
-        lambda _: service_class(config_obj),
+        lambda _: service_class(_share_credentials(config_obj)),
     )
@@ -1,12 +1,32 @@
-"""GCP provider implementations."""
+"""GCP provider implementations.
 
-from .compute import Compute
-from .dns import DNS
-from .iam import IAM
-from .logging_service import Logging
-from .queue import Queue
-from .secret_manager import SecretManager
-from .storage import Storage
+Classes are imported on first attribute access (PEP 562) so that importing
+one GCP service does not load every ``google.cloud.*`` SDK.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .compute import Compute
+    from .dns import DNS
+    from .iam import IAM
+    from .logging_service import Logging
+    from .queue import Queue
+    from .secret_manager import SecretManager
+    from .storage import Storage
+
+_MODULES: dict[str, str] = {
+    "Compute": ".compute",
+    "DNS": ".dns",
+    "IAM": ".iam",
+    "Logging": ".logging_service",
+    "Queue": ".queue",
+    "SecretManager": ".secret_manager",
+    "Storage": ".storage",
+}
 
 __all__ = [
     "Compute",
@@ -17,3 +37,12 @@ __all__ = [
     "SecretManager",
     "Storage",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
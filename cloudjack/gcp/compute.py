@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any, Callable, Iterable, Iterator, cast
 
 from google.api_core import exceptions as gcp_exceptions
 from google.cloud import compute_v1
@@ -10,9 +15,84 @@ from google.cloud import compute_v1
 from cloudjack.base.compute import ComputeService
 from cloudjack.base.config import GCPConfig
 from cloudjack.base.exceptions import ComputeError, InstanceNotFoundError, InstanceAlreadyExistsError
+from cloudjack.base.retry import retry
 from cloudjack.base.types import InstanceDict
 
 
+# Largest page size the Compute API accepts for list calls.
+_PAGE_SIZE = 500
+
+# Bulk fan-out can exceed the per-project Compute API rate limit.  Throttled
+# calls (429 / RESOURCE_EXHAUSTED, 503) back off inside their worker, which
+# also lowers the number of requests in flight until the quota recovers.
+_retry_throttled = retry(
+    max_attempts=5,
+    base_delay=1.0,
+    max_delay=16.0,
+    retryable_exceptions=(
+        gcp_exceptions.TooManyRequests,
+        gcp_exceptions.ServiceUnavailable,
+    ),
+)
+
+
+@dataclass(frozen=True)
+class PollingPolicy:
+    """Backoff schedule used while polling a zone operation.
+
+    Attributes:
+        initial: Delay in seconds before the first re-poll.
+        maximum: Cap on the delay between polls.
+        multiplier: Factor applied to the delay after each poll.
+        deadline: Total seconds to wait before giving up.
+    """
+
+    initial: float = 0.25
+    maximum: float = 2.0
+    multiplier: float = 2.0
+    deadline: float = 600.0
+
+    def delays(self) -> Iterator[float]:
+        """Yield successive jittered delays, growing up to :attr:`maximum`."""
+        delay = self.initial
+        while True:
+            yield random.uniform(delay / 2, delay)
+            delay = min(delay * self.multiplier, self.maximum)
+
+
+def _summary(inst: Any) -> InstanceDict:
+    """Convert a ``compute_v1.Instance`` to the portable list shape."""
+    return cast(
+        InstanceDict,
+        {
+            "instance_id": inst.name,
+            "name": inst.name,
+            "state": inst.status,
+            "instance_type": inst.machine_type.rpartition("/")[2]
+            if inst.machine_type
+            else "",
+            "launch_time": str(inst.creation_timestamp or ""),
+        },
+    )
+
+
+def _raise_for_operation(op: Any, name: str) -> None:
+    """Raise :class:`ComputeError` if a finished operation reports errors."""
+    if op.error and op.error.errors:
+        raise ComputeError(
+            f"Operation '{name}' failed: {op.error.errors[0].message}"
+        )
+
+
+def _map_error(
+    e: gcp_exceptions.GoogleAPICallError, instance_id: str, action: str
+) -> ComputeError:
+    """Translate a Compute Engine API error for a single instance."""
+    if isinstance(e, gcp_exceptions.NotFound):
+        return InstanceNotFoundError(f"Instance '{instance_id}' not found")
+    return ComputeError(f"Failed to {action} '{instance_id}'")
+
+
 class Compute(ComputeService):
     """GCP Compute Engine service.
 
@@ -20,8 +100,12 @@ class Compute(ComputeService):
         project_id: GCP project ID.
         zone: Default zone for instance operations.
         client: Compute Engine instances client.
+        polling: Backoff schedule for zone operations; replace it per
+            instance to tune how long and how often operations are polled.
     """
 
+    polling: PollingPolicy = PollingPolicy()
+
     def __init__(self, config: GCPConfig) -> None:
         """Initialize the Compute Engine client.
 
@@ -37,15 +121,104 @@ class Compute(ComputeService):
         self.zone: str = "us-central1-a"
         self.client = compute_v1.InstancesClient(credentials=config.credentials)
         self._zone_ops = compute_v1.ZoneOperationsClient(credentials=config.credentials)
-
-    def _wait(self, operation: Any) -> None:
-        """Block until a zone operation completes."""
-        self._zone_ops.wait(
-            project=self.project_id,
-            zone=self.zone,
-            operation=operation.name,
+        # Shared pool for bulk operations; threads are only spawned on demand.
+        self._pool = ThreadPoolExecutor(
+            max_workers=config.max_concurrency,
+            thread_name_prefix="cloudjack-compute",
         )
 
+    def close(self) -> None:
+        """Shut down the worker pool, waiting for running bulk calls to finish.
+
+        :meth:`~cloudjack.base.client_cache.ClientCache.clear` calls this when
+        the instance is evicted. The instance must not be used afterwards.
+        """
+        self._pool.shutdown()
+
+    def __enter__(self) -> Compute:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _wait(self, operation: Any, zone: str | None = None) -> None:
+        """Poll a zone operation until it is ``DONE``.
+
+        Uses short ``get`` calls with jittered exponential backoff rather
+        than the server-side ``wait`` long-poll, which pins a connection for
+        up to two minutes and can be cut by intermediate proxies.
+
+        Raises:
+            ComputeError: If the operation finishes with errors or does not
+                finish within ``polling.deadline`` seconds.
+        """
+        policy = self.polling
+        deadline = time.monotonic() + policy.deadline
+        for delay in policy.delays():
+            op = self._zone_ops.get(
+                project=self.project_id,
+                zone=zone or self.zone,
+                operation=operation.name,
+            )
+            if op.status == compute_v1.Operation.Status.DONE:
+                _raise_for_operation(op, operation.name)
+                return
+            if time.monotonic() + delay > deadline:
+                break
+            time.sleep(delay)
+        raise ComputeError(f"Timed out waiting for operation '{operation.name}'")
+
+    def _wait_many(self, operations: dict[str, Any]) -> dict[str, Exception]:
+        """Wait on many zone operations from a single polling loop.
+
+        Each round makes one ``list`` call for the zone's unfinished
+        operations, instead of one ``get`` per pending operation.  An
+        operation that drops out of that list is fetched once to check it
+        for errors.
+
+        Args:
+            operations: Map of instance ID to the operation started for it.
+
+        Returns:
+            Map of instance ID to the error for operations that failed or
+            timed out; operations that succeeded are omitted.
+        """
+        pending = {op.name: key for key, op in operations.items()}
+        errors: dict[str, Exception] = {}
+        policy = self.polling
+        deadline = time.monotonic() + policy.deadline
+        for delay in policy.delays():
+            running = {
+                op.name
+                for op in self._zone_ops.list(
+                    request=compute_v1.ListZoneOperationsRequest(
+                        project=self.project_id,
+                        zone=self.zone,
+                        filter='status != "DONE"',
+                        max_results=_PAGE_SIZE,
+                    )
+                )
+            }
+            for name in [n for n in pending if n not in running]:
+                key = pending.pop(name)
+                try:
+                    op = self._zone_ops.get(
+                        project=self.project_id, zone=self.zone, operation=name
+                    )
+                    _raise_for_operation(op, name)
+                except gcp_exceptions.GoogleAPICallError as e:
+                    exc = ComputeError(f"Failed to check operation '{name}'")
+                    exc.__cause__ = e
+                    errors[key] = exc
+                except ComputeError as e:
+                    errors[key] = e
+            if not pending or time.monotonic() + delay > deadline:
+                break
+            time.sleep(delay)
+        for name, key in pending.items():
+            errors[key] = ComputeError(f"Timed out waiting for operation '{name}'")
+        return errors
+
     def create_instance(
         self,
         name: str,
@@ -72,25 +245,13 @@ class Compute(ComputeService):
             instance.machine_type = (
                 f"zones/{zone}/machineTypes/{instance_type}"
             )
-            disk = compute_v1.AttachedDisk()
-            disk.auto_delete = True
-            disk.boot = True
-            init = compute_v1.AttachedDiskInitializeParams()
-            init.source_image = image_id
-            init.disk_size_gb = kwargs.get("disk_size_gb", 10)
-            disk.initialize_params = init
-            instance.disks = [disk]
-
-            network_interface = compute_v1.NetworkInterface()
-            network_interface.network = kwargs.get(
-                "network", "global/networks/default"
-            )
-            instance.network_interfaces = [network_interface]
+            instance.disks = [self._boot_disk(image_id, **kwargs)]
+            instance.network_interfaces = [self._network_interface(**kwargs)]
 
             op = self.client.insert(
                 project=self.project_id, zone=zone, instance_resource=instance
             )
-            self._wait(op)
+            self._wait(op, zone)
             return name
         except gcp_exceptions.AlreadyExists as e:
             raise InstanceAlreadyExistsError(
@@ -99,6 +260,82 @@ class Compute(ComputeService):
         except gcp_exceptions.GoogleAPICallError as e:
             raise ComputeError(f"Failed to create instance '{name}'") from e
 
+    def create_instances(
+        self,
+        names: list[str],
+        instance_type: str,
+        image_id: str,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Launch several identical instances with one ``bulkInsert`` call.
+
+        Args:
+            names: Instance names.
+            instance_type: Machine type (e.g. ``e2-micro``).
+            image_id: Source image URL or family.
+            **kwargs: Same options as :meth:`create_instance`.
+
+        Returns:
+            Instance names, in the order given.
+
+        Raises:
+            InstanceAlreadyExistsError: If any of the names is taken.
+        """
+        if not names:
+            return []
+        zone = kwargs.get("zone", self.zone)
+        try:
+            properties = compute_v1.InstanceProperties()
+            properties.machine_type = instance_type
+            properties.disks = [self._boot_disk(image_id, **kwargs)]
+            properties.network_interfaces = [self._network_interface(**kwargs)]
+
+            resource = compute_v1.BulkInsertInstanceResource()
+            resource.count = len(names)
+            resource.min_count = len(names)
+            resource.instance_properties = properties
+            resource.per_instance_properties = {
+                name: compute_v1.BulkInsertInstanceResourcePerInstanceProperties(
+                    name=name
+                )
+                for name in names
+            }
+
+            op = self.client.bulk_insert(
+                project=self.project_id,
+                zone=zone,
+                bulk_insert_instance_resource_resource=resource,
+            )
+            self._wait(op, zone)
+            return list(names)
+        except gcp_exceptions.AlreadyExists as e:
+            raise InstanceAlreadyExistsError(
+                f"One of the instances {names} already exists"
+            ) from e
+        except gcp_exceptions.GoogleAPICallError as e:
+            raise ComputeError(f"Failed to create {len(names)} instance(s)") from e
+
+    @staticmethod
+    def _boot_disk(image_id: str, **kwargs: Any) -> compute_v1.AttachedDisk:
+        """Build the auto-deleting boot disk shared by the create methods."""
+        disk = compute_v1.AttachedDisk()
+        disk.auto_delete = True
+        disk.boot = True
+        init = compute_v1.AttachedDiskInitializeParams()
+        init.source_image = image_id
+        init.disk_size_gb = kwargs.get("disk_size_gb", 10)
+        disk.initialize_params = init
+        return disk
+
+    @staticmethod
+    def _network_interface(**kwargs: Any) -> compute_v1.NetworkInterface:
+        """Build the primary network interface shared by the create methods."""
+        network_interface = compute_v1.NetworkInterface()
+        network_interface.network = kwargs.get(
+            "network", "global/networks/default"
+        )
+        return network_interface
+
     def start_instance(self, instance_id: str) -> None:
         """Start a stopped Compute Engine instance.
 
@@ -162,11 +399,103 @@ class Compute(ComputeService):
         except gcp_exceptions.GoogleAPICallError as e:
             raise ComputeError(f"Failed to terminate '{instance_id}'") from e
 
+    def _bulk(
+        self,
+        call: Callable[..., Any],
+        instance_ids: list[str],
+        action: str,
+        *,
+        gone_on_retry_ok: bool = False,
+    ) -> None:
+        """Fan *call* out over *instance_ids*, then wait on every operation.
+
+        Phase one issues all API calls concurrently; phase two waits on all
+        returned zone operations from one polling loop.  At most
+        ``GCPConfig.max_concurrency`` requests are in flight, and throttled
+        calls are retried with exponential backoff.  Errors are collected per
+        instance and raised together once every instance has been tried.
+
+        With *gone_on_retry_ok*, ``NotFound`` on a retried attempt counts as
+        success: a throttled delete may still have gone through server-side.
+        ``NotFound`` on the first attempt is reported as usual.
+        """
+        errors: dict[str, Exception] = {}
+
+        def _submit(instance_id: str) -> Future[Any]:
+            attempts = 0
+
+            def attempt(**kwargs: Any) -> Any:
+                nonlocal attempts
+                attempts += 1
+                try:
+                    return call(**kwargs)
+                except gcp_exceptions.NotFound:
+                    if gone_on_retry_ok and attempts > 1:
+                        return None
+                    raise
+
+            return self._pool.submit(
+                _retry_throttled(attempt),
+                project=self.project_id,
+                zone=self.zone,
+                instance=instance_id,
+            )
+
+        def _collect(futures: dict[str, Future[Any]]) -> dict[str, Any]:
+            done: dict[str, Any] = {}
+            for instance_id, fut in futures.items():
+                try:
+                    op = fut.result()
+                except gcp_exceptions.GoogleAPICallError as e:
+                    errors[instance_id] = _map_error(e, instance_id, action)
+                except ComputeError as e:
+                    errors[instance_id] = e
+                else:
+                    if op is not None:
+                        done[instance_id] = op
+            return done
+
+        ops = _collect({
+            instance_id: _submit(instance_id) for instance_id in instance_ids
+        })
+        if ops:
+            errors.update(self._wait_many(ops))
+        self._raise_bulk_errors(action, errors)
+
+    def start_instances(self, instance_ids: list[str]) -> None:
+        """Start several Compute Engine instances concurrently.
+
+        Raises:
+            InstanceNotFoundError: If every failure was a missing instance.
+            ComputeError: If any other instance failed to start.
+        """
+        self._bulk(self.client.start, instance_ids, "start")
+
+    def stop_instances(self, instance_ids: list[str]) -> None:
+        """Stop several Compute Engine instances concurrently.
+
+        Raises:
+            InstanceNotFoundError: If every failure was a missing instance.
+            ComputeError: If any other instance failed to stop.
+        """
+        self._bulk(self.client.stop, instance_ids, "stop")
+
+    def terminate_instances(self, instance_ids: list[str]) -> None:
+        """Delete several Compute Engine instances concurrently.
+
+        Raises:
+            InstanceNotFoundError: If every failure was a missing instance.
+            ComputeError: If any other instance failed to terminate.
+        """
+        self._bulk(
+            self.client.delete, instance_ids, "terminate", gone_on_retry_ok=True
+        )
+
     def list_instances(self, **kwargs: Any) -> list[InstanceDict]:
-        """List Compute Engine instances in a zone.
+        """List Compute Engine instances in one or more zones.
 
         Args:
-            **kwargs: ``zone`` — override the default zone.
+            **kwargs: Same options as :meth:`iter_instances`.
 
         Returns:
             List of dicts with ``instance_id``, ``name``, ``state``,
@@ -175,27 +504,60 @@ class Compute(ComputeService):
         Raises:
             ComputeError: On Compute Engine API failure.
         """
+        return list(self.iter_instances(**kwargs))
+
+    def iter_instances(self, **kwargs: Any) -> Iterator[InstanceDict]:
+        """Yield Compute Engine instances page by page as the API returns them.
+
+        Args:
+            **kwargs: ``zone`` — override the default zone.
+                ``zones`` — list several zones concurrently.
+                ``all_zones`` — if true, list every zone in the project with
+                a single ``aggregatedList`` call.
+                ``filter`` — Compute Engine API filter string.
+
+        Raises:
+            ComputeError: On Compute Engine API failure.
+        """
+        filter_ = kwargs.get("filter")
         try:
-            zone = kwargs.get("zone", self.zone)
-            instances = self.client.list(project=self.project_id, zone=zone)
-            return cast(
-                list[InstanceDict],
-                [
-                    {
-                        "instance_id": inst.name,
-                        "name": inst.name,
-                        "state": inst.status,
-                        "instance_type": inst.machine_type.split("/")[-1]
-                        if inst.machine_type
-                        else "",
-                        "launch_time": str(inst.creation_timestamp or ""),
-                    }
-                    for inst in instances
-                ],
-            )
+            if kwargs.get("all_zones"):
+                instances: Iterable[Any] = chain.from_iterable(
+                    scoped.instances
+                    for _, scoped in self.client.aggregated_list(
+                        request=compute_v1.AggregatedListInstancesRequest(
+                            project=self.project_id,
+                            filter=filter_,
+                            max_results=_PAGE_SIZE,
+                        )
+                    )
+                )
+            elif "zones" in kwargs:
+                futures = [
+                    self._pool.submit(
+                        lambda z: list(self._list_zone(z, filter_)), zone
+                    )
+                    for zone in kwargs["zones"]
+                ]
+                instances = chain.from_iterable(f.result() for f in futures)
+            else:
+                instances = self._list_zone(kwargs.get("zone", self.zone), filter_)
+            for inst in instances:
+                yield _summary(inst)
         except gcp_exceptions.GoogleAPICallError as e:
             raise ComputeError("Failed to list instances") from e
 
+    def _list_zone(self, zone: str, filter_: str | None) -> Iterable[Any]:
+        """Return the lazy ``instances.list`` pager for one zone."""
+        return self.client.list(
+            request=compute_v1.ListInstancesRequest(
+                project=self.project_id,
+                zone=zone,
+                filter=filter_,
+                max_results=_PAGE_SIZE,
+            )
+        )
+
     def get_instance(self, instance_id: str) -> InstanceDict:
         """Get details for a single Compute Engine instance.
 
@@ -214,29 +576,19 @@ class Compute(ComputeService):
             inst = self.client.get(
                 project=self.project_id, zone=self.zone, instance=instance_id
             )
-            ips = []
-            for iface in (inst.network_interfaces or []):
-                for ac in (iface.access_configs or []):
-                    if ac.nat_i_p:
-                        ips.append(ac.nat_i_p)
-            return cast(
-                InstanceDict,
-                {
-                    "instance_id": inst.name,
-                    "name": inst.name,
-                    "state": inst.status,
-                    "instance_type": inst.machine_type.split("/")[-1]
-                    if inst.machine_type
-                    else "",
-                    "launch_time": str(inst.creation_timestamp or ""),
-                    "public_ip": ips[0] if ips else None,
-                    "private_ip": (
-                        inst.network_interfaces[0].network_i_p
-                        if inst.network_interfaces
-                        else None
-                    ),
-                },
+            nics = inst.network_interfaces
+            details = _summary(inst)
+            details["public_ip"] = next(
+                (
+                    ac.nat_i_p
+                    for nic in nics
+                    for ac in nic.access_configs
+                    if ac.nat_i_p
+                ),
+                None,
             )
+            details["private_ip"] = nics[0].network_i_p if nics else None
+            return details
         except gcp_exceptions.NotFound as e:
             raise InstanceNotFoundError(
                 f"Instance '{instance_id}' not found"
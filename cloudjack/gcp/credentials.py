@@ -0,0 +1,45 @@
+"""Process-wide Google credentials shared by every GCP service.
+
+Each GCP SDK client resolves Application Default Credentials on its own
+when it is given ``credentials=None``, so a process that builds several
+services mints one OAuth token per client.  Resolving ADC once and passing
+the same object to every client lets them share a single cached token,
+which google-auth refreshes in place when it expires.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import google.auth
+from google.auth import exceptions as auth_exceptions
+
+from cloudjack.base.config import CLOUD_PLATFORM_SCOPE
+
+_credentials: Any = None
+_lock = threading.Lock()
+
+
+def default_credentials() -> Any:
+    """Return the process-wide ADC credentials, or ``None`` if unavailable.
+
+    Only a successful lookup is cached.  When ADC cannot be resolved the
+    SDK clients are left to run their own discovery, so they raise their
+    usual error on first use, and the next call tries again.
+    """
+    global _credentials
+    with _lock:
+        if _credentials is None:
+            try:
+                _credentials, _ = google.auth.default(scopes=[CLOUD_PLATFORM_SCOPE])
+            except auth_exceptions.DefaultCredentialsError:
+                return None
+        return _credentials
+
+
+def clear_default_credentials() -> None:
+    """Forget the cached credentials so the next call resolves ADC again."""
+    global _credentials
+    with _lock:
+        _credentials = None
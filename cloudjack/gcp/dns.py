@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any, cast
 
 from google.api_core import exceptions as gcp_exceptions
 from google.cloud import dns as cloud_dns  # type: ignore[attr-defined]
 
-from cloudjack.base.dns import DNSService
+from cloudjack.base.dns import DNSService, RecordChange, split_record_changes
 from cloudjack.base.config import GCPConfig
 from cloudjack.base.exceptions import (
     DNSError,
@@ -17,6 +18,30 @@ from cloudjack.base.exceptions import (
 from cloudjack.base.types import RecordDict, ZoneDict
 
 
+# (name, type, ttl, rrdatas) — positional args of ``zone.resource_record_set``.
+_RecordArgs = tuple[str, str, int, list[str]]
+
+
+# Default Cloud DNS per-change quotas: record sets added, record sets
+# deleted, and total size of their rrdatas.
+_MAX_CHANGE_ADDITIONS = 100
+_MAX_CHANGE_DELETIONS = 100
+_MAX_CHANGE_RRDATA_SIZE = 10_000
+
+
+def _record_args(record: RecordDict) -> _RecordArgs:
+    return (
+        record["name"], record["type"], record.get("ttl", 300), record["values"]
+    )
+
+
+def _change_weight(change: RecordChange) -> tuple[int, int, int]:
+    """Cost of one change against the per-change quotas above."""
+    action, record = change
+    size = sum(len(v) for v in record["values"])
+    return (action == "add", action == "delete", size)
+
+
 class DNS(DNSService):
     """GCP Cloud DNS service.
 
@@ -135,20 +160,14 @@ class DNS(DNSService):
             ZoneNotFoundError: If the zone does not exist.
             DNSError: On API failure.
         """
-        try:
-            zone = self.client.zone(zone_id)
-            changes = zone.changes()
-            record = zone.resource_record_set(
-                record_name, record_type, ttl, values
-            )
-            changes.add_record_set(record)
-            changes.create()
-        except gcp_exceptions.NotFound as e:
-            raise ZoneNotFoundError(f"Zone '{zone_id}' not found") from e
-        except gcp_exceptions.GoogleAPICallError as e:
-            raise DNSError(
-                f"Failed to create record '{record_name}' in '{zone_id}'"
-            ) from e
+        record: RecordDict = {
+            "name": record_name, "type": record_type, "ttl": ttl, "values": values,
+        }
+        self._commit_changes(
+            zone_id,
+            [("add", record)],
+            action=f"create record '{record_name}' in '{zone_id}'",
+        )
 
     def delete_record(
         self,
@@ -171,20 +190,79 @@ class DNS(DNSService):
             ZoneNotFoundError: If the zone does not exist.
             DNSError: On API failure.
         """
-        try:
-            zone = self.client.zone(zone_id)
-            changes = zone.changes()
-            record = zone.resource_record_set(
-                record_name, record_type, ttl, values
-            )
-            changes.delete_record_set(record)
-            changes.create()
-        except gcp_exceptions.NotFound as e:
-            raise ZoneNotFoundError(f"Zone '{zone_id}' not found") from e
-        except gcp_exceptions.GoogleAPICallError as e:
-            raise DNSError(
-                f"Failed to delete record '{record_name}' from '{zone_id}'"
-            ) from e
+        record: RecordDict = {
+            "name": record_name, "type": record_type, "ttl": ttl, "values": values,
+        }
+        self._commit_changes(
+            zone_id,
+            [("delete", record)],
+            action=f"delete record '{record_name}' from '{zone_id}'",
+        )
+
+    def apply_record_changes(
+        self,
+        zone_id: str,
+        adds: Iterable[RecordDict] = (),
+        deletes: Iterable[RecordDict] = (),
+    ) -> None:
+        """Apply record additions and deletions as Cloud DNS changes.
+
+        Everything goes in one atomic change when it fits the default
+        per-change quotas (100 additions, 100 deletions, 10,000 bytes of
+        rrdata). Larger sets are split into changes applied in order; a
+        record name's deletion and addition always share a change.
+
+        Args:
+            zone_id: Zone name identifier.
+            adds: Records to add (``name``, ``type``, ``values``, ``ttl``).
+            deletes: Records to delete; must match the existing record.
+
+        Raises:
+            ZoneNotFoundError: If the zone does not exist.
+            DNSError: On API failure. Nothing from the failing change is
+                applied; earlier changes stay applied.
+        """
+        changes: list[RecordChange] = (
+            [("delete", r) for r in deletes] + [("add", r) for r in adds]
+        )
+        self._commit_changes(
+            zone_id, changes, action=f"apply record changes to '{zone_id}'"
+        )
+
+    def _commit_changes(
+        self,
+        zone_id: str,
+        changes: list[RecordChange],
+        action: str,
+    ) -> None:
+        """Submit ``("add" | "delete", record)`` pairs via ``changes.create()``.
+
+        One call per batch from :func:`split_record_changes`; each batch
+        lists its deletions before its additions.
+        """
+        batches = split_record_changes(
+            changes,
+            _change_weight,
+            (_MAX_CHANGE_ADDITIONS, _MAX_CHANGE_DELETIONS, _MAX_CHANGE_RRDATA_SIZE),
+        )
+        if not batches:
+            return
+        zone = self.client.zone(zone_id)
+        for done, batch in enumerate(batches):
+            try:
+                change_set = zone.changes()
+                for kind, record in batch:
+                    record_set = zone.resource_record_set(*_record_args(record))
+                    if kind == "delete":
+                        change_set.delete_record_set(record_set)
+                    else:
+                        change_set.add_record_set(record_set)
+                change_set.create()
+            except gcp_exceptions.NotFound as e:
+                raise ZoneNotFoundError(f"Zone '{zone_id}' not found") from e
+            except gcp_exceptions.GoogleAPICallError as e:
+                suffix = f" ({done} of {len(batches)} changes applied)" if done else ""
+                raise DNSError(f"Failed to {action}{suffix}") from e
 
     def list_records(self, zone_id: str) -> list[RecordDict]:
         """List all DNS records in a Cloud DNS zone.
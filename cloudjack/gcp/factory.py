@@ -2,24 +2,22 @@
 
 Maps service names to their GCP SDK implementations.
 ``SERVICE_REGISTRY`` is consumed by :func:`cloudjack.factory.universal_factory`.
+
+Each service module is imported the first time that service is requested,
+so building one GCP service does not pay for importing every
+``google.cloud.*`` SDK.
 """
 
-from cloudjack.gcp.secret_manager import SecretManager
-from cloudjack.gcp.storage import Storage
-from cloudjack.gcp.queue import Queue
-from cloudjack.gcp.compute import Compute
-from cloudjack.gcp.dns import DNS
-from cloudjack.gcp.iam import IAM
-from cloudjack.gcp.logging_service import Logging
+from cloudjack.base.registry import LazyServiceRegistry
 
 
 # Service registry for GCP
-SERVICE_REGISTRY: dict[str, type] = {
-    "secret_manager": SecretManager,
-    "storage": Storage,
-    "queue": Queue,
-    "compute": Compute,
-    "dns": DNS,
-    "iam": IAM,
-    "logging": Logging,
-}
+SERVICE_REGISTRY = LazyServiceRegistry({
+    "secret_manager": "cloudjack.gcp.secret_manager:SecretManager",
+    "storage": "cloudjack.gcp.storage:Storage",
+    "queue": "cloudjack.gcp.queue:Queue",
+    "compute": "cloudjack.gcp.compute:Compute",
+    "dns": "cloudjack.gcp.dns:DNS",
+    "iam": "cloudjack.gcp.iam:IAM",
+    "logging": "cloudjack.gcp.logging_service:Logging",
+})
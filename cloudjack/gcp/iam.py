@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, cast
+import copy
+import time
+from typing import Any, Callable, Iterable, Iterator, cast
 
 from google.api_core import exceptions as gcp_exceptions
-from google.cloud import iam_admin_v1
+from google.cloud import iam_admin_v1, resourcemanager_v3
 from google.iam.v1 import iam_policy_pb2  # noqa: F401 — used by the client
+from google.iam.v1 import policy_pb2
 
 from cloudjack.base.iam import IAMService
 from cloudjack.base.config import GCPConfig
@@ -21,6 +24,46 @@ from cloudjack.base.types import PolicyDict, RoleDict
 # the project IAM policy between our get_iam_policy / set_iam_policy calls.
 _POLICY_MAX_RETRIES = 5
 
+# Seconds a fetched (or just-written) project policy is reused before it is
+# read again.  A stale copy is harmless for writes: its etag makes
+# set_iam_policy fail with Aborted, which forces a fresh read.
+_POLICY_CACHE_TTL = 5.0
+
+
+def _add_bindings(policy: Any, pairs: list[tuple[str, str]]) -> None:
+    """Add each ``(role, member)`` pair to *policy*, skipping existing ones."""
+    by_role: dict[str, Any] = {}
+    for binding in policy.bindings:
+        by_role.setdefault(binding.role, binding)
+    for role_name, member in pairs:
+        binding = by_role.get(role_name)
+        if binding is None:
+            binding = policy_pb2.Binding()
+            binding.role = role_name
+            policy.bindings.append(binding)
+            # Appending copies the message into the repeated field; index
+            # the stored element so later members land in the policy.
+            binding = policy.bindings[-1]
+            by_role[role_name] = binding
+        if member not in binding.members:
+            binding.members.append(member)
+
+
+def _remove_bindings(policy: Any, pairs: list[tuple[str, str]]) -> None:
+    """Remove each ``(role, member)`` pair from *policy* if present."""
+    doomed: dict[str, set[str]] = {}
+    for role_name, member in pairs:
+        doomed.setdefault(role_name, set()).add(member)
+    for binding in policy.bindings:
+        members = doomed.get(binding.role)
+        if not members:
+            continue
+        # Repeated proto fields have no set semantics: rebuild in one pass.
+        kept = [m for m in binding.members if m not in members]
+        if len(kept) != len(binding.members):
+            del binding.members[:]
+            binding.members.extend(kept)
+
 
 class IAM(IAMService):
     """GCP IAM service.
@@ -31,6 +74,8 @@ class IAM(IAMService):
     Attributes:
         project_id: GCP project ID.
         client: IAM Admin client.
+        rm_client: Resource Manager projects client, used for the project
+            IAM policy.
     """
 
     def __init__(self, config: GCPConfig) -> None:
@@ -46,6 +91,11 @@ class IAM(IAMService):
         assert config.project_id is not None  # guaranteed by GCPConfig validator
         self.project_id: str = config.project_id
         self.client = iam_admin_v1.IAMClient(credentials=config.credentials)
+        self.rm_client = resourcemanager_v3.ProjectsClient(
+            credentials=config.credentials
+        )
+        self._resource = f"projects/{self.project_id}"
+        self._policy_cache: tuple[float, Any] | None = None
 
     # --- Role management ---
 
@@ -123,24 +173,32 @@ class IAM(IAMService):
             List of dicts with ``role_name``, ``role_id``, ``title``,
             ``description``.
 
+        Raises:
+            IAMError: On IAM API failure.
+        """
+        return list(self.iter_roles(**kwargs))
+
+    def iter_roles(self, **kwargs: Any) -> Iterator[RoleDict]:
+        """Yield GCP custom roles page by page as the API returns them.
+
+        Args:
+            **kwargs: ``parent`` — override the default project scope.
+
         Raises:
             IAMError: On IAM API failure.
         """
         try:
             parent = kwargs.get("parent", f"projects/{self.project_id}")
-            roles = self.client.list_roles(request={"parent": parent})
-            return cast(
-                list[RoleDict],
-                [
+            for r in self.client.list_roles(request={"parent": parent}):
+                yield cast(
+                    RoleDict,
                     {
-                        "role_name": r.name.split("/")[-1],
+                        "role_name": r.name.rpartition("/")[2],
                         "role_id": r.name,
                         "title": r.title,
                         "description": r.description,
-                    }
-                    for r in roles
-                ],
-            )
+                    },
+                )
         except gcp_exceptions.GoogleAPICallError as e:
             raise IAMError("Failed to list roles") from e
 
@@ -148,14 +206,26 @@ class IAM(IAMService):
     # GCP IAM binds roles to members via project-level IAM policies.
     # attach_policy / detach_policy add / remove a binding entry.
 
-    def _get_policy(self) -> Any:
-        """Fetch the project-level IAM policy via Resource Manager."""
-        from google.cloud import resourcemanager_v3
+    def _get_policy(self, *, fresh: bool = False) -> Any:
+        """Fetch the project-level IAM policy via Resource Manager.
 
-        rm = resourcemanager_v3.ProjectsClient()
-        return rm.get_iam_policy(
-            request={"resource": f"projects/{self.project_id}"}
+        Policies read or written within the last ``_POLICY_CACHE_TTL``
+        seconds are served from memory unless *fresh* is set; callers get
+        a private copy they may mutate freely.
+        """
+        cached = self._policy_cache
+        if (
+            cached is not None
+            and not fresh
+            and time.monotonic() - cached[0] < _POLICY_CACHE_TTL
+        ):
+            return copy.deepcopy(cached[1])
+
+        policy = self.rm_client.get_iam_policy(
+            request={"resource": self._resource}
         )
+        self._policy_cache = (time.monotonic(), policy)
+        return copy.deepcopy(policy)
 
     def _set_policy(self, policy: Any) -> None:
         """Write back the project-level IAM policy via Resource Manager.
@@ -165,15 +235,18 @@ class IAM(IAMService):
         policy in the meantime. Callers should run this inside
         :meth:`_apply_policy_change` to get automatic retry-on-conflict.
         """
-        from google.cloud import resourcemanager_v3
-
-        rm = resourcemanager_v3.ProjectsClient()
-        rm.set_iam_policy(
-            request={
-                "resource": f"projects/{self.project_id}",
-                "policy": policy,
-            }
-        )
+        try:
+            written = self.rm_client.set_iam_policy(
+                request={
+                    "resource": self._resource,
+                    "policy": policy,
+                }
+            )
+        except gcp_exceptions.GoogleAPICallError:
+            self._policy_cache = None
+            raise
+        # The response carries the new etag, so it can seed the next write.
+        self._policy_cache = (time.monotonic(), written)
 
     def _apply_policy_change(self, mutate: Callable[[Any], None]) -> None:
         """Read-modify-write the project IAM policy with etag-based retry.
@@ -204,26 +277,34 @@ class IAM(IAMService):
                        or ``projects/<p>/roles/<r>``).
             policy_identifier: Member string (e.g. ``user:alice@example.com``).
         """
-        from google.iam.v1 import policy_pb2
-
-        def _mutate(policy: Any) -> None:
-            for binding in policy.bindings:
-                if binding.role == role_name:
-                    if policy_identifier not in binding.members:
-                        binding.members.append(policy_identifier)
-                    return
-            new_binding = policy_pb2.Binding()
-            new_binding.role = role_name
-            new_binding.members.append(policy_identifier)
-            policy.bindings.append(new_binding)
-
         try:
-            self._apply_policy_change(_mutate)
+            self._apply_policy_change(
+                lambda policy: _add_bindings(policy, [(role_name, policy_identifier)])
+            )
         except gcp_exceptions.GoogleAPICallError as e:
             raise IAMError(
                 f"Failed to attach '{policy_identifier}' to '{role_name}'"
             ) from e
 
+    def attach_policies(
+        self, bindings: Iterable[tuple[str, str]], **kwargs: Any
+    ) -> None:
+        """Add several role bindings in a single policy read-modify-write.
+
+        Args:
+            bindings: ``(role_name, member)`` pairs.
+
+        Raises:
+            IAMError: On API failure; no binding is applied in that case.
+        """
+        pairs = list(bindings)
+        if not pairs:
+            return
+        try:
+            self._apply_policy_change(lambda policy: _add_bindings(policy, pairs))
+        except gcp_exceptions.GoogleAPICallError as e:
+            raise IAMError(f"Failed to attach {len(pairs)} binding(s)") from e
+
     def detach_policy(self, role_name: str, policy_identifier: str, **kwargs: Any) -> None:
         """Remove a member from a role binding in the project IAM policy.
 
@@ -234,28 +315,52 @@ class IAM(IAMService):
         Raises:
             IAMError: On API failure.
         """
-        def _mutate(policy: Any) -> None:
-            for binding in policy.bindings:
-                if binding.role == role_name and policy_identifier in binding.members:
-                    binding.members.remove(policy_identifier)
-                    return
-
         try:
-            self._apply_policy_change(_mutate)
+            self._apply_policy_change(
+                lambda policy: _remove_bindings(
+                    policy, [(role_name, policy_identifier)]
+                )
+            )
         except gcp_exceptions.GoogleAPICallError as e:
             raise IAMError(
                 f"Failed to detach '{policy_identifier}' from '{role_name}'"
             ) from e
 
-    def list_policies(self, **kwargs: Any) -> list[PolicyDict]:
+    def detach_policies(
+        self, bindings: Iterable[tuple[str, str]], **kwargs: Any
+    ) -> None:
+        """Remove several role bindings in a single policy read-modify-write.
+
+        Args:
+            bindings: ``(role_name, member)`` pairs.
+
+        Raises:
+            IAMError: On API failure; no binding is removed in that case.
+        """
+        pairs = list(bindings)
+        if not pairs:
+            return
+        try:
+            self._apply_policy_change(lambda policy: _remove_bindings(policy, pairs))
+        except gcp_exceptions.GoogleAPICallError as e:
+            raise IAMError(f"Failed to detach {len(pairs)} binding(s)") from e
+
+    def list_policies(self, *, fresh: bool = False, **kwargs: Any) -> list[PolicyDict]:
         """List GCP IAM policy bindings for the project.
 
+        The policy is served from an in-process cache for up to 5 seconds
+        after it was last read or written here, so changes made by other
+        clients in that window may not show up yet.
+
+        Args:
+            fresh: Skip the cache and always read the policy from the API.
+
         Returns:
             One dict per binding with ``policy_name`` (role) and
             ``policy_identifier`` (role identifier).
         """
         try:
-            policy = self._get_policy()
+            policy = self._get_policy(fresh=fresh)
             return cast(
                 list[PolicyDict],
                 [
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import Iterable, Iterator
 from typing import Any, cast
 
 from google.api_core import exceptions as gcp_exceptions
 from google.cloud import logging as cloud_logging
+from google.cloud.logging_v2.services.logging_service_v2 import LoggingServiceV2Client
+from google.protobuf.json_format import MessageToJson
 
 from cloudjack.base.logging_service import LoggingService
 from cloudjack.base.config import GCPConfig
@@ -17,6 +21,20 @@ from cloudjack.base.exceptions import (
 from cloudjack.base.types import LogEntryDict
 
 
+def _payload_text(payload: Any) -> str:
+    """Render an entry payload as text: text as-is, structured payloads as JSON."""
+    if isinstance(payload, str):
+        return payload
+    if isinstance(payload, dict):
+        return json.dumps(payload)
+    if payload is None:
+        return ""
+    try:
+        return MessageToJson(payload, preserving_proto_field_name=True)  # type: ignore[no-any-return]
+    except (AttributeError, TypeError):  # not a message, or an unresolvable Any
+        return str(payload)
+
+
 class Logging(LoggingService):
     """GCP Cloud Logging service.
 
@@ -25,6 +43,7 @@ class Logging(LoggingService):
 
     Attributes:
         client: Cloud Logging client.
+        logs_client: GAPIC client for the ``logs.list`` endpoint.
         project_id: GCP project ID.
     """
 
@@ -41,6 +60,15 @@ class Logging(LoggingService):
         assert config.project_id is not None  # guaranteed by GCPConfig validator
         self.project_id: str = config.project_id
         self.client = cloud_logging.Client(project=self.project_id, credentials=config.credentials)
+        self.logs_client = LoggingServiceV2Client(credentials=config.credentials)
+        self._loggers: dict[str, cloud_logging.Logger] = {}
+
+    def _logger(self, name: str) -> cloud_logging.Logger:
+        """Return the memoised :class:`Logger` for *name*."""
+        logger = self._loggers.get(name)
+        if logger is None:
+            logger = self._loggers[name] = self.client.logger(name)
+        return logger
 
     # --- Log group lifecycle ---
 
@@ -68,28 +96,22 @@ class Logging(LoggingService):
     def delete_log_group(self, name: str) -> None:
         """Delete a log (all entries) or a sink."""
         try:
-            logger = self.client.logger(name)
-            logger.delete()
+            self._logger(name).delete()
         except gcp_exceptions.NotFound as e:
             raise LogGroupNotFoundError(f"Log '{name}' not found") from e
         except gcp_exceptions.GoogleAPICallError as e:
             raise LoggingError(f"Failed to delete log '{name}'") from e
 
     def list_log_groups(self, prefix: str = "") -> list[str]:
+        return sorted(self.iter_log_groups(prefix))
+
+    def iter_log_groups(self, prefix: str = "") -> Iterator[str]:
+        """Yield log names from ``logs.list`` without reading any entries."""
         try:
-            entries = self.client.list_entries(
-                filter_=f'logName:"{prefix}"' if prefix else None,
-                page_size=0,
-            )
-            # Collect unique log names
-            seen: set[str] = set()
-            for entry in entries:
-                log_name = entry.log_name.split("/")[-1] if entry.log_name else ""
-                if log_name:
-                    seen.add(log_name)
-                if len(seen) > 500:
-                    break
-            return sorted(seen)
+            for log_name in self.logs_client.list_logs(parent=f"projects/{self.project_id}"):
+                name = log_name.rpartition("/")[2]
+                if name.startswith(prefix):
+                    yield name
         except gcp_exceptions.GoogleAPICallError as e:
             raise LoggingError("Failed to list log groups") from e
 
@@ -102,6 +124,21 @@ class Logging(LoggingService):
         "ERROR": "ERROR",
         "CRITICAL": "CRITICAL",
     }
+    # Upper, lower and title case spellings resolve with one dict lookup;
+    # anything else falls back to ``upper()`` in :meth:`_severity`.
+    _SEVERITY_LOOKUP = {
+        spelling: gcp
+        for name, gcp in _SEVERITY_MAP.items()
+        for spelling in (name, name.lower(), name.title())
+    }
+
+    @classmethod
+    def _severity(cls, severity: str) -> str:
+        """Map a caller-supplied severity name to a Cloud Logging severity."""
+        gcp = cls._SEVERITY_LOOKUP.get(severity)
+        if gcp is None:
+            gcp = cls._SEVERITY_MAP.get(severity.upper(), "DEFAULT")
+        return gcp
 
     def write_log(
         self,
@@ -123,13 +160,35 @@ class Logging(LoggingService):
             LoggingError: On Cloud Logging API failure.
         """
         try:
-            logger = self.client.logger(log_group)
-            gcp_severity = self._SEVERITY_MAP.get(severity.upper(), "DEFAULT")
+            logger = self._logger(log_group)
+            gcp_severity = self._severity(severity)
             labels = kwargs.get("labels", {})
             logger.log_text(message, severity=gcp_severity, labels=labels)
         except gcp_exceptions.GoogleAPICallError as e:
             raise LoggingError(f"Failed to write log to '{log_group}'") from e
 
+    def write_logs(
+        self,
+        log_group: str,
+        messages: Iterable[str],
+        *,
+        severity: str = "INFO",
+        **kwargs: Any,
+    ) -> None:
+        """Write several entries in a single ``entries.write`` request.
+
+        Raises:
+            LoggingError: On Cloud Logging API failure; no entries are written.
+        """
+        try:
+            gcp_severity = self._severity(severity)
+            labels = kwargs.get("labels", {})
+            with self._logger(log_group).batch() as batch:
+                for message in messages:
+                    batch.log_text(message, severity=gcp_severity, labels=labels)
+        except gcp_exceptions.GoogleAPICallError as e:
+            raise LoggingError(f"Failed to write logs to '{log_group}'") from e
+
     def read_logs(
         self,
         log_group: str,
@@ -163,7 +222,7 @@ class Logging(LoggingService):
                 results.append(
                     {
                         "timestamp": str(entry.timestamp) if entry.timestamp else "",
-                        "message": entry.payload if isinstance(entry.payload, str) else str(entry.payload),
+                        "message": _payload_text(entry.payload),
                         "severity": entry.severity or "DEFAULT",
                     }
                 )
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent import futures
+from itertools import islice
 from typing import Any, cast
 
 from google.api_core import exceptions as gcp_exceptions
 from google.cloud import pubsub_v1  # type: ignore[attr-defined]
 
+from cloudjack.base.prefetch import prefetch
 from cloudjack.base.queue import QueueService
 from cloudjack.base.config import GCPConfig
 from cloudjack.base.exceptions import (
@@ -17,6 +23,30 @@ from cloudjack.base.exceptions import (
 )
 from cloudjack.base.types import MessageDict
 
+logger = logging.getLogger("cloudjack")
+
+# Matches the ack batch size used by the Pub/Sub streaming-pull dispatcher.
+_ACK_BATCH_SIZE = 1000
+
+# Publisher batching: a batch is sent once it holds 100 messages or 1 MB, or
+# 10 ms after its first message, whichever comes first.
+_BATCH_SETTINGS = pubsub_v1.types.BatchSettings(
+    max_messages=100, max_bytes=1_000_000, max_latency=0.01
+)
+
+# Cap what a single send_message_batch call can buffer in the client; once
+# the limit is reached publish() blocks until earlier batches are sent.
+_FLOW_CONTROL = pubsub_v1.types.PublishFlowControl(
+    message_limit=10_000,
+    byte_limit=100 * 1024 * 1024,
+    limit_exceeded_behavior=pubsub_v1.types.LimitExceededBehavior.BLOCK,
+)
+
+
+def _encode(body: str | bytes) -> bytes:
+    """Return *body* as the ``bytes`` Pub/Sub expects; bytes pass through."""
+    return body if isinstance(body, bytes) else body.encode("utf-8")
+
 
 class Queue(QueueService):
     """GCP Pub/Sub queue service.
@@ -42,7 +72,13 @@ class Queue(QueueService):
         """
         assert config.project_id is not None  # guaranteed by GCPConfig validator
         self.project_id: str = config.project_id
-        self.publisher = pubsub_v1.PublisherClient(credentials=config.credentials)
+        self.publisher = pubsub_v1.PublisherClient(
+            batch_settings=_BATCH_SETTINGS,
+            publisher_options=pubsub_v1.types.PublisherOptions(
+                flow_control=_FLOW_CONTROL
+            ),
+            credentials=config.credentials,
+        )
         self.subscriber = pubsub_v1.SubscriberClient(credentials=config.credentials)
 
     def _topic_path(self, name: str) -> str:
@@ -137,24 +173,29 @@ class Queue(QueueService):
         Raises:
             QueueError: On Pub/Sub API failure.
         """
+        return list(self.iter_queues(prefix))
+
+    def iter_queues(self, prefix: str = "") -> Iterator[str]:
+        """Yield Pub/Sub topic short names as each page arrives."""
         try:
             project_path = f"projects/{self.project_id}"
             topics = self.publisher.list_topics(request={"project": project_path})
-            names = [t.name.split("/")[-1] for t in topics]
-            if prefix:
-                names = [n for n in names if n.startswith(prefix)]
-            return names
+            for t in topics:
+                name = t.name.rpartition("/")[2]
+                if name.startswith(prefix):
+                    yield name
         except gcp_exceptions.GoogleAPICallError as e:
             raise QueueError("Failed to list topics") from e
 
     # --- Messaging ---
 
-    def send_message(self, queue_id: str, body: str, **kwargs: Any) -> str:
+    def send_message(self, queue_id: str, body: str | bytes, **kwargs: Any) -> str:
         """Publish a message to a Pub/Sub topic.
 
         Args:
             queue_id: Topic name (not full path).
-            body: Message body.
+            body: Message body. ``bytes`` are published as-is; ``str`` is
+                UTF-8 encoded.
             **kwargs: ``message_attributes`` dict for Pub/Sub message attributes.
 
         Returns:
@@ -163,13 +204,70 @@ class Queue(QueueService):
         try:
             topic_path = self._topic_path(queue_id)
             attrs = kwargs.get("message_attributes", {})
-            future = self.publisher.publish(
-                topic_path, body.encode("utf-8"), **attrs
-            )
+            future = self.publisher.publish(topic_path, _encode(body), **attrs)
             return future.result()  # type: ignore[no-any-return]
         except gcp_exceptions.GoogleAPICallError as e:
             raise MessageError(f"Failed to publish to '{queue_id}'") from e
 
+    def send_message_batch(
+        self, queue_id: str, bodies: Sequence[str | bytes], **kwargs: Any
+    ) -> list[str]:
+        """Publish several messages to a Pub/Sub topic.
+
+        Every message is handed to the publisher before any result is
+        awaited, so the client library batches them into publish RPCs of up
+        to 100 messages / 1 MB; confirmations are then collected once for
+        the whole batch.  Publisher flow control bounds how much of a very
+        large batch is buffered in memory at once.
+
+        Args:
+            queue_id: Topic name (not full path).
+            bodies: Message bodies, ``str`` or ``bytes`` as for :meth:`send_message`.
+            **kwargs: ``message_attributes`` dict applied to every message.
+
+        Returns:
+            Published message IDs, in the same order as *bodies*.
+
+        Raises:
+            MessageError: If any message fails to publish.
+        """
+        try:
+            pending = self._publish_all(queue_id, bodies, **kwargs)
+            futures.wait(pending, return_when=futures.ALL_COMPLETED)
+            return [f.result() for f in pending]
+        except gcp_exceptions.GoogleAPICallError as e:
+            raise MessageError(f"Failed to publish to '{queue_id}'") from e
+
+    def _publish_all(
+        self, queue_id: str, bodies: Iterable[str | bytes], **kwargs: Any
+    ) -> list[futures.Future[str]]:
+        """Hand every body to the batching publisher and return the futures."""
+        topic_path = self._topic_path(queue_id)
+        attrs = kwargs.get("message_attributes", {})
+        return [self.publisher.publish(topic_path, _encode(body), **attrs) for body in bodies]
+
+    async def asend_message(self, queue_id: str, body: str | bytes, **kwargs: Any) -> str:
+        """Async variant of :meth:`send_message`; see :meth:`asend_message_batch`."""
+        return (await self.asend_message_batch(queue_id, [body], **kwargs))[0]
+
+    async def asend_message_batch(
+        self, queue_id: str, bodies: Sequence[str | bytes], **kwargs: Any
+    ) -> list[str]:
+        """Async variant of :meth:`send_message_batch`.
+
+        Only the hand-off to the publisher runs on a worker thread, since it
+        can block under flow control. The publish RPCs are then awaited on
+        the event loop, so in-flight messages hold no thread.
+
+        Raises:
+            MessageError: If any message fails to publish.
+        """
+        try:
+            pending = await asyncio.to_thread(self._publish_all, queue_id, bodies, **kwargs)
+            return list(await asyncio.gather(*map(asyncio.wrap_future, pending)))
+        except gcp_exceptions.GoogleAPICallError as e:
+            raise MessageError(f"Failed to publish to '{queue_id}'") from e
+
     def receive_messages(
         self, queue_id: str, max_messages: int = 1, **kwargs: Any
     ) -> list[MessageDict]:
@@ -210,9 +308,88 @@ class Queue(QueueService):
         except gcp_exceptions.GoogleAPICallError as e:
             raise MessageError(f"Failed to receive from '{queue_id}'") from e
 
+    def receive_messages_stream(
+        self, queue_id: str, max_messages: int = 10, buffer: int = 2
+    ) -> Iterator[MessageDict]:
+        """Yield messages from back-to-back pulls, issuing each pull in the background.
+
+        The next ``pull`` starts as soon as the previous one returns, so the
+        network wait overlaps with the caller's processing. The stream never
+        ends on its own; stop iterating (or ``close()`` it) to stop pulling.
+        Prefetched messages that are never yielded are redelivered once their
+        ack deadline passes.
+
+        Args:
+            queue_id: Topic name (subscription ``<name>-sub`` is used).
+            max_messages: Maximum messages per pull.
+            buffer: Pull responses held ahead of the caller; keep this small
+                (at most 4) so prefetched messages do not sit past their
+                ack deadline.
+
+        Raises:
+            QueueNotFoundError: If the subscription does not exist.
+            MessageError: On pull failure.
+        """
+
+        def pulls() -> Iterator[list[MessageDict]]:
+            while True:
+                yield self.receive_messages(queue_id, max_messages)
+
+        for batch in prefetch(pulls(), depth=buffer):
+            yield from batch
+
+    def subscribe(
+        self,
+        queue_id: str,
+        callback: Callable[[MessageDict], None],
+        max_messages: int = 1000,
+    ) -> pubsub_v1.subscriber.futures.StreamingPullFuture:
+        """Stream messages to *callback* over a persistent StreamingPull connection.
+
+        This is the throughput path for long-running consumers;
+        :meth:`receive_messages` issues one unary ``pull`` per call and suits
+        one-shot reads. Each message is acked when *callback* returns and
+        nacked (redelivered promptly) if it raises.
+
+        Args:
+            queue_id: Topic name (subscription ``<name>-sub`` is used).
+            callback: Invoked on a worker thread with each message.
+            max_messages: Flow-control cap on messages held by the client
+                but not yet acked.
+
+        Returns:
+            The streaming future. Call ``cancel()`` to stop consuming;
+            ``result()`` blocks and raises if the stream fails (for example
+            when the subscription does not exist).
+        """
+
+        def handle(message: Any) -> None:
+            try:
+                callback(
+                    {
+                        "message_id": message.message_id,
+                        "body": message.data.decode("utf-8"),
+                        "receipt_handle": message.ack_id,
+                    }
+                )
+            except Exception:
+                logger.exception("Callback failed for message %s", message.message_id)
+                message.nack()
+            else:
+                message.ack()
+
+        return self.subscriber.subscribe(
+            self._sub_path(queue_id),
+            callback=handle,
+            flow_control=pubsub_v1.types.FlowControl(max_messages=max_messages),
+        )
+
     def delete_message(self, queue_id: str, receipt_handle: str) -> None:
         """Acknowledge a Pub/Sub message.
 
+        The ack is sent before this returns. To acknowledge many messages in
+        fewer requests, use :meth:`delete_messages`.
+
         Args:
             queue_id: Topic name.
             receipt_handle: Ack ID from :meth:`receive_messages`.
@@ -221,12 +398,31 @@ class Queue(QueueService):
             MessageError: On acknowledgement failure.
         """
         try:
-            sub_path = self._sub_path(queue_id)
             self.subscriber.acknowledge(
                 request={
-                    "subscription": sub_path,
+                    "subscription": self._sub_path(queue_id),
                     "ack_ids": [receipt_handle],
                 }
             )
         except gcp_exceptions.GoogleAPICallError as e:
             raise MessageError(f"Failed to ack message in '{queue_id}'") from e
+
+    def delete_messages(self, queue_id: str, receipt_handles: Iterable[str]) -> None:
+        """Acknowledge many Pub/Sub messages in batched ``acknowledge`` calls.
+
+        Args:
+            queue_id: Topic name.
+            receipt_handles: Ack IDs from :meth:`receive_messages`.
+
+        Raises:
+            MessageError: On acknowledgement failure.
+        """
+        sub_path = self._sub_path(queue_id)
+        ack_ids = iter(receipt_handles)
+        try:
+            while batch := list(islice(ack_ids, _ACK_BATCH_SIZE)):
+                self.subscriber.acknowledge(
+                    request={"subscription": sub_path, "ack_ids": batch}
+                )
+        except gcp_exceptions.GoogleAPICallError as e:
+            raise MessageError(f"Failed to ack messages in '{queue_id}'") from e
@@ -1,10 +1,17 @@
 """GCP Secret Manager implementation of the SecretManagerService interface."""
 
+import logging
+import time
+
 from google.cloud import secretmanager_v1
 from google.api_core.exceptions import (
     AlreadyExists,
+    DeadlineExceeded,
     GoogleAPICallError,
+    InternalServerError,
     NotFound,
+    ServiceUnavailable,
+    TooManyRequests,
 )
 
 from cloudjack.base.exceptions import (
@@ -16,6 +23,17 @@ from cloudjack.base.exceptions import (
 from cloudjack.base import SecretManagerService
 from cloudjack.base.config import GCPConfig
 
+logger = logging.getLogger("cloudjack")
+
+# Refresh failures that say nothing about the secret itself. Anything else
+# (revoked access, a disabled or destroyed version) must reach the caller.
+_TRANSIENT_ERRORS = (
+    DeadlineExceeded,
+    InternalServerError,
+    ServiceUnavailable,
+    TooManyRequests,
+)
+
 
 class SecretManager(SecretManagerService):
     """GCP Secret Manager implementation for secret management.
@@ -26,6 +44,7 @@ class SecretManager(SecretManagerService):
     Attributes:
         client: Google Cloud Secret Manager client for interacting with GCP Secret Manager API.
         project_id: The GCP project ID where secrets are stored.
+        secret_ttl: Seconds a fetched secret value is served from cache.
     """
 
     def __init__(self, config: GCPConfig) -> None:
@@ -42,28 +61,50 @@ class SecretManager(SecretManagerService):
             credentials=config.credentials
         )
         self.project_id = config.project_id
+        self.secret_ttl = config.secret_ttl
+        self._secret_cache: dict[str, tuple[float, str]] = {}
 
-    def get_secret(self, name: str) -> str:
+    def get_secret(self, name: str, *, fresh: bool = False) -> str:
         """Retrieve a secret value from GCP Secret Manager.
 
+        Values are served from an in-process cache for ``secret_ttl`` seconds.
+        If a refresh fails with a transient error (unavailable, deadline
+        exceeded, internal error, rate limited), the last value fetched is
+        returned instead of raising. Any other failure drops the cached value.
+
         Args:
             name: The name of the secret to retrieve (e.g., 'my-secret').
+            fresh: Skip the cache and always call the API.
 
         Returns:
             The secret value as a string.
 
         Raises:
             SecretNotFoundError: If the secret does not exist.
-            SecretManagerError: If retrieval fails for any other reason.
+            SecretManagerError: If retrieval fails and no cached value exists.
         """
+        now = time.monotonic()
+        cached = self._secret_cache.get(name)
+        if cached is not None and not fresh and now - cached[0] < self.secret_ttl:
+            return cached[1]
         secret_name = f"projects/{self.project_id}/secrets/{name}/versions/latest"
         try:
             response = self.client.access_secret_version(name=secret_name)
-            return str(response.payload.data.decode("UTF-8"))
         except NotFound as e:
+            self._secret_cache.pop(name, None)
             raise SecretNotFoundError(f"Secret '{name}' not found.") from e
         except GoogleAPICallError as e:
+            if cached is not None and isinstance(e, _TRANSIENT_ERRORS):
+                logger.warning(
+                    "Serving cached secret '%s' after refresh failed: %s", name, e
+                )
+                return cached[1]
+            self._secret_cache.pop(name, None)
             raise SecretManagerError(f"Failed to retrieve secret '{name}'") from e
+        value = str(response.payload.data.decode("UTF-8"))
+        if self.secret_ttl > 0:
+            self._secret_cache[name] = (now, value)
+        return value
 
     def create_secret(self, name: str, value: str) -> None:
         """Create a new secret in GCP Secret Manager.
@@ -108,10 +149,9 @@ class SecretManager(SecretManagerService):
             SecretManagerError: If update fails for any other reason.
         """
         secret_name = f"projects/{self.project_id}/secrets/{name}"
+        self._secret_cache.pop(name, None)
         try:
-            # Check if the secret exists
-            self.client.get_secret(name=secret_name)
-            # Add a new version with the updated value
+            # Raises NotFound itself when the parent secret is missing.
             self.client.add_secret_version(
                 request={
                     "parent": secret_name,
@@ -122,6 +162,9 @@ class SecretManager(SecretManagerService):
             raise SecretNotFoundError(f"Secret '{name}' not found.") from e
         except GoogleAPICallError as e:
             raise SecretManagerError(f"Failed to update secret '{name}'") from e
+        finally:
+            # A concurrent get_secret may have re-cached the old value.
+            self._secret_cache.pop(name, None)
     
     def delete_secret(self, name: str) -> None:
         """Delete a secret from GCP Secret Manager.
@@ -134,9 +177,13 @@ class SecretManager(SecretManagerService):
             SecretManagerError: If deletion fails for any other reason.
         """
         secret_name = f"projects/{self.project_id}/secrets/{name}"
+        self._secret_cache.pop(name, None)
         try:
             self.client.delete_secret(name=secret_name)
         except NotFound as e:
             raise SecretNotFoundError(f"Secret '{name}' not found.") from e
         except GoogleAPICallError as e:
             raise SecretManagerError(f"Failed to delete secret '{name}'") from e
+        finally:
+            # A concurrent get_secret may have re-cached the old value.
+            self._secret_cache.pop(name, None)
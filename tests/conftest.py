@@ -0,0 +1,21 @@
+"""Fixtures shared across the test modules."""
+
+import pytest
+
+from cloudjack.base.config import AWSConfig, GCPConfig
+
+
+@pytest.fixture
+def aws_config() -> AWSConfig:
+    """Static AWS credentials for the mocked AWS service fixtures."""
+    return AWSConfig(
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",
+        region_name="us-east-1",
+    )
+
+
+@pytest.fixture
+def gcp_config() -> GCPConfig:
+    """Project settings for the mocked GCP service fixtures."""
+    return GCPConfig(project_id="my-project")
@@ -0,0 +1,33 @@
+"""Shared helpers for the provider test modules."""
+
+from collections.abc import Iterable
+from typing import Any
+from unittest.mock import Mock
+
+from botocore.exceptions import ClientError
+
+
+def client_error(code: str, msg: str = "error") -> ClientError:
+    """Build the ``ClientError`` botocore raises for an AWS error *code*."""
+    return ClientError({"Error": {"Code": code, "Message": msg}}, "op")
+
+
+def sts_stub(account: str = "123456789012") -> Mock:
+    """Build an STS client whose ``get_caller_identity`` reports *account*."""
+    sts = Mock(spec_set=["get_caller_identity"])
+    sts.get_caller_identity.return_value = {"Account": account}
+    return sts
+
+
+def paginator_stub(client: Mock, pages: Iterable[dict[str, Any]] | Exception) -> Mock:
+    """Make ``client.get_paginator()`` return a paginator over *pages*.
+
+    Passing an exception makes ``paginate()`` raise it instead.
+    """
+    paginator = Mock(spec_set=["paginate"])
+    if isinstance(pages, Exception):
+        paginator.paginate.side_effect = pages
+    else:
+        paginator.paginate.return_value = pages
+    client.get_paginator.return_value = paginator
+    return paginator
@@ -1,28 +1,48 @@
 """Tests for AWS EC2 Compute service."""
 
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, Mock
 import pytest
-from botocore.exceptions import ClientError
 
 from cloudjack.aws.compute import Compute
-from cloudjack.base.config import AWSConfig
 from cloudjack.base.exceptions import ComputeError, InstanceNotFoundError
 
+from tests.helpers import client_error
 
-def _client_error(code: str, msg: str = "error") -> ClientError:
-    return ClientError({"Error": {"Code": code, "Message": msg}}, "op")
+
+DESCRIBE_INSTANCES = {
+    "Reservations": [
+        {
+            "Instances": [
+                {
+                    "InstanceId": "i-1",
+                    "State": {"Name": "running"},
+                    "InstanceType": "t3.micro",
+                    "Tags": [{"Key": "Name", "Value": "web"}],
+                    "LaunchTime": "2024-01-01T00:00:00Z",
+                    "PublicIpAddress": "1.2.3.4",
+                    "PrivateIpAddress": "10.0.0.1",
+                }
+            ]
+        }
+    ]
+}
+
+
+# The EC2 API calls Compute makes; anything else on the stub raises AttributeError.
+_EC2_METHODS = [
+    "run_instances",
+    "start_instances",
+    "stop_instances",
+    "terminate_instances",
+    "describe_instances",
+]
 
 
 @pytest.fixture
-def svc():
-    with patch("cloudjack.aws.compute.boto3") as mock_boto:
-        mock_client = MagicMock()
-        mock_boto.client.return_value = mock_client
-        instance = Compute(AWSConfig(
-            aws_access_key_id="key",
-            aws_secret_access_key="secret",
-            region_name="us-east-1",
-        ))
+def svc(aws_config):
+    mock_client = Mock(spec_set=_EC2_METHODS)
+    with patch("cloudjack.aws.compute.boto3.client", return_value=mock_client):
+        instance = Compute(aws_config)
         yield instance, mock_client
 
 
@@ -49,11 +69,26 @@ class TestCreateInstance:
 
     def test_error(self, svc):
         inst, client = svc
-        client.run_instances.side_effect = _client_error("InsufficientInstanceCapacity")
+        client.run_instances.side_effect = client_error("InsufficientInstanceCapacity")
         with pytest.raises(ComputeError):
             inst.create_instance("web", "t3.micro", "ami-123")
 
 
+class TestCreateInstances:
+    def test_one_call_per_name(self, svc):
+        inst, client = svc
+        client.run_instances.side_effect = [
+            {"Instances": [{"InstanceId": "i-1"}]},
+            {"Instances": [{"InstanceId": "i-2"}]},
+        ]
+        assert inst.create_instances(["a", "b"], "t3.micro", "ami-123") == ["i-1", "i-2"]
+        tags = [
+            c.kwargs["TagSpecifications"][0]["Tags"][0]["Value"]
+            for c in client.run_instances.call_args_list
+        ]
+        assert tags == ["a", "b"]
+
+
 # --- start / stop / terminate ---
 
 class TestInstanceLifecycle:
@@ -72,45 +107,60 @@ class TestInstanceLifecycle:
         inst.terminate_instance("i-abc")
         client.terminate_instances.assert_called_once_with(InstanceIds=["i-abc"])
 
-    def test_start_not_found(self, svc):
+    @pytest.mark.parametrize(
+        "method, client_method",
+        [
+            ("start_instance", "start_instances"),
+            ("stop_instance", "stop_instances"),
+        ],
+    )
+    def test_not_found(self, svc, method, client_method):
         inst, client = svc
-        client.start_instances.side_effect = _client_error("InvalidInstanceID.NotFound")
+        getattr(client, client_method).side_effect = client_error("InvalidInstanceID.NotFound")
         with pytest.raises(InstanceNotFoundError):
-            inst.start_instance("i-missing")
-
-    def test_stop_not_found(self, svc):
-        inst, client = svc
-        client.stop_instances.side_effect = _client_error("InvalidInstanceID.NotFound")
-        with pytest.raises(InstanceNotFoundError):
-            inst.stop_instance("i-missing")
+            getattr(inst, method)("i-missing")
 
     def test_terminate_generic(self, svc):
         inst, client = svc
-        client.terminate_instances.side_effect = _client_error("UnauthorizedAccess")
+        client.terminate_instances.side_effect = client_error("UnauthorizedAccess")
         with pytest.raises(ComputeError):
             inst.terminate_instance("i-abc")
 
 
+# --- bulk start / stop / terminate ---
+
+class TestBulkLifecycle:
+    def test_start_instances_single_call(self, svc):
+        inst, client = svc
+        inst.start_instances(["i-1", "i-2"])
+        client.start_instances.assert_called_once_with(InstanceIds=["i-1", "i-2"])
+
+    def test_stop_instances_single_call(self, svc):
+        inst, client = svc
+        inst.stop_instances(["i-1", "i-2"])
+        client.stop_instances.assert_called_once_with(InstanceIds=["i-1", "i-2"])
+
+    def test_terminate_instances_not_found(self, svc):
+        inst, client = svc
+        client.terminate_instances.side_effect = client_error("InvalidInstanceID.NotFound")
+        with pytest.raises(InstanceNotFoundError):
+            inst.terminate_instances(["i-1"])
+
+    @pytest.mark.parametrize(
+        "op", ["start_instances", "stop_instances", "terminate_instances"]
+    )
+    def test_empty_list_is_a_no_op(self, svc, op):
+        inst, client = svc
+        getattr(inst, op)([])
+        getattr(client, op).assert_not_called()
+
+
 # --- list_instances ---
 
 class TestListInstances:
     def test_success(self, svc):
         inst, client = svc
-        client.describe_instances.return_value = {
-            "Reservations": [
-                {
-                    "Instances": [
-                        {
-                            "InstanceId": "i-1",
-                            "State": {"Name": "running"},
-                            "InstanceType": "t3.micro",
-                            "Tags": [{"Key": "Name", "Value": "web"}],
-                            "LaunchTime": "2024-01-01T00:00:00Z",
-                        }
-                    ]
-                }
-            ]
-        }
+        client.describe_instances.return_value = DESCRIBE_INSTANCES
         result = inst.list_instances()
         assert len(result) == 1
         assert result[0]["instance_id"] == "i-1"
@@ -138,29 +188,13 @@ class TestListInstances:
 class TestGetInstance:
     def test_success(self, svc):
         inst, client = svc
-        client.describe_instances.return_value = {
-            "Reservations": [
-                {
-                    "Instances": [
-                        {
-                            "InstanceId": "i-1",
-                            "State": {"Name": "running"},
-                            "InstanceType": "t3.micro",
-                            "Tags": [{"Key": "Name", "Value": "web"}],
-                            "LaunchTime": "2024-01-01",
-                            "PublicIpAddress": "1.2.3.4",
-                            "PrivateIpAddress": "10.0.0.1",
-                        }
-                    ]
-                }
-            ]
-        }
+        client.describe_instances.return_value = DESCRIBE_INSTANCES
         result = inst.get_instance("i-1")
         assert result["public_ip"] == "1.2.3.4"
         assert result["private_ip"] == "10.0.0.1"
 
     def test_not_found(self, svc):
         inst, client = svc
-        client.describe_instances.side_effect = _client_error("InvalidInstanceID.NotFound")
+        client.describe_instances.side_effect = client_error("InvalidInstanceID.NotFound")
         with pytest.raises(InstanceNotFoundError):
             inst.get_instance("i-missing")
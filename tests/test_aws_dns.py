@@ -2,27 +2,18 @@
 
 from unittest.mock import patch, MagicMock
 import pytest
-from botocore.exceptions import ClientError
 
 from cloudjack.aws.dns import DNS
-from cloudjack.base.config import AWSConfig
 from cloudjack.base.exceptions import DNSError, ZoneNotFoundError, ZoneAlreadyExistsError
 
-
-def _client_error(code: str, msg: str = "error") -> ClientError:
-    return ClientError({"Error": {"Code": code, "Message": msg}}, "op")
+from tests.helpers import client_error, paginator_stub
 
 
 @pytest.fixture
-def svc():
-    with patch("cloudjack.aws.dns.boto3") as mock_boto:
-        mock_client = MagicMock()
-        mock_boto.client.return_value = mock_client
-        instance = DNS(AWSConfig(
-            aws_access_key_id="key",
-            aws_secret_access_key="secret",
-            region_name="us-east-1",
-        ))
+def svc(aws_config):
+    mock_client = MagicMock()
+    with patch("cloudjack.aws.dns.boto3.client", return_value=mock_client):
+        instance = DNS(aws_config)
         yield instance, mock_client
 
 
@@ -39,13 +30,13 @@ class TestCreateZone:
 
     def test_already_exists(self, svc):
         inst, client = svc
-        client.create_hosted_zone.side_effect = _client_error("HostedZoneAlreadyExists")
+        client.create_hosted_zone.side_effect = client_error("HostedZoneAlreadyExists")
         with pytest.raises(ZoneAlreadyExistsError):
             inst.create_zone("dup.com.")
 
     def test_generic_error(self, svc):
         inst, client = svc
-        client.create_hosted_zone.side_effect = _client_error("DelegationSetNotAvailable")
+        client.create_hosted_zone.side_effect = client_error("DelegationSetNotAvailable")
         with pytest.raises(DNSError):
             inst.create_zone("fail.com.")
 
@@ -58,21 +49,13 @@ class TestDeleteZone:
         inst.delete_zone("Z123")
         client.delete_hosted_zone.assert_called_once_with(Id="Z123")
 
-    def test_not_found(self, svc):
-        inst, client = svc
-        client.delete_hosted_zone.side_effect = _client_error("NoSuchHostedZone")
-        with pytest.raises(ZoneNotFoundError):
-            inst.delete_zone("Z-missing")
-
 
 # --- list_zones ---
 
 class TestListZones:
     def test_success(self, svc):
         inst, client = svc
-        paginator = MagicMock()
-        client.get_paginator.return_value = paginator
-        paginator.paginate.return_value = [
+        paginator_stub(client, [
             {
                 "HostedZones": [
                     {
@@ -83,7 +66,7 @@ class TestListZones:
                     }
                 ]
             }
-        ]
+        ])
         zones = inst.list_zones()
         assert len(zones) == 1
         assert zones[0]["zone_id"] == "Z1"
@@ -91,9 +74,7 @@ class TestListZones:
 
     def test_empty(self, svc):
         inst, client = svc
-        paginator = MagicMock()
-        client.get_paginator.return_value = paginator
-        paginator.paginate.return_value = [{"HostedZones": []}]
+        paginator_stub(client, [{"HostedZones": []}])
         assert inst.list_zones() == []
 
 
@@ -111,7 +92,7 @@ class TestCreateRecord:
 
     def test_error(self, svc):
         inst, client = svc
-        client.change_resource_record_sets.side_effect = _client_error("NoSuchHostedZone")
+        client.change_resource_record_sets.side_effect = client_error("NoSuchHostedZone")
         with pytest.raises(ZoneNotFoundError):
             inst.create_record("Z-bad", "www.x.com.", "A", ["1.2.3.4"])
 
@@ -126,6 +107,61 @@ class TestDeleteRecord:
         assert args["ChangeBatch"]["Changes"][0]["Action"] == "DELETE"
 
 
+# --- apply_record_changes ---
+
+class TestApplyRecordChanges:
+    def test_one_change_batch(self, svc):
+        inst, client = svc
+        inst.apply_record_changes(
+            "Z1",
+            adds=[{"name": "a.x.com.", "type": "A", "ttl": 60, "values": ["1.1.1.1"]}],
+            deletes=[{"name": "b.x.com.", "type": "A", "ttl": 300, "values": ["2.2.2.2"]}],
+        )
+        client.change_resource_record_sets.assert_called_once()
+        changes = client.change_resource_record_sets.call_args[1]["ChangeBatch"]["Changes"]
+        assert [c["Action"] for c in changes] == ["DELETE", "UPSERT"]
+        assert changes[1]["ResourceRecordSet"]["TTL"] == 60
+
+    def test_large_sets_split_into_batches(self, svc):
+        inst, client = svc
+        records = [
+            {"name": f"r{i}.x.com.", "type": "A", "ttl": 60, "values": ["10.0.0.1"]}
+            for i in range(1200)
+        ]
+        inst.apply_record_changes("Z1", adds=records, deletes=records)
+        batches = [
+            c.kwargs["ChangeBatch"]["Changes"]
+            for c in client.change_resource_record_sets.call_args_list
+        ]
+        assert len(batches) > 1
+        assert sum(len(b) for b in batches) == 2400
+        for batch in batches:
+            # One value each; an UPSERT counts twice against the 1000 limit.
+            assert sum(2 if c["Action"] == "UPSERT" else 1 for c in batch) <= 1000
+            names = [c["ResourceRecordSet"]["Name"] for c in batch]
+            # Each name's DELETE and UPSERT stay together, DELETE first.
+            assert names[0::2] == names[1::2]
+            assert [c["Action"] for c in batch[:2]] == ["DELETE", "UPSERT"]
+
+    def test_failure_reports_applied_batches(self, svc):
+        inst, client = svc
+        client.change_resource_record_sets.side_effect = [None, client_error("Throttling")]
+        records = [
+            {"name": f"r{i}.x.com.", "type": "A", "ttl": 60, "values": ["10.0.0.1"]}
+            for i in range(600)
+        ]
+        with pytest.raises(DNSError, match="1 of 2 batches applied"):
+            inst.apply_record_changes("Z1", adds=records)
+
+    def test_zone_not_found(self, svc):
+        inst, client = svc
+        client.change_resource_record_sets.side_effect = client_error("NoSuchHostedZone")
+        with pytest.raises(ZoneNotFoundError):
+            inst.apply_record_changes(
+                "Z-bad", adds=[{"name": "a.", "type": "A", "ttl": 1, "values": ["1"]}]
+            )
+
+
 # --- list_records ---
 
 class TestListRecords:
@@ -146,8 +182,19 @@ class TestListRecords:
         assert records[0]["type"] == "NS"
         assert records[0]["values"] == ["ns1.aws.com."]
 
-    def test_not_found(self, svc):
+
+# --- missing zone ---
+
+class TestZoneNotFound:
+    @pytest.mark.parametrize(
+        "method, client_method",
+        [
+            ("delete_zone", "delete_hosted_zone"),
+            ("list_records", "list_resource_record_sets"),
+        ],
+    )
+    def test_not_found(self, svc, method, client_method):
         inst, client = svc
-        client.list_resource_record_sets.side_effect = _client_error("NoSuchHostedZone")
+        getattr(client, client_method).side_effect = client_error("NoSuchHostedZone")
         with pytest.raises(ZoneNotFoundError):
-            inst.list_records("Z-missing")
+            getattr(inst, method)("Z-missing")
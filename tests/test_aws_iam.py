@@ -2,19 +2,15 @@
 
 from unittest.mock import patch, MagicMock
 import pytest
-from botocore.exceptions import ClientError
 
 from cloudjack.aws.iam import IAM
-from cloudjack.base.config import AWSConfig
 from cloudjack.base.exceptions import (
     IAMError,
     RoleNotFoundError,
     RoleAlreadyExistsError,
 )
 
-
-def _client_error(code: str, msg: str = "error") -> ClientError:
-    return ClientError({"Error": {"Code": code, "Message": msg}}, "op")
+from tests.helpers import client_error, paginator_stub, sts_stub
 
 
 TRUST_POLICY = {
@@ -30,21 +26,15 @@ TRUST_POLICY = {
 
 
 @pytest.fixture
-def svc():
-    with patch("cloudjack.aws.iam.boto3") as mock_boto:
-        mock_iam_client = MagicMock()
-        mock_sts_client = MagicMock()
-        mock_sts_client.get_caller_identity.return_value = {"Account": "123456789012"}
-
-        def pick_client(service, **kwargs):
-            return {"iam": mock_iam_client, "sts": mock_sts_client}[service]
-
-        mock_boto.client.side_effect = pick_client
-        instance = IAM(AWSConfig(
-            aws_access_key_id="key",
-            aws_secret_access_key="secret",
-            region_name="us-east-1",
-        ))
+def svc(aws_config):
+    mock_iam_client = MagicMock()
+    clients = {"iam": mock_iam_client, "sts": sts_stub()}
+
+    def pick_client(service, **kwargs):
+        return clients[service]
+
+    with patch("cloudjack.aws.iam.boto3.client", side_effect=pick_client):
+        instance = IAM(aws_config)
         yield instance, mock_iam_client
 
 
@@ -68,13 +58,13 @@ class TestCreateRole:
 
     def test_already_exists(self, svc):
         inst, client = svc
-        client.create_role.side_effect = _client_error("EntityAlreadyExists")
+        client.create_role.side_effect = client_error("EntityAlreadyExists")
         with pytest.raises(RoleAlreadyExistsError):
             inst.create_role("dup", TRUST_POLICY)
 
     def test_generic_error(self, svc):
         inst, client = svc
-        client.create_role.side_effect = _client_error("ServiceFailure")
+        client.create_role.side_effect = client_error("ServiceFailure")
         with pytest.raises(IAMError):
             inst.create_role("fail", TRUST_POLICY)
 
@@ -87,21 +77,13 @@ class TestDeleteRole:
         inst.delete_role("test")
         client.delete_role.assert_called_once_with(RoleName="test")
 
-    def test_not_found(self, svc):
-        inst, client = svc
-        client.delete_role.side_effect = _client_error("NoSuchEntity")
-        with pytest.raises(RoleNotFoundError):
-            inst.delete_role("missing")
-
 
 # --- list_roles ---
 
 class TestListRoles:
     def test_success(self, svc):
         inst, client = svc
-        paginator = MagicMock()
-        client.get_paginator.return_value = paginator
-        paginator.paginate.return_value = [
+        paginator_stub(client, [
             {
                 "Roles": [
                     {
@@ -112,16 +94,14 @@ class TestListRoles:
                     }
                 ]
             }
-        ]
+        ])
         roles = inst.list_roles()
         assert len(roles) == 1
         assert roles[0]["role_name"] == "admin"
 
     def test_empty(self, svc):
         inst, client = svc
-        paginator = MagicMock()
-        client.get_paginator.return_value = paginator
-        paginator.paginate.return_value = [{"Roles": []}]
+        paginator_stub(client, [{"Roles": []}])
         assert inst.list_roles() == []
 
 
@@ -153,12 +133,6 @@ class TestAttachPolicy:
             PolicyArn=full_arn,
         )
 
-    def test_not_found(self, svc):
-        inst, client = svc
-        client.attach_role_policy.side_effect = _client_error("NoSuchEntity")
-        with pytest.raises(RoleNotFoundError):
-            inst.attach_policy("missing", "MyPolicy")
-
 
 # --- detach_policy ---
 
@@ -171,21 +145,13 @@ class TestDetachPolicy:
             PolicyArn="arn:aws:iam::aws:policy/ReadOnlyAccess",
         )
 
-    def test_not_found(self, svc):
-        inst, client = svc
-        client.detach_role_policy.side_effect = _client_error("NoSuchEntity")
-        with pytest.raises(RoleNotFoundError):
-            inst.detach_policy("missing", "MyPolicy")
-
 
 # --- list_policies ---
 
 class TestListPolicies:
     def test_success(self, svc):
         inst, client = svc
-        paginator = MagicMock()
-        client.get_paginator.return_value = paginator
-        paginator.paginate.return_value = [
+        paginator_stub(client, [
             {
                 "Policies": [
                     {
@@ -195,14 +161,30 @@ class TestListPolicies:
                     }
                 ]
             }
-        ]
+        ])
         policies = inst.list_policies()
         assert len(policies) == 1
         assert policies[0]["policy_name"] == "MyPolicy"
 
     def test_empty(self, svc):
         inst, client = svc
-        paginator = MagicMock()
-        client.get_paginator.return_value = paginator
-        paginator.paginate.return_value = [{"Policies": []}]
+        paginator_stub(client, [{"Policies": []}])
         assert inst.list_policies() == []
+
+
+# --- missing role ---
+
+class TestRoleNotFound:
+    @pytest.mark.parametrize(
+        "method, client_method, args",
+        [
+            ("delete_role", "delete_role", ("missing",)),
+            ("attach_policy", "attach_role_policy", ("missing", "MyPolicy")),
+            ("detach_policy", "detach_role_policy", ("missing", "MyPolicy")),
+        ],
+    )
+    def test_not_found(self, svc, method, client_method, args):
+        inst, client = svc
+        getattr(client, client_method).side_effect = client_error("NoSuchEntity")
+        with pytest.raises(RoleNotFoundError):
+            getattr(inst, method)(*args)
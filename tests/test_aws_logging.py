@@ -2,31 +2,22 @@
 
 from unittest.mock import patch, MagicMock
 import pytest
-from botocore.exceptions import ClientError
 
 from cloudjack.aws.logging_service import Logging
-from cloudjack.base.config import AWSConfig
 from cloudjack.base.exceptions import (
     LoggingError,
     LogGroupNotFoundError,
     LogGroupAlreadyExistsError,
 )
 
-
-def _client_error(code: str, msg: str = "error") -> ClientError:
-    return ClientError({"Error": {"Code": code, "Message": msg}}, "op")
+from tests.helpers import client_error, paginator_stub
 
 
 @pytest.fixture
-def svc():
-    with patch("cloudjack.aws.logging_service.boto3") as mock_boto:
-        mock_client = MagicMock()
-        mock_boto.client.return_value = mock_client
-        instance = Logging(AWSConfig(
-            aws_access_key_id="key",
-            aws_secret_access_key="secret",
-            region_name="us-east-1",
-        ))
+def svc(aws_config):
+    mock_client = MagicMock()
+    with patch("cloudjack.aws.logging_service.boto3.client", return_value=mock_client):
+        instance = Logging(aws_config)
         yield instance, mock_client
 
 
@@ -48,13 +39,13 @@ class TestCreateLogGroup:
 
     def test_already_exists(self, svc):
         inst, client = svc
-        client.create_log_group.side_effect = _client_error("ResourceAlreadyExistsException")
+        client.create_log_group.side_effect = client_error("ResourceAlreadyExistsException")
         with pytest.raises(LogGroupAlreadyExistsError):
             inst.create_log_group("dup")
 
     def test_generic_error(self, svc):
         inst, client = svc
-        client.create_log_group.side_effect = _client_error("ServiceUnavailableException")
+        client.create_log_group.side_effect = client_error("ServiceUnavailableException")
         with pytest.raises(LoggingError):
             inst.create_log_group("fail")
 
@@ -67,45 +58,33 @@ class TestDeleteLogGroup:
         inst.delete_log_group("/app/logs")
         client.delete_log_group.assert_called_once_with(logGroupName="/app/logs")
 
-    def test_not_found(self, svc):
-        inst, client = svc
-        client.delete_log_group.side_effect = _client_error("ResourceNotFoundException")
-        with pytest.raises(LogGroupNotFoundError):
-            inst.delete_log_group("missing")
-
 
 # --- list_log_groups ---
 
 class TestListLogGroups:
     def test_success(self, svc):
         inst, client = svc
-        paginator = MagicMock()
-        client.get_paginator.return_value = paginator
-        paginator.paginate.return_value = [
+        paginator_stub(client, [
             {
                 "logGroups": [
                     {"logGroupName": "/app/web"},
                     {"logGroupName": "/app/api"},
                 ]
             }
-        ]
+        ])
         groups = inst.list_log_groups()
         assert groups == ["/app/web", "/app/api"]
 
     def test_with_prefix(self, svc):
         inst, client = svc
-        paginator = MagicMock()
-        client.get_paginator.return_value = paginator
-        paginator.paginate.return_value = [{"logGroups": [{"logGroupName": "/app/web"}]}]
+        paginator = paginator_stub(client, [{"logGroups": [{"logGroupName": "/app/web"}]}])
         inst.list_log_groups(prefix="/app")
         client.get_paginator.assert_called_once_with("describe_log_groups")
         paginator.paginate.assert_called_once_with(logGroupNamePrefix="/app")
 
     def test_empty(self, svc):
         inst, client = svc
-        paginator = MagicMock()
-        client.get_paginator.return_value = paginator
-        paginator.paginate.return_value = [{"logGroups": []}]
+        paginator_stub(client, [{"logGroups": []}])
         assert inst.list_log_groups() == []
 
 
@@ -137,7 +116,7 @@ class TestWriteLog:
 
     def test_error(self, svc):
         inst, client = svc
-        client.put_log_events.side_effect = _client_error("ResourceNotFoundException")
+        client.put_log_events.side_effect = client_error("ResourceNotFoundException")
         with pytest.raises(LogGroupNotFoundError):
             inst.write_log("missing", "msg")
 
@@ -169,8 +148,19 @@ class TestReadLogs:
         client.filter_log_events.return_value = {"events": []}
         assert inst.read_logs("/app/logs") == []
 
-    def test_error(self, svc):
+
+# --- missing log group ---
+
+class TestLogGroupNotFound:
+    @pytest.mark.parametrize(
+        "method, client_method",
+        [
+            ("delete_log_group", "delete_log_group"),
+            ("read_logs", "filter_log_events"),
+        ],
+    )
+    def test_not_found(self, svc, method, client_method):
         inst, client = svc
-        client.filter_log_events.side_effect = _client_error("ResourceNotFoundException")
+        getattr(client, client_method).side_effect = client_error("ResourceNotFoundException")
         with pytest.raises(LogGroupNotFoundError):
-            inst.read_logs("missing")
+            getattr(inst, method)("missing")
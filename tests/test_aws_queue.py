@@ -1,11 +1,9 @@
 """Tests for AWS SQS Queue service."""
 
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, Mock
 import pytest
-from botocore.exceptions import ClientError
 
 from cloudjack.aws.queue import Queue
-from cloudjack.base.config import AWSConfig
 from cloudjack.base.exceptions import (
     QueueError,
     QueueNotFoundError,
@@ -13,21 +11,28 @@ from cloudjack.base.exceptions import (
     MessageError,
 )
 
+from tests.helpers import client_error
 
-def _client_error(code: str, msg: str = "error") -> ClientError:
-    return ClientError({"Error": {"Code": code, "Message": msg}}, "op")
+
+# The SQS API calls Queue makes.
+_SQS_METHODS = [
+    "create_queue",
+    "delete_queue",
+    "list_queues",
+    "send_message",
+    "send_message_batch",
+    "receive_message",
+    "delete_message",
+    "delete_message_batch",
+]
 
 
 @pytest.fixture
-def svc():
+def svc(aws_config):
     with patch("cloudjack.aws.queue.boto3") as mock_boto:
-        mock_client = MagicMock()
+        mock_client = Mock(spec_set=_SQS_METHODS)
         mock_boto.client.return_value = mock_client
-        instance = Queue(AWSConfig(
-            aws_access_key_id="key",
-            aws_secret_access_key="secret",
-            region_name="us-east-1",
-        ))
+        instance = Queue(aws_config)
         yield instance, mock_client
 
 
@@ -49,18 +54,19 @@ class TestCreateQueue:
         assert call_kwargs[1]["Attributes"]["DelaySeconds"] == "5"
         assert call_kwargs[1]["Attributes"]["VisibilityTimeout"] == "30"
 
-    def test_already_exists(self, svc):
+    @pytest.mark.parametrize(
+        "code, exc",
+        [
+            ("QueueAlreadyExists", QueueAlreadyExistsError),
+            ("UnknownError", QueueError),
+        ],
+    )
+    def test_errors(self, svc, code, exc):
         inst, client = svc
-        client.create_queue.side_effect = _client_error("QueueAlreadyExists")
-        with pytest.raises(QueueAlreadyExistsError):
+        client.create_queue.side_effect = client_error(code)
+        with pytest.raises(exc):
             inst.create_queue("existing")
 
-    def test_generic_error(self, svc):
-        inst, client = svc
-        client.create_queue.side_effect = _client_error("UnknownError")
-        with pytest.raises(QueueError):
-            inst.create_queue("fail")
-
 
 # --- delete_queue ---
 
@@ -72,7 +78,7 @@ class TestDeleteQueue:
 
     def test_not_found(self, svc):
         inst, client = svc
-        client.delete_queue.side_effect = _client_error("AWS.SimpleQueueService.NonExistentQueue")
+        client.delete_queue.side_effect = client_error("AWS.SimpleQueueService.NonExistentQueue")
         with pytest.raises(QueueNotFoundError):
             inst.delete_queue("missing")
 
@@ -115,11 +121,75 @@ class TestSendMessage:
 
     def test_error(self, svc):
         inst, client = svc
-        client.send_message.side_effect = _client_error("ServiceUnavailable")
+        client.send_message.side_effect = client_error("ServiceUnavailable")
         with pytest.raises(MessageError):
             inst.send_message("url", "body")
 
 
+# --- send_message_batch ---
+
+class TestSendMessageBatch:
+    def test_success(self, svc):
+        inst, client = svc
+        client.send_message_batch.return_value = {
+            "Successful": [
+                {"Id": "1", "MessageId": "m1"},
+                {"Id": "0", "MessageId": "m0"},
+            ]
+        }
+        assert inst.send_message_batch("url", ["a", "b"]) == ["m0", "m1"]
+        client.send_message_batch.assert_called_once_with(
+            QueueUrl="url",
+            Entries=[
+                {"Id": "0", "MessageBody": "a"},
+                {"Id": "1", "MessageBody": "b"},
+            ],
+        )
+
+    def test_chunks_at_10_entries(self, svc):
+        inst, client = svc
+        client.send_message_batch.return_value = {}
+        inst.send_message_batch("url", ["x"] * 23)
+        sizes = [len(c.kwargs["Entries"]) for c in client.send_message_batch.call_args_list]
+        assert sizes == [10, 10, 3]
+
+    def test_chunks_at_256_kib(self, svc):
+        inst, client = svc
+        client.send_message_batch.return_value = {}
+        inst.send_message_batch("url", ["x" * 100_000] * 3)
+        sizes = [len(c.kwargs["Entries"]) for c in client.send_message_batch.call_args_list]
+        assert sizes == [2, 1]
+
+    def test_with_delay(self, svc):
+        inst, client = svc
+        client.send_message_batch.return_value = {}
+        inst.send_message_batch("url", ["a"], delay_seconds=5)
+        entry = client.send_message_batch.call_args.kwargs["Entries"][0]
+        assert entry["DelaySeconds"] == 5
+
+    def test_failed_entries(self, svc):
+        inst, client = svc
+        client.send_message_batch.return_value = {"Failed": [{"Id": "0"}]}
+        with pytest.raises(MessageError):
+            inst.send_message_batch("url", ["a"])
+
+    def test_error(self, svc):
+        inst, client = svc
+        client.send_message_batch.side_effect = client_error("ServiceUnavailable")
+        with pytest.raises(MessageError):
+            inst.send_message_batch("url", ["a"])
+
+    def test_stops_at_first_failed_batch(self, svc):
+        inst, client = svc
+        client.send_message_batch.side_effect = [
+            {"Successful": [{"Id": str(i), "MessageId": f"m{i}"} for i in range(10)]},
+            client_error("ServiceUnavailable"),
+        ]
+        with pytest.raises(MessageError, match="10 of 25 sent"):
+            inst.send_message_batch("url", ["x"] * 25)
+        assert client.send_message_batch.call_count == 2
+
+
 # --- receive_messages ---
 
 class TestReceiveMessages:
@@ -159,6 +229,46 @@ class TestDeleteMessage:
 
     def test_error(self, svc):
         inst, client = svc
-        client.delete_message.side_effect = _client_error("ReceiptHandleIsInvalid")
+        client.delete_message.side_effect = client_error("ReceiptHandleIsInvalid")
         with pytest.raises(MessageError):
             inst.delete_message("url", "bad")
+
+
+# --- delete_messages ---
+
+class TestDeleteMessages:
+    def test_success(self, svc):
+        inst, client = svc
+        client.delete_message_batch.return_value = {"Successful": [{"Id": "0"}]}
+        inst.delete_messages("url", ["rh1", "rh2"])
+        client.delete_message_batch.assert_called_once_with(
+            QueueUrl="url",
+            Entries=[
+                {"Id": "0", "ReceiptHandle": "rh1"},
+                {"Id": "1", "ReceiptHandle": "rh2"},
+            ],
+        )
+
+    def test_chunks_at_10_entries(self, svc):
+        inst, client = svc
+        client.delete_message_batch.return_value = {}
+        inst.delete_messages("url", [f"rh{i}" for i in range(25)])
+        sizes = [
+            len(c.kwargs["Entries"])
+            for c in client.delete_message_batch.call_args_list
+        ]
+        assert sizes == [10, 10, 5]
+
+    def test_failed_entries(self, svc):
+        inst, client = svc
+        client.delete_message_batch.return_value = {
+            "Failed": [{"Id": "0", "Code": "ReceiptHandleIsInvalid"}]
+        }
+        with pytest.raises(MessageError):
+            inst.delete_messages("url", ["bad"])
+
+    def test_error(self, svc):
+        inst, client = svc
+        client.delete_message_batch.side_effect = client_error("ServiceUnavailable")
+        with pytest.raises(MessageError):
+            inst.delete_messages("url", ["rh1"])
@@ -1,37 +1,37 @@
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, Mock
 import pytest
-from botocore.exceptions import ClientError
 
 from cloudjack.aws.secret_manager import SecretManager
-from cloudjack.base.config import AWSConfig
 from cloudjack.base.exceptions import (
     SecretManagerError,
     SecretAlreadyExistsError,
     SecretNotFoundError,
 )
 
+from tests.helpers import client_error, sts_stub
 
-def _client_error(code: str, message: str = "error") -> ClientError:
-    return ClientError({"Error": {"Code": code, "Message": message}}, "op")
+
+# The Secrets Manager API calls SecretManager makes.
+_SECRETS_METHODS = [
+    "get_secret_value",
+    "create_secret",
+    "update_secret",
+    "delete_secret",
+]
 
 
 @pytest.fixture
-def sm():
+def sm(aws_config):
     with patch("cloudjack.aws.secret_manager.boto3") as mock_boto:
-        mock_sts = MagicMock()
-        mock_sts.get_caller_identity.return_value = {"Account": "123456789012"}
-        mock_sm_client = MagicMock()
+        mock_sm_client = Mock(spec_set=_SECRETS_METHODS)
+        clients = {"sts": sts_stub(), "secretsmanager": mock_sm_client}
 
         def pick_client(service, **kwargs):
-            return {"sts": mock_sts, "secretsmanager": mock_sm_client}[service]
+            return clients[service]
 
         mock_boto.client.side_effect = pick_client
 
-        instance = SecretManager(AWSConfig(
-            aws_access_key_id="key",
-            aws_secret_access_key="secret",
-            region_name="us-east-1",
-        ))
+        instance = SecretManager(aws_config)
         yield instance, mock_sm_client
 
 
@@ -45,18 +45,19 @@ class TestGetSecret:
         assert instance.get_secret("my_secret") == "my_value"
         client.get_secret_value.assert_called_once()
 
-    def test_not_found(self, sm):
+    @pytest.mark.parametrize(
+        "code, exc",
+        [
+            ("ResourceNotFoundException", SecretNotFoundError),
+            ("InternalServiceError", SecretManagerError),
+        ],
+    )
+    def test_errors(self, sm, code, exc):
         instance, client = sm
-        client.get_secret_value.side_effect = _client_error("ResourceNotFoundException")
-        with pytest.raises(SecretNotFoundError):
+        client.get_secret_value.side_effect = client_error(code)
+        with pytest.raises(exc):
             instance.get_secret("missing")
 
-    def test_generic_error(self, sm):
-        instance, client = sm
-        client.get_secret_value.side_effect = _client_error("InternalServiceError")
-        with pytest.raises(SecretManagerError):
-            instance.get_secret("fail")
-
 
 # --- create_secret ---
 
@@ -67,18 +68,19 @@ class TestCreateSecret:
         instance.create_secret("new", "value")
         client.create_secret.assert_called_once_with(Name="new", SecretString="value")
 
-    def test_already_exists(self, sm):
+    @pytest.mark.parametrize(
+        "code, exc",
+        [
+            ("ResourceExistsException", SecretAlreadyExistsError),
+            ("InternalServiceError", SecretManagerError),
+        ],
+    )
+    def test_errors(self, sm, code, exc):
         instance, client = sm
-        client.create_secret.side_effect = _client_error("ResourceExistsException")
-        with pytest.raises(SecretAlreadyExistsError):
+        client.create_secret.side_effect = client_error(code)
+        with pytest.raises(exc):
             instance.create_secret("dup", "value")
 
-    def test_generic_error(self, sm):
-        instance, client = sm
-        client.create_secret.side_effect = _client_error("InternalServiceError")
-        with pytest.raises(SecretManagerError):
-            instance.create_secret("fail", "value")
-
 
 # --- update_secret ---
 
@@ -89,18 +91,19 @@ class TestUpdateSecret:
         instance.update_secret("existing", "new_val")
         client.update_secret.assert_called_once()
 
-    def test_not_found(self, sm):
+    @pytest.mark.parametrize(
+        "code, exc",
+        [
+            ("ResourceNotFoundException", SecretNotFoundError),
+            ("InternalServiceError", SecretManagerError),
+        ],
+    )
+    def test_errors(self, sm, code, exc):
         instance, client = sm
-        client.update_secret.side_effect = _client_error("ResourceNotFoundException")
-        with pytest.raises(SecretNotFoundError):
+        client.update_secret.side_effect = client_error(code)
+        with pytest.raises(exc):
             instance.update_secret("missing", "val")
 
-    def test_generic_error(self, sm):
-        instance, client = sm
-        client.update_secret.side_effect = _client_error("InternalServiceError")
-        with pytest.raises(SecretManagerError):
-            instance.update_secret("fail", "val")
-
 
 # --- delete_secret ---
 
@@ -111,14 +114,15 @@ class TestDeleteSecret:
         instance.delete_secret("existing")
         client.delete_secret.assert_called_once()
 
-    def test_not_found(self, sm):
+    @pytest.mark.parametrize(
+        "code, exc",
+        [
+            ("ResourceNotFoundException", SecretNotFoundError),
+            ("InternalServiceError", SecretManagerError),
+        ],
+    )
+    def test_errors(self, sm, code, exc):
         instance, client = sm
-        client.delete_secret.side_effect = _client_error("ResourceNotFoundException")
-        with pytest.raises(SecretNotFoundError):
+        client.delete_secret.side_effect = client_error(code)
+        with pytest.raises(exc):
             instance.delete_secret("missing")
-
-    def test_generic_error(self, sm):
-        instance, client = sm
-        client.delete_secret.side_effect = _client_error("InternalServiceError")
-        with pytest.raises(SecretManagerError):
-            instance.delete_secret("fail")
@@ -1,6 +1,5 @@
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, Mock
 import pytest
-from botocore.exceptions import ClientError
 
 from cloudjack.aws.storage import Storage
 from cloudjack.base.config import AWSConfig
@@ -11,15 +10,29 @@ from cloudjack.base.exceptions import (
     ObjectNotFoundError,
 )
 
+from tests.helpers import client_error, paginator_stub
 
-def _client_error(code: str) -> ClientError:
-    return ClientError({"Error": {"Code": code, "Message": "err"}}, "op")
+
+# The S3 API calls Storage makes.
+_S3_METHODS = [
+    "create_bucket",
+    "delete_bucket",
+    "list_buckets",
+    "upload_file",
+    "put_object",
+    "download_file",
+    "get_object",
+    "delete_object",
+    "delete_objects",
+    "get_paginator",
+    "generate_presigned_url",
+]
 
 
 @pytest.fixture
 def storage():
     with patch("cloudjack.aws.storage.boto3") as mock_boto:
-        mock_client = MagicMock()
+        mock_client = Mock(spec_set=_S3_METHODS)
         mock_boto.client.return_value = mock_client
         instance = Storage(AWSConfig(
             aws_access_key_id="key",
@@ -44,24 +57,20 @@ class TestCreateBucket:
         call_kwargs = client.create_bucket.call_args
         assert "CreateBucketConfiguration" in call_kwargs.kwargs
 
-    def test_already_exists(self, storage):
-        instance, client = storage
-        client.create_bucket.side_effect = _client_error("BucketAlreadyExists")
-        with pytest.raises(BucketAlreadyExistsError):
-            instance.create_bucket("dup")
-
-    def test_already_owned(self, storage):
+    @pytest.mark.parametrize(
+        "code, exc",
+        [
+            ("BucketAlreadyExists", BucketAlreadyExistsError),
+            ("BucketAlreadyOwnedByYou", BucketAlreadyExistsError),
+            ("AccessDenied", StorageError),
+        ],
+    )
+    def test_errors(self, storage, code, exc):
         instance, client = storage
-        client.create_bucket.side_effect = _client_error("BucketAlreadyOwnedByYou")
-        with pytest.raises(BucketAlreadyExistsError):
+        client.create_bucket.side_effect = client_error(code)
+        with pytest.raises(exc):
             instance.create_bucket("dup")
 
-    def test_generic_error(self, storage):
-        instance, client = storage
-        client.create_bucket.side_effect = _client_error("AccessDenied")
-        with pytest.raises(StorageError):
-            instance.create_bucket("fail")
-
 
 class TestDeleteBucket:
     def test_success(self, storage):
@@ -71,7 +80,7 @@ class TestDeleteBucket:
 
     def test_not_found(self, storage):
         instance, client = storage
-        client.delete_bucket.side_effect = _client_error("NoSuchBucket")
+        client.delete_bucket.side_effect = client_error("NoSuchBucket")
         with pytest.raises(BucketNotFoundError):
             instance.delete_bucket("missing")
 
@@ -91,7 +100,7 @@ class TestListBuckets:
 
     def test_error(self, storage):
         instance, client = storage
-        client.list_buckets.side_effect = _client_error("AccessDenied")
+        client.list_buckets.side_effect = client_error("AccessDenied")
         with pytest.raises(StorageError):
             instance.list_buckets()
 
@@ -107,7 +116,7 @@ class TestUploadObjectFromFile:
 
     def test_bucket_not_found(self, storage):
         instance, client = storage
-        client.upload_file.side_effect = _client_error("NoSuchBucket")
+        client.upload_file.side_effect = client_error("NoSuchBucket")
         with pytest.raises(BucketNotFoundError):
             instance.upload_object_from_file("missing", "key", "/tmp/file")
 
@@ -118,18 +127,19 @@ class TestDownloadFile:
         instance.download_file("bucket", "key", "/tmp/dest")
         client.download_file.assert_called_once_with("bucket", "key", "/tmp/dest")
 
-    def test_object_not_found(self, storage):
+    @pytest.mark.parametrize(
+        "code, exc",
+        [
+            ("404", ObjectNotFoundError),
+            ("NoSuchBucket", BucketNotFoundError),
+        ],
+    )
+    def test_errors(self, storage, code, exc):
         instance, client = storage
-        client.download_file.side_effect = _client_error("404")
-        with pytest.raises(ObjectNotFoundError):
+        client.download_file.side_effect = client_error(code)
+        with pytest.raises(exc):
             instance.download_file("bucket", "missing", "/tmp/dest")
 
-    def test_bucket_not_found(self, storage):
-        instance, client = storage
-        client.download_file.side_effect = _client_error("NoSuchBucket")
-        with pytest.raises(BucketNotFoundError):
-            instance.download_file("missing", "key", "/tmp/dest")
-
 
 class TestDeleteObject:
     def test_success(self, storage):
@@ -139,44 +149,101 @@ class TestDeleteObject:
 
     def test_bucket_not_found(self, storage):
         instance, client = storage
-        client.delete_object.side_effect = _client_error("NoSuchBucket")
+        client.delete_object.side_effect = client_error("NoSuchBucket")
         with pytest.raises(BucketNotFoundError):
             instance.delete_object("missing", "key")
 
 
+class TestDeleteObjects:
+    def test_success(self, storage):
+        instance, client = storage
+        client.delete_objects.return_value = {"Deleted": [{"Key": "a"}, {"Key": "b"}]}
+        assert instance.delete_objects("bucket", ["a", "b"]) == ["a", "b"]
+        client.delete_objects.assert_called_once_with(
+            Bucket="bucket",
+            Delete={"Objects": [{"Key": "a"}, {"Key": "b"}], "Quiet": False},
+        )
+
+    def test_chunks_at_1000_keys(self, storage):
+        instance, client = storage
+        client.delete_objects.return_value = {}
+        instance.delete_objects("bucket", (f"k{i}" for i in range(2500)))
+        sizes = [
+            len(c.kwargs["Delete"]["Objects"])
+            for c in client.delete_objects.call_args_list
+        ]
+        assert sizes == [1000, 1000, 500]
+
+    def test_empty(self, storage):
+        instance, client = storage
+        assert instance.delete_objects("bucket", []) == []
+        client.delete_objects.assert_not_called()
+
+    def test_partial_failure(self, storage):
+        instance, client = storage
+        client.delete_objects.return_value = {
+            "Deleted": [{"Key": "a"}],
+            "Errors": [{"Key": "b", "Code": "AccessDenied"}],
+        }
+        with pytest.raises(StorageError, match="b"):
+            instance.delete_objects("bucket", ["a", "b"])
+
+    def test_failure_message_lists_first_keys_only(self, storage):
+        instance, client = storage
+        keys = [f"k{i}" for i in range(1500)]
+        client.delete_objects.side_effect = lambda Bucket, Delete: {
+            "Errors": [{"Key": o["Key"], "Code": "AccessDenied"} for o in Delete["Objects"]]
+        }
+        with pytest.raises(StorageError) as exc:
+            instance.delete_objects("bucket", keys)
+        assert client.delete_objects.call_count == 2
+        assert str(exc.value) == (
+            "Failed to delete 1500 object(s) from 'bucket': "
+            "k0, k1, k2, k3, k4 and 1495 more."
+        )
+
+    def test_bucket_not_found(self, storage):
+        instance, client = storage
+        client.delete_objects.side_effect = client_error("NoSuchBucket")
+        with pytest.raises(BucketNotFoundError):
+            instance.delete_objects("missing", ["a"])
+
+
 class TestListObjects:
     def test_success(self, storage):
         instance, client = storage
-        paginator = MagicMock()
-        paginator.paginate.return_value = [
+        paginator_stub(client, [
             {"Contents": [{"Key": "a.txt"}, {"Key": "b.txt"}]},
             {"Contents": [{"Key": "c.txt"}]},
-        ]
-        client.get_paginator.return_value = paginator
+        ])
         assert instance.list_objects("bucket") == ["a.txt", "b.txt", "c.txt"]
 
+    def test_iter_yields_before_last_page(self, storage):
+        instance, client = storage
+
+        def pages():
+            yield {"Contents": [{"Key": "a.txt"}]}
+            raise AssertionError("second page fetched too early")
+
+        paginator_stub(client, pages())
+        assert next(instance.iter_objects("bucket")) == "a.txt"
+
     def test_empty(self, storage):
         instance, client = storage
-        paginator = MagicMock()
-        paginator.paginate.return_value = [{}]
-        client.get_paginator.return_value = paginator
+        paginator_stub(client, [{}])
         assert instance.list_objects("bucket") == []
 
     def test_with_prefix(self, storage):
         instance, client = storage
-        paginator = MagicMock()
-        paginator.paginate.return_value = [
+        paginator = paginator_stub(client, [
             {"Contents": [{"Key": "data/a.csv"}]},
-        ]
-        client.get_paginator.return_value = paginator
+        ])
         instance.list_objects("bucket", prefix="data/")
         paginator.paginate.assert_called_once_with(Bucket="bucket", Prefix="data/")
 
     def test_bucket_not_found(self, storage):
         instance, client = storage
-        paginator = MagicMock()
-        paginator.paginate.side_effect = _client_error("NoSuchBucket")
-        client.get_paginator.return_value = paginator
+        paginator_stub(client, client_error("NoSuchBucket"))
         with pytest.raises(BucketNotFoundError):
             instance.list_objects("missing")
 
@@ -189,87 +256,65 @@ class TestGetObject:
         client.get_object.return_value = {"Body": body}
         assert instance.get_object("bucket", "key") == b"hello"
 
-    def test_not_found(self, storage):
+    @pytest.mark.parametrize(
+        "code, exc",
+        [
+            ("NoSuchKey", ObjectNotFoundError),
+            ("NoSuchBucket", BucketNotFoundError),
+        ],
+    )
+    def test_errors(self, storage, code, exc):
         instance, client = storage
-        client.get_object.side_effect = _client_error("NoSuchKey")
-        with pytest.raises(ObjectNotFoundError):
+        client.get_object.side_effect = client_error(code)
+        with pytest.raises(exc):
             instance.get_object("bucket", "missing")
 
-    def test_bucket_not_found(self, storage):
-        instance, client = storage
-        client.get_object.side_effect = _client_error("NoSuchBucket")
-        with pytest.raises(BucketNotFoundError):
-            instance.get_object("missing", "key")
-
 
 class TestGenerateSignedUrl:
-    def test_defaults(self, storage):
+    @pytest.mark.parametrize(
+        "kwargs, expiration, operation, extra_params, http_method",
+        [
+            ({}, 3600, "get_object", {}, "GET"),
+            (
+                {"method": "PUT", "content_type": "application/json"},
+                7200,
+                "put_object",
+                {"ContentType": "application/json"},
+                "PUT",
+            ),
+            (
+                {
+                    "response_disposition": 'attachment; filename="f.txt"',
+                    "response_type": "application/octet-stream",
+                },
+                3600,
+                "get_object",
+                {
+                    "ResponseContentDisposition": 'attachment; filename="f.txt"',
+                    "ResponseContentType": "application/octet-stream",
+                },
+                "GET",
+            ),
+            ({"method": "DELETE"}, 900, "delete_object", {}, "DELETE"),
+        ],
+        ids=["defaults", "put_with_content_type", "response_params", "delete"],
+    )
+    def test_signs_request(
+        self, storage, kwargs, expiration, operation, extra_params, http_method
+    ):
         instance, client = storage
         client.generate_presigned_url.return_value = "https://signed-url"
-        url = instance.generate_signed_url("bucket", "key", 3600)
+        url = instance.generate_signed_url("bucket", "key", expiration, **kwargs)
         assert url == "https://signed-url"
         client.generate_presigned_url.assert_called_once_with(
-            "get_object",
-            Params={"Bucket": "bucket", "Key": "key"},
-            ExpiresIn=3600,
-            HttpMethod="GET",
-        )
-
-    def test_put_method_with_content_type(self, storage):
-        instance, client = storage
-        client.generate_presigned_url.return_value = "https://put-url"
-        url = instance.generate_signed_url(
-            "bucket", "key", 7200,
-            method="PUT",
-            content_type="application/json",
-        )
-        assert url == "https://put-url"
-        client.generate_presigned_url.assert_called_once_with(
-            "put_object",
-            Params={
-                "Bucket": "bucket",
-                "Key": "key",
-                "ContentType": "application/json",
-            },
-            ExpiresIn=7200,
-            HttpMethod="PUT",
-        )
-
-    def test_response_params(self, storage):
-        instance, client = storage
-        client.generate_presigned_url.return_value = "https://dl-url"
-        url = instance.generate_signed_url(
-            "bucket", "key", 3600,
-            response_disposition='attachment; filename="f.txt"',
-            response_type="application/octet-stream",
-        )
-        assert url == "https://dl-url"
-        client.generate_presigned_url.assert_called_once_with(
-            "get_object",
-            Params={
-                "Bucket": "bucket",
-                "Key": "key",
-                "ResponseContentDisposition": 'attachment; filename="f.txt"',
-                "ResponseContentType": "application/octet-stream",
-            },
-            ExpiresIn=3600,
-            HttpMethod="GET",
-        )
-
-    def test_delete_method(self, storage):
-        instance, client = storage
-        client.generate_presigned_url.return_value = "https://del-url"
-        url = instance.generate_signed_url("bucket", "key", 900, method="DELETE")
-        assert url == "https://del-url"
-        client.generate_presigned_url.assert_called_once_with(
-            "delete_object",
-            Params={"Bucket": "bucket", "Key": "key"},
-            ExpiresIn=900,
-            HttpMethod="DELETE",
+            operation,
+            Params={"Bucket": "bucket", "Key": "key", **extra_params},
+            ExpiresIn=expiration,
+            HttpMethod=http_method,
         )
 
     def test_error(self, storage):
         instance, client = storage
-        client.generate_presigned_url.side_effect = _client_error("AccessDenied")
+        client.generate_presigned_url.side_effect = client_error("AccessDenied")
         with pytest.raises(StorageError):
             instance.generate_signed_url("bucket", "key", 3600)
@@ -3,13 +3,29 @@
 from unittest.mock import patch, MagicMock
 import asyncio
 import logging
+import socket
+import socketserver
+import threading
+import time
 import pytest
 
 from cloudjack.base.config import AWSConfig, GCPConfig, validate_config
 from cloudjack.base.retry import retry
 from cloudjack.base.client_cache import ClientCache
 from cloudjack.base.logger import CloudjackLogger, StructuredFormatter
+from cloudjack.base.prefetch import prefetch
 from cloudjack.base.async_support import async_wrap, AsyncMixin
+from cloudjack.base.queue import QueueService
+from cloudjack.cli import (
+    OperationError,
+    _DaemonHandler,
+    _build_parser,
+    _credential_env,
+    _forward,
+    _prepare_forward,
+    _remove_stale_socket,
+    main,
+)
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -45,6 +61,17 @@ class TestGCPConfig:
         cfg = GCPConfig()
         assert cfg.project_id == "env-proj"
 
+    def test_key_file_loaded_once(self, tmp_path):
+        key = tmp_path / "key.json"
+        key.write_text("{}")
+        with patch(
+            "google.oauth2.service_account.Credentials.from_service_account_file"
+        ) as load:
+            a = GCPConfig(project_id="p", credentials_path=str(key))
+            b = GCPConfig(project_id="q", credentials_path=str(key))
+        load.assert_called_once()
+        assert a.credentials is b.credentials
+
 
 class TestValidateConfig:
     def test_aws(self):
@@ -70,6 +97,13 @@ class TestValidateConfig:
 # ══════════════════════════════════════════════════════════════════════
 
 class TestRetry:
+    @pytest.fixture(autouse=True)
+    def sleeps(self, monkeypatch):
+        # Record backoff delays instead of sleeping through them.
+        calls: list[float] = []
+        monkeypatch.setattr(time, "sleep", calls.append)
+        return calls
+
     def test_success_no_retry(self):
         call_count = 0
 
@@ -82,7 +116,7 @@ class TestRetry:
         assert ok() == "ok"
         assert call_count == 1
 
-    def test_retries_on_failure(self):
+    def test_retries_on_failure(self, sleeps):
         call_count = 0
 
         @retry(max_attempts=3, base_delay=0, retryable_exceptions=(ValueError,))
@@ -95,6 +129,21 @@ class TestRetry:
 
         assert fail_twice() == "ok"
         assert call_count == 3
+        assert sleeps == [0, 0]
+
+    def test_backoff_schedule(self, sleeps):
+        @retry(
+            max_attempts=5,
+            base_delay=1.0,
+            max_delay=5.0,
+            retryable_exceptions=(ValueError,),
+        )
+        def always_fail():
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError):
+            always_fail()
+        assert sleeps == [1.0, 2.0, 4.0, 5.0]
 
     def test_max_attempts_exceeded(self):
         @retry(max_attempts=2, base_delay=0, retryable_exceptions=(ValueError,))
@@ -118,43 +167,101 @@ class TestRetry:
         assert call_count == 1
 
 
+# ══════════════════════════════════════════════════════════════════════
+# Prefetch
+# ══════════════════════════════════════════════════════════════════════
+
+class TestPrefetch:
+    def test_preserves_order(self):
+        assert list(prefetch(range(10), depth=3)) == list(range(10))
+
+    def test_reraises_source_error(self):
+        def source():
+            yield 1
+            raise ValueError("boom")
+
+        it = prefetch(source())
+        assert next(it) == 1
+        with pytest.raises(ValueError, match="boom"):
+            next(it)
+
+    def test_reads_ahead_at_most_depth(self):
+        produced = []
+
+        def source():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        it = prefetch(source(), depth=2)
+        assert next(it) == 0
+        time.sleep(0.2)  # give the worker time to run ahead
+        # One item handed out, two buffered, one blocked in put().
+        assert len(produced) <= 4
+        it.close()
+
+    def test_close_stops_worker(self):
+        stopped = threading.Event()
+
+        def source():
+            try:
+                while True:
+                    yield 1
+            finally:
+                stopped.set()
+
+        it = prefetch(source(), depth=1)
+        next(it)
+        it.close()
+        assert stopped.wait(2)
+
+    def test_rejects_zero_depth(self):
+        with pytest.raises(ValueError):
+            prefetch([1], depth=0)
+
+
 # ══════════════════════════════════════════════════════════════════════
 # Client Cache
 # ══════════════════════════════════════════════════════════════════════
 
 class TestClientCache:
-    def test_singleton(self):
-        a = ClientCache()
-        b = ClientCache()
-        assert a is b
-
-    def test_caches_client(self):
+    @pytest.fixture
+    def cache(self):
         cache = ClientCache()
         cache.clear()
+        yield cache
+        cache.clear()
+
+    def test_singleton(self, cache):
+        assert ClientCache() is cache
+
+    def test_caches_client(self, cache):
         factory = MagicMock(return_value="client_instance")
         c1 = cache.get_or_create("aws", "s3", {"region": "us-east-1"}, factory)
         c2 = cache.get_or_create("aws", "s3", {"region": "us-east-1"}, factory)
         assert c1 == c2
         factory.assert_called_once()
 
-    def test_different_config_different_client(self):
-        cache = ClientCache()
-        cache.clear()
+    def test_different_config_different_client(self, cache):
         factory = MagicMock(side_effect=["client_a", "client_b"])
         c1 = cache.get_or_create("aws", "s3", {"region": "us-east-1"}, factory)
         c2 = cache.get_or_create("aws", "s3", {"region": "eu-west-1"}, factory)
         assert c1 != c2
         assert factory.call_count == 2
 
-    def test_clear(self):
-        cache = ClientCache()
-        cache.clear()
+    def test_clear(self, cache):
         factory = MagicMock(side_effect=["v1", "v2"])
         cache.get_or_create("aws", "s3", {}, factory)
         cache.clear()
         c2 = cache.get_or_create("aws", "s3", {}, factory)
         assert c2 == "v2"
 
+    def test_clear_closes_evicted_instances(self, cache):
+        svc = MagicMock()
+        cache.get_or_create("gcp", "storage", {}, lambda config: svc)
+        cache.clear()
+        svc.close.assert_called_once_with()
+
 
 # ══════════════════════════════════════════════════════════════════════
 # Logger
@@ -213,3 +320,162 @@ class TestAsyncMixin:
         assert hasattr(svc, "ado_work")
         result = asyncio.run(svc.ado_work())
         assert result == "done"
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Service interface defaults
+# ══════════════════════════════════════════════════════════════════════
+
+class TestQueueServiceDefaults:
+    def test_send_message_batch_falls_back_to_send_message(self):
+        # A subclass written before send_message_batch existed still works.
+        methods = dict.fromkeys(QueueService.__abstractmethods__, None)
+        methods["send_message"] = lambda self, queue_id, body, **kw: f"id-{body}"
+        Minimal = type("Minimal", (QueueService,), methods)
+        assert Minimal().send_message_batch("q", ["a", "b"]) == ["id-a", "id-b"]
+
+
+# ══════════════════════════════════════════════════════════════════════
+# CLI
+# ══════════════════════════════════════════════════════════════════════
+
+class TestCLIParser:
+    def test_choices_follow_supported_literals(self):
+        parser = _build_parser()
+        ns = parser.parse_args(["-p", "gcp", "-s", "logging", "list-log-groups"])
+        assert (ns.provider, ns.service) == ("gcp", "logging")
+
+    def test_rejects_unknown_service(self):
+        with pytest.raises(SystemExit):
+            _build_parser().parse_args(["-p", "aws", "-s", "database", "op"])
+
+    def test_parser_is_reused(self):
+        assert _build_parser() is _build_parser()
+
+
+class TestCLIDaemon:
+    @pytest.fixture
+    def daemon(self, tmp_path):
+        path = str(tmp_path / "cj.sock")
+        server = socketserver.ThreadingUnixStreamServer(path, _DaemonHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield path
+        server.shutdown()
+        server.server_close()
+
+    def _request(self, operation):
+        return {
+            "provider": "aws",
+            "service": "storage",
+            "config": {},
+            "operation": operation,
+            "args": [],
+            "kwargs": {},
+            "env": _credential_env(),
+        }
+
+    def test_forwards_operation(self, daemon):
+        svc = MagicMock()
+        svc.list_buckets.return_value = ["a", "b"]
+        with patch("cloudjack.factory.universal_factory", return_value=svc):
+            resp = _forward(daemon, self._request("list-buckets"))
+        assert resp == {"ok": True, "result": ["a", "b"]}
+
+    def test_streaming_operation_is_drained(self, daemon):
+        svc = MagicMock()
+        svc.iter_zone_records.return_value = iter([("z", [])])
+        req = self._request("iter-zone-records") | {"service": "dns"}
+        with patch("cloudjack.factory.universal_factory", return_value=svc):
+            resp = _forward(daemon, req)
+        assert resp == {"ok": True, "result": [["z", []]]}
+
+    def test_reports_unknown_operation(self, daemon):
+        with patch("cloudjack.factory.universal_factory", return_value=MagicMock()):
+            resp = _forward(daemon, self._request("drop-everything"))
+        assert resp["ok"] is False
+        assert "Unknown operation" in resp["error"]
+
+    def test_no_daemon_falls_back(self, tmp_path):
+        assert _forward(str(tmp_path / "missing.sock"), self._request("x")) is None
+
+    def test_refused_connection_falls_back(self, tmp_path):
+        path = str(tmp_path / "stale.sock")
+        socket.socket(socket.AF_UNIX).bind(path)
+        assert _forward(path, self._request("x")) is None
+
+    def test_handler_crash_still_replies(self, daemon):
+        with patch("cloudjack.factory.universal_factory", side_effect=RuntimeError("boom")):
+            resp = _forward(daemon, self._request("list-buckets"))
+        assert resp == {"ok": False, "error": "Daemon error: boom"}
+
+    def test_lost_reply_is_an_error(self, tmp_path):
+        class Hangup(socketserver.StreamRequestHandler):
+            def handle(self):
+                self.rfile.readline()
+
+        path = str(tmp_path / "cj.sock")
+        with socketserver.UnixStreamServer(path, Hangup) as server:
+            threading.Thread(target=server.handle_request, daemon=True).start()
+            with pytest.raises(OperationError, match="Incomplete reply"):
+                _forward(path, self._request("create-bucket"))
+
+    def test_stale_socket_removed(self, tmp_path):
+        path = tmp_path / "stale.sock"
+        socket.socket(socket.AF_UNIX).bind(str(path))
+        _remove_stale_socket(str(path))
+        assert not path.exists()
+
+    def test_live_socket_kept(self, daemon):
+        with pytest.raises(OperationError, match="already running"):
+            _remove_stale_socket(daemon)
+
+    def test_forwarding_is_off_by_default(self):
+        svc = MagicMock()
+        svc.list_buckets.return_value = ["a"]
+        with patch("cloudjack.cli._forward") as forward, \
+                patch("cloudjack.factory.universal_factory", return_value=svc):
+            main(["-p", "aws", "-s", "storage", "list-buckets"])
+        forward.assert_not_called()
+        svc.list_buckets.assert_called_once_with()
+
+    @pytest.mark.parametrize("flag", [["--use-daemon"], ["--socket", "/tmp/x.sock"]])
+    def test_forwarding_is_opt_in(self, flag):
+        with patch("cloudjack.cli._forward", return_value={"ok": True, "result": None}) as forward:
+            main([*flag, "-p", "aws", "-s", "storage", "list-buckets"])
+        forward.assert_called_once()
+
+    def test_forwarded_request_resolved_by_caller(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-west-1")
+        monkeypatch.setenv("AWS_PROFILE", "prod")
+        req = _prepare_forward(
+            self._request("download-file") | {"args": ["b", "k", "out.bin"]}
+        )
+        assert req["config"]["region_name"] == "eu-west-1"
+        assert req["args"] == ["b", "k", str(tmp_path / "out.bin")]
+        assert req["env"]["AWS_PROFILE"] == "prod"
+
+    def test_pair_paths_made_absolute(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        req = _prepare_forward(
+            self._request("upload-files")
+            | {"args": ["b"], "kwargs": {"items": [["k", "a.txt"]]}}
+        )
+        assert req["args"] == ["b", [["k", str(tmp_path / "a.txt")]]]
+
+    def test_daemon_refuses_different_environment(self, daemon):
+        req = self._request("list-buckets")
+        req["env"] = req["env"] | {"AWS_PROFILE": "someone-else"}
+        with patch("cloudjack.factory.universal_factory") as factory:
+            resp = _forward(daemon, req)
+        assert resp["ok"] is False
+        assert "AWS_PROFILE" in resp["error"]
+        factory.assert_not_called()
+
+    def test_regular_file_kept(self, tmp_path):
+        path = tmp_path / "not-a-socket"
+        path.write_text("data")
+        with pytest.raises(OperationError, match="not a socket"):
+            _remove_stale_socket(str(path))
+        assert path.read_text() == "data"
@@ -3,18 +3,27 @@ import pytest
 
 from cloudjack.factory import universal_factory
 from cloudjack.base import SecretManagerService, StorageService
-from cloudjack.base.config import AWSConfig, GCPConfig
+from cloudjack.base.client_cache import ClientCache
+from cloudjack.base.config import GCPConfig
+from cloudjack.gcp.credentials import default_credentials as real_default_credentials
+
+from tests.helpers import sts_stub
+
+
+@pytest.fixture(autouse=True)
+def shared_adc():
+    # Keep ADC discovery (and its metadata-server probe) out of unit tests.
+    with patch("cloudjack.gcp.credentials.default_credentials", return_value=None) as m:
+        yield m
 
 
 class TestUniversalFactory:
     @patch("cloudjack.aws.secret_manager.boto3")
     def test_aws_secret_manager(self, mock_boto):
-        mock_sts = MagicMock()
-        mock_sts.get_caller_identity.return_value = {"Account": "123456789012"}
-        mock_sm = MagicMock()
+        clients = {"sts": sts_stub(), "secretsmanager": MagicMock()}
 
         def pick(service, **kw):
-            return {"sts": mock_sts, "secretsmanager": mock_sm}[service]
+            return clients[service]
 
         mock_boto.client.side_effect = pick
         result = universal_factory("secret_manager", "aws", {
@@ -46,25 +55,23 @@ class TestUniversalFactory:
         result = universal_factory("storage", "gcp", {"project_id": "p"})
         assert isinstance(result, StorageService)
 
-    def test_unsupported_provider(self):
-        with pytest.raises(ValueError, match="Unsupported cloud provider"):
-            universal_factory("secret_manager", "azure", {})
-
-    def test_unsupported_service(self):
-        with pytest.raises(ValueError, match="Unsupported service"):
-            universal_factory("database", "aws", {})
+    @pytest.mark.parametrize(
+        "service, provider, match",
+        [
+            ("secret_manager", "azure", "Unsupported cloud provider"),
+            ("database", "aws", "Unsupported service"),
+        ],
+    )
+    def test_rejects_unsupported(self, service, provider, match):
+        with pytest.raises(ValueError, match=match):
+            universal_factory(service, provider, {})
 
     @patch("cloudjack.aws.storage.boto3")
-    def test_accepts_aws_config_instance(self, mock_boto):
+    def test_accepts_aws_config_instance(self, mock_boto, aws_config):
         # A pre-built AWSConfig is accepted as-is (no re-validation / no
         # round-trip through a dict).
         mock_boto.client.return_value = MagicMock()
-        cfg = AWSConfig(
-            aws_access_key_id="k",
-            aws_secret_access_key="s",
-            region_name="us-east-1",
-        )
-        result = universal_factory("storage", "aws", cfg)
+        result = universal_factory("storage", "aws", aws_config)
         assert isinstance(result, StorageService)
 
     @patch("cloudjack.gcp.storage.gcs")
@@ -80,3 +87,83 @@ class TestUniversalFactory:
         cfg = GCPConfig(project_id="p")
         with pytest.raises(TypeError, match="AWSConfig"):
             universal_factory("storage", "aws", cfg)
+
+
+class TestSharedCredentials:
+    @patch("cloudjack.gcp.storage.gcs")
+    @patch("cloudjack.gcp.secret_manager.secretmanager_v1")
+    def test_services_share_one_adc_object(self, mock_sm, mock_gcs, shared_adc):
+        ClientCache().clear()
+        creds = MagicMock()
+        shared_adc.return_value = creds
+        universal_factory("storage", "gcp", {"project_id": "shared"})
+        universal_factory("secret_manager", "gcp", {"project_id": "shared"})
+        assert mock_gcs.Client.call_args.kwargs["credentials"] is creds
+        sm_kwargs = mock_sm.SecretManagerServiceClient.call_args.kwargs
+        assert sm_kwargs["credentials"] is creds
+
+    @patch("cloudjack.gcp.storage.gcs")
+    def test_explicit_credentials_win(self, mock_gcs, shared_adc):
+        ClientCache().clear()
+        mine = MagicMock()
+        universal_factory("storage", "gcp", GCPConfig(project_id="p", credentials=mine))
+        assert mock_gcs.Client.call_args.kwargs["credentials"] is mine
+        shared_adc.assert_not_called()
+
+    def test_default_credentials_without_adc(self):
+        from google.auth import exceptions as auth_exceptions
+        from cloudjack.gcp import credentials
+
+        credentials.clear_default_credentials()
+        with patch(
+            "cloudjack.gcp.credentials.google.auth.default",
+            side_effect=auth_exceptions.DefaultCredentialsError("none"),
+        ):
+            assert real_default_credentials() is None
+        credentials.clear_default_credentials()
+
+    def test_default_credentials_failure_not_cached(self):
+        from google.auth import exceptions as auth_exceptions
+        from cloudjack.gcp import credentials
+
+        creds = MagicMock()
+        credentials.clear_default_credentials()
+        with patch(
+            "cloudjack.gcp.credentials.google.auth.default",
+            side_effect=[auth_exceptions.DefaultCredentialsError("none"), (creds, "p")],
+        ) as auth_default:
+            assert real_default_credentials() is None
+            assert real_default_credentials() is creds
+            assert real_default_credentials() is creds
+        assert auth_default.call_count == 2
+        credentials.clear_default_credentials()
+
+
+class TestLazyRegistry:
+    def test_membership_does_not_import(self):
+        from cloudjack.base.registry import LazyServiceRegistry
+
+        reg = LazyServiceRegistry({"compute": "cloudjack.gcp.compute:Compute"})
+        with patch("cloudjack.base.registry.importlib.import_module") as imp:
+            assert "compute" in reg
+            assert "storage" not in reg
+            assert list(reg) == ["compute"]
+        imp.assert_not_called()
+
+    def test_lookup_imports_once(self):
+        from cloudjack.base.registry import LazyServiceRegistry
+        from cloudjack.gcp.compute import Compute
+
+        reg = LazyServiceRegistry({"compute": "cloudjack.gcp.compute:Compute"})
+        assert reg["compute"] is Compute
+        with patch("cloudjack.base.registry.importlib.import_module") as imp:
+            assert reg["compute"] is Compute
+        imp.assert_not_called()
+
+    def test_missing_sdk_names_extra(self):
+        from cloudjack.base.registry import LazyServiceRegistry
+
+        reg = LazyServiceRegistry({"storage": "cloudjack_missing_module:Storage"})
+        with patch.dict("cloudjack.factory._registry_cache", {"gcp": reg}):
+            with pytest.raises(ImportError, match=r"cloudjack\[gcp\]"):
+                universal_factory("storage", "gcp", {"project_id": "p"})
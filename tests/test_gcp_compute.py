@@ -1,12 +1,13 @@
 """Tests for GCP Compute Engine service."""
 
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 import pytest
 
 from google.api_core import exceptions as gcp_exceptions
+from google.cloud import compute_v1
 
-from cloudjack.gcp.compute import Compute
-from cloudjack.base.config import GCPConfig
+from cloudjack.gcp.compute import Compute, PollingPolicy
 from cloudjack.base.exceptions import (
     ComputeError,
     InstanceNotFoundError,
@@ -14,15 +15,33 @@ from cloudjack.base.exceptions import (
 )
 
 
+_DONE = compute_v1.Operation.Status.DONE
+_RUNNING = compute_v1.Operation.Status.RUNNING
+
+# A running VM as the Instances API returns it; read-only in the tests.
+RUNNING_INSTANCE = SimpleNamespace(
+    name="web",
+    status="RUNNING",
+    machine_type="zones/us-central1-a/machineTypes/e2-micro",
+    creation_timestamp="2024-01-01",
+    network_interfaces=[SimpleNamespace(
+        network_i_p="10.0.0.1",
+        access_configs=[SimpleNamespace(nat_i_p="35.1.2.3")],
+    )],
+)
+
+
 @pytest.fixture
-def svc():
+def svc(gcp_config):
     with (
-        patch("cloudjack.gcp.compute.compute_v1.InstancesClient") as MockInstances,
-        patch("cloudjack.gcp.compute.compute_v1.ZoneOperationsClient") as MockOps,
+        patch("cloudjack.gcp.compute.compute_v1.InstancesClient", spec_set=True) as MockInstances,
+        patch("cloudjack.gcp.compute.compute_v1.ZoneOperationsClient", spec_set=True) as MockOps,
     ):
         mock_instances = MockInstances.return_value
         mock_ops = MockOps.return_value
-        instance = Compute(GCPConfig(project_id="my-project"))
+        mock_ops.get.return_value = compute_v1.Operation(status=_DONE)
+        mock_ops.list.return_value = []
+        instance = Compute(gcp_config)
         yield instance, mock_instances, mock_ops
 
 
@@ -40,65 +59,241 @@ class TestCreateInstance:
         )
         assert result == "web"
         client.insert.assert_called_once()
-        ops.wait.assert_called_once()
+        ops.get.assert_called_once()
 
-    def test_already_exists(self, svc):
+    @pytest.mark.parametrize(
+        "error, exc",
+        [
+            (gcp_exceptions.AlreadyExists("exists"), InstanceAlreadyExistsError),
+            (gcp_exceptions.InternalServerError("fail"), ComputeError),
+        ],
+    )
+    def test_errors(self, svc, error, exc):
         inst, client, ops = svc
-        client.insert.side_effect = gcp_exceptions.AlreadyExists("exists")
-        with pytest.raises(InstanceAlreadyExistsError):
+        client.insert.side_effect = error
+        with pytest.raises(exc):
             inst.create_instance("dup", "e2-micro", "img")
 
-    def test_generic_error(self, svc):
+
+class TestCreateInstances:
+    def test_single_bulk_insert(self, svc):
         inst, client, ops = svc
-        client.insert.side_effect = gcp_exceptions.InternalServerError("fail")
-        with pytest.raises(ComputeError):
-            inst.create_instance("fail", "e2-micro", "img")
+        names = inst.create_instances(["a", "b", "c"], "e2-micro", "img", zone="us-east1-b")
+        assert names == ["a", "b", "c"]
+        client.bulk_insert.assert_called_once()
+        client.insert.assert_not_called()
+        kwargs = client.bulk_insert.call_args.kwargs
+        assert kwargs["zone"] == "us-east1-b"
+        resource = kwargs["bulk_insert_instance_resource_resource"]
+        assert resource.count == 3
+        assert set(resource.per_instance_properties) == {"a", "b", "c"}
+        assert resource.instance_properties.machine_type == "e2-micro"
+        ops.get.assert_called_once()
+
+    def test_empty(self, svc):
+        inst, client, ops = svc
+        assert inst.create_instances([], "e2-micro", "img") == []
+        client.bulk_insert.assert_not_called()
+
+    def test_already_exists(self, svc):
+        inst, client, ops = svc
+        client.bulk_insert.side_effect = gcp_exceptions.AlreadyExists("exists")
+        with pytest.raises(InstanceAlreadyExistsError):
+            inst.create_instances(["a"], "e2-micro", "img")
 
 
 # --- start / stop / terminate ---
 
 class TestLifecycle:
-    def test_start(self, svc):
+
+    @pytest.mark.parametrize(
+        "method, client_method",
+        [
+            ("start_instance", "start"),
+            ("stop_instance", "stop"),
+            ("terminate_instance", "delete"),
+        ],
+    )
+    def test_success(self, svc, method, client_method):
         inst, client, ops = svc
-        mock_op = MagicMock()
-        mock_op.name = "op"
-        client.start.return_value = mock_op
-        inst.start_instance("web")
-        client.start.assert_called_once()
+        getattr(client, client_method).return_value = SimpleNamespace(name="op")
+        getattr(inst, method)("web")
+        getattr(client, client_method).assert_called_once()
 
-    def test_stop(self, svc):
+    @pytest.mark.parametrize(
+        "method, client_method",
+        [
+            ("start_instance", "start"),
+            ("stop_instance", "stop"),
+            ("terminate_instance", "delete"),
+        ],
+    )
+    def test_not_found(self, svc, method, client_method):
         inst, client, ops = svc
-        mock_op = MagicMock()
-        mock_op.name = "op"
-        client.stop.return_value = mock_op
-        inst.stop_instance("web")
-        client.stop.assert_called_once()
+        getattr(client, client_method).side_effect = gcp_exceptions.NotFound("nope")
+        with pytest.raises(InstanceNotFoundError):
+            getattr(inst, method)("missing")
+
+
+# --- operation polling ---
 
-    def test_terminate(self, svc):
+class TestWait:
+    def test_polls_until_done(self, svc):
         inst, client, ops = svc
-        mock_op = MagicMock()
-        mock_op.name = "op"
-        client.delete.return_value = mock_op
-        inst.terminate_instance("web")
-        client.delete.assert_called_once()
+        ops.get.side_effect = [
+            compute_v1.Operation(status=_RUNNING),
+            compute_v1.Operation(status=_RUNNING),
+            compute_v1.Operation(status=_DONE),
+        ]
+        with patch("cloudjack.gcp.compute.time.sleep") as sleep:
+            inst.start_instance("web")
+        assert ops.get.call_count == 3
+        assert sleep.call_count == 2
+        ops.wait.assert_not_called()
 
-    def test_start_not_found(self, svc):
+    def test_polls_in_instance_zone(self, svc):
         inst, client, ops = svc
-        client.start.side_effect = gcp_exceptions.NotFound("nope")
-        with pytest.raises(InstanceNotFoundError):
-            inst.start_instance("missing")
+        inst.create_instance("web", "e2-micro", "img", zone="europe-west1-b")
+        assert ops.get.call_args.kwargs["zone"] == "europe-west1-b"
+
+    def test_operation_error(self, svc):
+        inst, client, ops = svc
+        ops.get.return_value = compute_v1.Operation(
+            status=_DONE,
+            error=compute_v1.Error(errors=[compute_v1.Errors(message="quota")]),
+        )
+        with pytest.raises(ComputeError, match="quota"):
+            inst.stop_instance("web")
+
+    def test_deadline(self, svc):
+        inst, client, ops = svc
+        ops.get.return_value = compute_v1.Operation(status=_RUNNING)
+        inst.polling = PollingPolicy(initial=0.01, maximum=0.01, deadline=0.0)
+        with pytest.raises(ComputeError, match="Timed out"):
+            inst.stop_instance("web")
+
+    def test_delays_are_capped(self):
+        policy = PollingPolicy(initial=1.0, maximum=4.0, multiplier=2.0)
+        delays = policy.delays()
+        observed = [next(delays) for _ in range(6)]
+        assert all(d <= 4.0 for d in observed)
+        assert observed[-1] >= 2.0
+
+
+# --- bulk start / stop / terminate ---
 
-    def test_stop_not_found(self, svc):
+class TestClose:
+    def test_context_manager_shuts_down_pool(self, svc):
+        inst, client, ops = svc
+        with inst as entered:
+            assert entered is inst
+        with pytest.raises(RuntimeError):
+            inst._pool.submit(print)
+
+
+class TestBulkLifecycle:
+    def test_start_instances(self, svc):
+        inst, client, ops = svc
+        client.start.side_effect = lambda **kw: MagicMock(name=f"op-{kw['instance']}")
+        inst.start_instances(["a", "b", "c"])
+        assert client.start.call_count == 3
+        assert ops.get.call_count == 3
+        started = {c.kwargs["instance"] for c in client.start.call_args_list}
+        assert started == {"a", "b", "c"}
+
+    def test_terminate_instances_uses_delete(self, svc):
+        inst, client, ops = svc
+        inst.terminate_instances(["a"])
+        client.delete.assert_called_once_with(
+            project="my-project", zone="us-central1-a", instance="a"
+        )
+
+    def test_all_not_found(self, svc):
         inst, client, ops = svc
         client.stop.side_effect = gcp_exceptions.NotFound("nope")
         with pytest.raises(InstanceNotFoundError):
-            inst.stop_instance("missing")
+            inst.stop_instances(["x", "y"])
 
-    def test_terminate_not_found(self, svc):
+    def test_partial_failure_attempts_every_instance(self, svc):
         inst, client, ops = svc
-        client.delete.side_effect = gcp_exceptions.NotFound("nope")
+
+        def start(**kw):
+            if kw["instance"] == "bad":
+                raise gcp_exceptions.InternalServerError("fail")
+            return MagicMock()
+
+        client.start.side_effect = start
+        with pytest.raises(ComputeError, match="bad"):
+            inst.start_instances(["ok", "bad"])
+        assert client.start.call_count == 2
+        ops.get.assert_called_once()
+
+    def test_single_poll_loop_for_all_operations(self, svc):
+        inst, client, ops = svc
+
+        def start(**kw):
+            op = MagicMock()
+            op.name = f"op-{kw['instance']}"
+            return op
+
+        client.start.side_effect = start
+        still_running = MagicMock()
+        still_running.name = "op-b"
+        ops.list.side_effect = [[still_running], []]
+        with patch("cloudjack.gcp.compute.time.sleep") as sleep:
+            inst.start_instances(["a", "b"])
+        assert ops.list.call_count == 2
+        assert sleep.call_count == 1
+        assert [c.kwargs["operation"] for c in ops.get.call_args_list] == ["op-a", "op-b"]
+
+    def test_failed_operation_reported(self, svc):
+        inst, client, ops = svc
+        ops.get.return_value = compute_v1.Operation(
+            status=_DONE,
+            error=compute_v1.Error(errors=[compute_v1.Errors(message="quota")]),
+        )
+        with pytest.raises(ComputeError, match="1 instance"):
+            inst.stop_instances(["web"])
+
+    def test_throttled_calls_are_retried(self, svc):
+        inst, client, ops = svc
+        client.stop.side_effect = [
+            gcp_exceptions.TooManyRequests("slow down"),
+            gcp_exceptions.ServiceUnavailable("busy"),
+            MagicMock(),
+        ]
+        client.stop.__qualname__ = "InstancesClient.stop"
+        with patch("cloudjack.base.retry.time.sleep") as sleep:
+            inst.stop_instances(["web"])
+        assert client.stop.call_count == 3
+        assert sleep.call_count == 2
+
+    def test_retried_delete_not_found_is_success(self, svc):
+        inst, client, ops = svc
+        client.delete.side_effect = [
+            gcp_exceptions.TooManyRequests("slow down"),
+            gcp_exceptions.NotFound("gone"),
+        ]
+        with patch("cloudjack.base.retry.time.sleep"):
+            inst.terminate_instances(["web"])
+        assert client.delete.call_count == 2
+        ops.list.assert_not_called()
+
+    def test_first_delete_not_found_still_raises(self, svc):
+        inst, client, ops = svc
+        client.delete.side_effect = gcp_exceptions.NotFound("gone")
         with pytest.raises(InstanceNotFoundError):
-            inst.terminate_instance("missing")
+            inst.terminate_instances(["web"])
+
+    def test_retried_stop_not_found_still_raises(self, svc):
+        inst, client, ops = svc
+        client.stop.side_effect = [
+            gcp_exceptions.TooManyRequests("slow down"),
+            gcp_exceptions.NotFound("gone"),
+        ]
+        with patch("cloudjack.base.retry.time.sleep"):
+            with pytest.raises(InstanceNotFoundError):
+                inst.stop_instances(["web"])
 
 
 # --- list_instances ---
@@ -106,12 +301,7 @@ class TestLifecycle:
 class TestListInstances:
     def test_success(self, svc):
         inst, client, ops = svc
-        mock_inst = MagicMock()
-        mock_inst.name = "web"
-        mock_inst.status = "RUNNING"
-        mock_inst.machine_type = "zones/us-central1-a/machineTypes/e2-micro"
-        mock_inst.creation_timestamp = "2024-01-01"
-        client.list.return_value = [mock_inst]
+        client.list.return_value = [RUNNING_INSTANCE]
         result = inst.list_instances()
         assert len(result) == 1
         assert result[0]["name"] == "web"
@@ -123,28 +313,94 @@ class TestListInstances:
         client.list.return_value = []
         assert inst.list_instances() == []
 
+    def test_filter_passed_through(self, svc):
+        inst, client, ops = svc
+        client.list.return_value = []
+        inst.list_instances(zone="europe-west1-b", filter='status = "RUNNING"')
+        request = client.list.call_args.kwargs["request"]
+        assert request.zone == "europe-west1-b"
+        assert request.filter == 'status = "RUNNING"'
+
+    def test_multiple_zones(self, svc):
+        inst, client, ops = svc
+
+        def list_zone(**kw):
+            m = MagicMock(machine_type="", creation_timestamp="")
+            m.name = kw["request"].zone
+            return [m]
+
+        client.list.side_effect = list_zone
+        result = inst.list_instances(zones=["a", "b", "c"])
+        assert [r["name"] for r in result] == ["a", "b", "c"]
+        assert client.list.call_count == 3
+
+    def test_all_zones_uses_aggregated_list(self, svc):
+        inst, client, ops = svc
+        vm = MagicMock(machine_type="", creation_timestamp="")
+        vm.name = "web"
+        client.aggregated_list.return_value = [
+            ("zones/us-central1-a", MagicMock(instances=[vm])),
+            ("zones/us-east1-b", MagicMock(instances=[])),
+        ]
+        result = inst.list_instances(all_zones=True)
+        assert [r["name"] for r in result] == ["web"]
+        client.list.assert_not_called()
+
+    def test_error(self, svc):
+        inst, client, ops = svc
+        client.list.side_effect = gcp_exceptions.InternalServerError("fail")
+        with pytest.raises(ComputeError):
+            inst.list_instances(zones=["a"])
+
+    def test_iter_instances_streams(self, svc):
+        inst, client, ops = svc
+
+        def pages():
+            vm = MagicMock(machine_type="", creation_timestamp="")
+            vm.name = "first"
+            yield vm
+            raise gcp_exceptions.InternalServerError("page 2 failed")
+
+        client.list.return_value = pages()
+        rows = inst.iter_instances()
+        assert next(rows)["name"] == "first"
+        with pytest.raises(ComputeError):
+            next(rows)
+
 
 # --- get_instance ---
 
 class TestGetInstance:
     def test_success(self, svc):
         inst, client, ops = svc
-        mock_inst = MagicMock()
-        mock_inst.name = "web"
-        mock_inst.status = "RUNNING"
-        mock_inst.machine_type = "zones/z/machineTypes/e2-micro"
-        mock_inst.creation_timestamp = "2024-01-01"
-        mock_iface = MagicMock()
-        mock_iface.network_i_p = "10.0.0.1"
-        mock_ac = MagicMock()
-        mock_ac.nat_i_p = "35.1.2.3"
-        mock_iface.access_configs = [mock_ac]
-        mock_inst.network_interfaces = [mock_iface]
-        client.get.return_value = mock_inst
+        client.get.return_value = RUNNING_INSTANCE
         result = inst.get_instance("web")
         assert result["public_ip"] == "35.1.2.3"
         assert result["private_ip"] == "10.0.0.1"
 
+    def test_first_nat_ip_across_interfaces(self, svc):
+        inst, client, ops = svc
+        client.get.return_value = compute_v1.Instance(
+            name="web",
+            network_interfaces=[
+                compute_v1.NetworkInterface(network_i_p="10.0.0.1"),
+                compute_v1.NetworkInterface(
+                    network_i_p="10.0.1.1",
+                    access_configs=[compute_v1.AccessConfig(nat_i_p="35.9.9.9")],
+                ),
+            ],
+        )
+        result = inst.get_instance("web")
+        assert result["public_ip"] == "35.9.9.9"
+        assert result["private_ip"] == "10.0.0.1"
+
+    def test_no_interfaces(self, svc):
+        inst, client, ops = svc
+        client.get.return_value = compute_v1.Instance(name="web")
+        result = inst.get_instance("web")
+        assert result["public_ip"] is None
+        assert result["private_ip"] is None
+
     def test_not_found(self, svc):
         inst, client, ops = svc
         client.get.side_effect = gcp_exceptions.NotFound("nope")
@@ -1,20 +1,20 @@
 """Tests for GCP Cloud DNS service."""
 
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 import pytest
 
 from google.api_core import exceptions as gcp_exceptions
 
 from cloudjack.gcp.dns import DNS
-from cloudjack.base.config import GCPConfig
 from cloudjack.base.exceptions import DNSError, ZoneNotFoundError, ZoneAlreadyExistsError
 
 
 @pytest.fixture
-def svc():
-    with patch("cloudjack.gcp.dns.cloud_dns.Client") as MockClient:
+def svc(gcp_config):
+    with patch("cloudjack.gcp.dns.cloud_dns.Client", spec_set=True) as MockClient:
         mock_client = MockClient.return_value
-        instance = DNS(GCPConfig(project_id="my-project"))
+        instance = DNS(gcp_config)
         yield instance, mock_client
 
 
@@ -29,22 +29,19 @@ class TestCreateZone:
         assert zid == "example-com"
         mock_zone.create.assert_called_once()
 
-    def test_already_exists(self, svc):
+    @pytest.mark.parametrize(
+        "error, exc",
+        [
+            (gcp_exceptions.Conflict("exists"), ZoneAlreadyExistsError),
+            (gcp_exceptions.InternalServerError("fail"), DNSError),
+        ],
+    )
+    def test_errors(self, svc, error, exc):
         inst, client = svc
-        mock_zone = MagicMock()
-        mock_zone.create.side_effect = gcp_exceptions.Conflict("exists")
-        client.zone.return_value = mock_zone
-        with pytest.raises(ZoneAlreadyExistsError):
+        client.zone.return_value.create.side_effect = error
+        with pytest.raises(exc):
             inst.create_zone("dup.com.")
 
-    def test_generic_error(self, svc):
-        inst, client = svc
-        mock_zone = MagicMock()
-        mock_zone.create.side_effect = gcp_exceptions.InternalServerError("fail")
-        client.zone.return_value = mock_zone
-        with pytest.raises(DNSError):
-            inst.create_zone("fail.com.")
-
 
 # --- delete_zone ---
 
@@ -70,11 +67,9 @@ class TestDeleteZone:
 class TestListZones:
     def test_success(self, svc):
         inst, client = svc
-        mock_z = MagicMock()
-        mock_z.name = "example-com"
-        mock_z.dns_name = "example.com."
-        mock_z.description = ""
-        client.list_zones.return_value = [mock_z]
+        client.list_zones.return_value = [
+            SimpleNamespace(name="example-com", dns_name="example.com.", description="")
+        ]
         zones = inst.list_zones()
         assert len(zones) == 1
         assert zones[0]["zone_id"] == "example-com"
@@ -126,18 +121,79 @@ class TestDeleteRecord:
         mock_changes.create.assert_called_once()
 
 
+# --- apply_record_changes ---
+
+class TestApplyRecordChanges:
+    def test_single_change_set(self, svc):
+        inst, client = svc
+        mock_zone = MagicMock()
+        mock_changes = MagicMock()
+        mock_zone.changes.return_value = mock_changes
+        client.zone.return_value = mock_zone
+        inst.apply_record_changes(
+            "z",
+            adds=[
+                {"name": "a.x.com.", "type": "A", "ttl": 60, "values": ["1.1.1.1"]},
+                {"name": "b.x.com.", "type": "A", "values": ["2.2.2.2"]},
+            ],
+            deletes=[{"name": "c.x.com.", "type": "A", "ttl": 300, "values": ["3.3.3.3"]}],
+        )
+        assert mock_changes.add_record_set.call_count == 2
+        mock_changes.delete_record_set.assert_called_once()
+        mock_changes.create.assert_called_once()
+        mock_zone.resource_record_set.assert_any_call("b.x.com.", "A", 300, ["2.2.2.2"])
+
+    def test_large_sets_split_into_changes(self, svc):
+        inst, client = svc
+        zone = client.zone.return_value
+        change_sets = []
+
+        def new_change_set():
+            change_sets.append(MagicMock())
+            return change_sets[-1]
+
+        zone.changes.side_effect = new_change_set
+        zone.resource_record_set.side_effect = lambda name, *rest: name
+        records = [
+            {"name": f"r{i}.x.com.", "type": "A", "ttl": 60, "values": ["10.0.0.1"]}
+            for i in range(1200)
+        ]
+        inst.apply_record_changes("z", adds=records, deletes=records)
+        assert len(change_sets) == 12
+        for change_set in change_sets:
+            added = [c.args[0] for c in change_set.add_record_set.call_args_list]
+            deleted = [c.args[0] for c in change_set.delete_record_set.call_args_list]
+            assert len(added) == 100
+            assert added == deleted
+            change_set.create.assert_called_once()
+
+    def test_empty_is_noop(self, svc):
+        inst, client = svc
+        inst.apply_record_changes("z")
+        client.zone.assert_not_called()
+
+    def test_error(self, svc):
+        inst, client = svc
+        mock_zone = MagicMock()
+        mock_zone.changes.return_value.create.side_effect = (
+            gcp_exceptions.InternalServerError("fail")
+        )
+        client.zone.return_value = mock_zone
+        with pytest.raises(DNSError):
+            inst.apply_record_changes(
+                "z", adds=[{"name": "a.", "type": "A", "ttl": 1, "values": ["1"]}]
+            )
+
+
 # --- list_records ---
 
 class TestListRecords:
     def test_success(self, svc):
         inst, client = svc
         mock_zone = MagicMock()
-        mock_record = MagicMock()
-        mock_record.name = "example.com."
-        mock_record.record_type = "NS"
-        mock_record.ttl = 300
-        mock_record.rrdatas = ["ns1.gcp.com."]
-        mock_zone.list_resource_record_sets.return_value = [mock_record]
+        mock_zone.list_resource_record_sets.return_value = [SimpleNamespace(
+            name="example.com.", record_type="NS", ttl=300, rrdatas=["ns1.gcp.com."]
+        )]
         client.zone.return_value = mock_zone
         records = inst.list_records("example-com")
         assert len(records) == 1
@@ -150,3 +206,43 @@ class TestListRecords:
         client.zone.return_value = mock_zone
         with pytest.raises(ZoneNotFoundError):
             inst.list_records("missing")
+
+
+# --- iter_zone_records ---
+
+class TestIterZoneRecords:
+    @staticmethod
+    def _zone(name):
+        record = MagicMock(record_type="A", ttl=60, rrdatas=["1.2.3.4"])
+        record.name = f"www.{name}."
+        zone = MagicMock()
+        zone.list_resource_record_sets.return_value = [record]
+        return zone
+
+    def test_all_zones(self, svc):
+        inst, client = svc
+        zones = []
+        for name in ("a-com", "b-com"):
+            z = MagicMock(dns_name=f"{name}.", description="")
+            z.name = name
+            zones.append(z)
+        client.list_zones.return_value = zones
+        client.zone.side_effect = self._zone
+        result = dict(inst.iter_zone_records())
+        assert set(result) == {"a-com", "b-com"}
+        assert result["a-com"][0]["name"] == "www.a-com."
+
+    def test_explicit_zones_skip_list_zones(self, svc):
+        inst, client = svc
+        client.zone.side_effect = self._zone
+        result = list(inst.iter_zone_records(["x"], max_workers=1))
+        assert [zone_id for zone_id, _ in result] == ["x"]
+        client.list_zones.assert_not_called()
+
+    def test_zone_error_propagates(self, svc):
+        inst, client = svc
+        zone = MagicMock()
+        zone.list_resource_record_sets.side_effect = gcp_exceptions.NotFound("nope")
+        client.zone.return_value = zone
+        with pytest.raises(ZoneNotFoundError):
+            list(inst.iter_zone_records(["gone"]))
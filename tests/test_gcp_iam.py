@@ -1,5 +1,6 @@
 """Tests for GCP IAM service."""
 
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 import pytest
 
@@ -23,10 +24,13 @@ TRUST_POLICY = {
 
 
 @pytest.fixture
-def svc():
-    with patch("cloudjack.gcp.iam.iam_admin_v1.IAMClient") as MockClient:
+def svc(gcp_config):
+    with (
+        patch("cloudjack.gcp.iam.iam_admin_v1.IAMClient", spec_set=True) as MockClient,
+        patch("cloudjack.gcp.iam.resourcemanager_v3.ProjectsClient"),
+    ):
         mock_client = MockClient.return_value
-        instance = IAM(GCPConfig(project_id="my-project"))
+        instance = IAM(gcp_config)
         yield instance, mock_client
 
 
@@ -41,18 +45,19 @@ class TestCreateRole:
         result = inst.create_role("TestRole", TRUST_POLICY)
         assert result == "projects/my-project/roles/TestRole"
 
-    def test_already_exists(self, svc):
+    @pytest.mark.parametrize(
+        "error, exc",
+        [
+            (gcp_exceptions.AlreadyExists("exists"), RoleAlreadyExistsError),
+            (gcp_exceptions.InternalServerError("fail"), IAMError),
+        ],
+    )
+    def test_errors(self, svc, error, exc):
         inst, client = svc
-        client.create_role.side_effect = gcp_exceptions.AlreadyExists("exists")
-        with pytest.raises(RoleAlreadyExistsError):
+        client.create_role.side_effect = error
+        with pytest.raises(exc):
             inst.create_role("dup", TRUST_POLICY)
 
-    def test_generic_error(self, svc):
-        inst, client = svc
-        client.create_role.side_effect = gcp_exceptions.InternalServerError("fail")
-        with pytest.raises(IAMError):
-            inst.create_role("fail", TRUST_POLICY)
-
 
 # --- delete_role ---
 
@@ -65,8 +70,9 @@ class TestDeleteRole:
     def test_full_path(self, svc):
         inst, client = svc
         inst.delete_role("projects/my-project/roles/TestRole")
-        call_args = client.delete_role.call_args[1]
-        assert call_args["request"]["name"] == "projects/my-project/roles/TestRole"
+        client.delete_role.assert_called_once_with(
+            request={"name": "projects/my-project/roles/TestRole"}
+        )
 
     def test_not_found(self, svc):
         inst, client = svc
@@ -80,11 +86,11 @@ class TestDeleteRole:
 class TestListRoles:
     def test_success(self, svc):
         inst, client = svc
-        mock_role = MagicMock()
-        mock_role.name = "projects/my-project/roles/viewer"
-        mock_role.title = "Viewer"
-        mock_role.description = "View only"
-        client.list_roles.return_value = [mock_role]
+        client.list_roles.return_value = [SimpleNamespace(
+            name="projects/my-project/roles/viewer",
+            title="Viewer",
+            description="View only",
+        )]
         roles = inst.list_roles()
         assert len(roles) == 1
         assert roles[0]["role_name"] == "viewer"
@@ -95,10 +101,83 @@ class TestListRoles:
         assert inst.list_roles() == []
 
 
+class TestIterRoles:
+    def test_streams_and_maps_errors(self, svc):
+        inst, client = svc
+
+        def pages():
+            role = MagicMock(title="T", description="")
+            role.name = "projects/my-project/roles/First"
+            yield role
+            raise gcp_exceptions.InternalServerError("page 2 failed")
+
+        client.list_roles.return_value = pages()
+        rows = inst.iter_roles()
+        assert next(rows)["role_name"] == "First"
+        with pytest.raises(IAMError):
+            next(rows)
+
+
 # --- attach_policy / detach_policy ---
 
+@pytest.fixture
+def policy_env(svc):
+    """Serve a one-binding project policy and capture writes."""
+    inst, _ = svc
+    binding = SimpleNamespace(role="roles/viewer", members=["user:bob@example.com"])
+    policy = SimpleNamespace(bindings=[binding])
+    with (
+        patch.object(inst, "_get_policy", return_value=policy),
+        patch.object(inst, "_set_policy") as set_mock,
+    ):
+        yield inst, set_mock, binding
+
+
 class TestPolicyBinding:
-    def test_attach_existing_binding(self, svc):
+    def test_attach_existing_binding(self, policy_env):
+        inst, set_mock, binding = policy_env
+        inst.attach_policy("roles/viewer", "user:alice@example.com")
+        set_mock.assert_called_once()
+        assert "user:alice@example.com" in binding.members
+
+    def test_attach_new_binding(self, policy_env):
+        inst, set_mock, _ = policy_env
+        inst.attach_policy("roles/editor", "user:alice@example.com")
+        set_mock.assert_called_once()
+
+    def test_detach(self, policy_env):
+        inst, set_mock, binding = policy_env
+        inst.detach_policy("roles/viewer", "user:bob@example.com")
+        set_mock.assert_called_once()
+        assert "user:bob@example.com" not in binding.members
+
+    def test_attach_error(self, policy_env):
+        inst, _, _ = policy_env
+        inst._get_policy.side_effect = gcp_exceptions.InternalServerError("fail")
+        with pytest.raises(IAMError):
+            inst.attach_policy("roles/viewer", "user:a@b.com")
+
+
+# --- list_policies ---
+
+class TestListPolicies:
+    def test_success(self, policy_env):
+        inst, _, _ = policy_env
+        policies = inst.list_policies()
+        assert len(policies) == 1
+        assert policies[0]["policy_name"] == "roles/viewer"
+
+    def test_error(self, policy_env):
+        inst, _, _ = policy_env
+        inst._get_policy.side_effect = gcp_exceptions.InternalServerError("fail")
+        with pytest.raises(IAMError):
+            inst.list_policies()
+
+
+# --- attach_policies / policy cache ---
+
+class TestAttachPolicies:
+    def test_single_read_modify_write(self, svc):
         inst, client = svc
         mock_binding = MagicMock()
         mock_binding.role = "roles/viewer"
@@ -106,65 +185,120 @@ class TestPolicyBinding:
         mock_policy = MagicMock()
         mock_policy.bindings = [mock_binding]
 
-        with patch.object(inst, "_get_policy", return_value=mock_policy):
+        with patch.object(inst, "_get_policy", return_value=mock_policy) as mock_get:
             with patch.object(inst, "_set_policy") as mock_set:
-                inst.attach_policy("roles/viewer", "user:alice@example.com")
+                inst.attach_policies([
+                    ("roles/viewer", "user:alice@example.com"),
+                    ("roles/viewer", "user:bob@example.com"),
+                    ("roles/editor", "user:alice@example.com"),
+                    ("roles/editor", "user:carol@example.com"),
+                ])
+                mock_get.assert_called_once()
                 mock_set.assert_called_once()
-                assert "user:alice@example.com" in mock_binding.members
+        assert mock_binding.members == ["user:bob@example.com", "user:alice@example.com"]
+        editor = mock_policy.bindings[1]
+        assert editor.role == "roles/editor"
+        assert list(editor.members) == ["user:alice@example.com", "user:carol@example.com"]
 
-    def test_attach_new_binding(self, svc):
+    def test_retries_on_conflict(self, svc):
         inst, client = svc
         mock_policy = MagicMock()
         mock_policy.bindings = []
 
-        with patch.object(inst, "_get_policy", return_value=mock_policy):
-            with patch.object(inst, "_set_policy") as mock_set:
-                inst.attach_policy("roles/editor", "user:alice@example.com")
-                mock_set.assert_called_once()
+        with patch.object(inst, "_get_policy", return_value=mock_policy) as mock_get:
+            with patch.object(
+                inst, "_set_policy", side_effect=[gcp_exceptions.Aborted("etag"), None]
+            ):
+                inst.attach_policies([("roles/viewer", "user:a@b.com")])
+        assert mock_get.call_count == 2
 
-    def test_detach(self, svc):
+    def test_empty_is_noop(self, svc):
         inst, client = svc
-        mock_binding = MagicMock()
-        mock_binding.role = "roles/viewer"
-        mock_binding.members = ["user:alice@example.com"]
-        mock_policy = MagicMock()
-        mock_policy.bindings = [mock_binding]
+        with patch.object(inst, "_get_policy") as mock_get:
+            inst.attach_policies([])
+        mock_get.assert_not_called()
 
-        with patch.object(inst, "_get_policy", return_value=mock_policy):
+
+class TestDetachPolicies:
+    def test_single_read_modify_write(self, svc):
+        from google.iam.v1 import policy_pb2
+
+        inst, client = svc
+        policy = policy_pb2.Policy(bindings=[
+            policy_pb2.Binding(role="roles/viewer", members=["user:a", "user:b", "user:c"]),
+            policy_pb2.Binding(role="roles/editor", members=["user:a"]),
+        ])
+        with patch.object(inst, "_get_policy", return_value=policy):
             with patch.object(inst, "_set_policy") as mock_set:
-                inst.detach_policy("roles/viewer", "user:alice@example.com")
+                inst.detach_policies([
+                    ("roles/viewer", "user:a"),
+                    ("roles/viewer", "user:c"),
+                    ("roles/editor", "user:z"),
+                ])
                 mock_set.assert_called_once()
-                assert "user:alice@example.com" not in mock_binding.members
+        assert list(policy.bindings[0].members) == ["user:b"]
+        assert list(policy.bindings[1].members) == ["user:a"]
+
+
+class TestPolicyCache:
+    @pytest.fixture
+    def rm(self, svc):
+        return svc[0].rm_client
+
+    def test_reads_within_ttl_are_cached(self, svc, rm):
+        from google.iam.v1 import policy_pb2
 
-    def test_attach_error(self, svc):
         inst, client = svc
-        with patch.object(
-            inst, "_get_policy", side_effect=gcp_exceptions.InternalServerError("fail")
-        ):
-            with pytest.raises(IAMError):
-                inst.attach_policy("roles/viewer", "user:a@b.com")
+        rm.get_iam_policy.return_value = policy_pb2.Policy(etag=b"v1")
+        first = inst._get_policy()
+        first.bindings.add(role="roles/viewer")
+        second = inst._get_policy()
+        rm.get_iam_policy.assert_called_once()
+        assert len(second.bindings) == 0  # callers get independent copies
 
+    def test_write_seeds_cache(self, svc, rm):
+        from google.iam.v1 import policy_pb2
 
-# --- list_policies ---
+        inst, client = svc
+        rm.set_iam_policy.return_value = policy_pb2.Policy(etag=b"v2")
+        inst._set_policy(policy_pb2.Policy(etag=b"v1"))
+        assert inst._get_policy().etag == b"v2"
+        rm.get_iam_policy.assert_not_called()
+
+    def test_list_policies_fresh_skips_cache(self, svc, rm):
+        from google.iam.v1 import policy_pb2
 
-class TestListPolicies:
-    def test_success(self, svc):
         inst, client = svc
-        mock_binding = MagicMock()
-        mock_binding.role = "roles/viewer"
-        mock_binding.members = ["user:a@b.com"]
-        mock_policy = MagicMock()
-        mock_policy.bindings = [mock_binding]
+        rm.get_iam_policy.return_value = policy_pb2.Policy(etag=b"v1")
+        inst.list_policies()
+        inst.list_policies()
+        assert rm.get_iam_policy.call_count == 1
+        inst.list_policies(fresh=True)
+        assert rm.get_iam_policy.call_count == 2
 
-        with patch.object(inst, "_get_policy", return_value=mock_policy):
-            policies = inst.list_policies()
-            assert len(policies) == 1
-            assert policies[0]["policy_name"] == "roles/viewer"
+    def test_failed_write_invalidates_cache(self, svc, rm):
+        from google.iam.v1 import policy_pb2
 
-    def test_error(self, svc):
         inst, client = svc
-        with patch.object(
-            inst, "_get_policy", side_effect=gcp_exceptions.InternalServerError("fail")
+        rm.get_iam_policy.return_value = policy_pb2.Policy(etag=b"v1")
+        inst._get_policy()
+        rm.set_iam_policy.side_effect = gcp_exceptions.Aborted("etag")
+        with pytest.raises(gcp_exceptions.Aborted):
+            inst._set_policy(policy_pb2.Policy(etag=b"v1"))
+        inst._get_policy()
+        assert rm.get_iam_policy.call_count == 2
+
+
+class TestResourceManagerClient:
+    def test_built_once_with_config_credentials(self):
+        creds = MagicMock()
+        with (
+            patch("cloudjack.gcp.iam.iam_admin_v1.IAMClient"),
+            patch("cloudjack.gcp.iam.resourcemanager_v3.ProjectsClient") as MockRM,
         ):
-            with pytest.raises(IAMError):
-                inst.list_policies()
+            inst = IAM(GCPConfig(project_id="my-project", credentials=creds))
+            inst._get_policy()
+            inst._policy_cache = None
+            inst._get_policy()
+        MockRM.assert_called_once_with(credentials=creds)
+        assert MockRM.return_value.get_iam_policy.call_count == 2
@@ -1,12 +1,13 @@
 """Tests for GCP Cloud Logging service."""
 
-from unittest.mock import patch, MagicMock
+import json
+from types import SimpleNamespace
+from unittest.mock import ANY, patch, MagicMock
 import pytest
 
 from google.api_core import exceptions as gcp_exceptions
 
 from cloudjack.gcp.logging_service import Logging
-from cloudjack.base.config import GCPConfig
 from cloudjack.base.exceptions import (
     LoggingError,
     LogGroupNotFoundError,
@@ -15,10 +16,11 @@ from cloudjack.base.exceptions import (
 
 
 @pytest.fixture
-def svc():
-    with patch("cloudjack.gcp.logging_service.cloud_logging.Client") as MockClient:
+def svc(gcp_config):
+    with patch("cloudjack.gcp.logging_service.cloud_logging.Client", spec_set=True) as MockClient, \
+         patch("cloudjack.gcp.logging_service.LoggingServiceV2Client"):
         mock_client = MockClient.return_value
-        instance = Logging(GCPConfig(project_id="my-project"))
+        instance = Logging(gcp_config)
         yield instance, mock_client
 
 
@@ -71,20 +73,33 @@ class TestDeleteLogGroup:
 class TestListLogGroups:
     def test_success(self, svc):
         inst, client = svc
-        mock_entry1 = MagicMock()
-        mock_entry1.log_name = "projects/my-project/logs/app"
-        mock_entry2 = MagicMock()
-        mock_entry2.log_name = "projects/my-project/logs/web"
-        client.list_entries.return_value = [mock_entry1, mock_entry2]
-        result = inst.list_log_groups()
-        assert "app" in result
-        assert "web" in result
+        inst.logs_client.list_logs.return_value = [
+            "projects/my-project/logs/web",
+            "projects/my-project/logs/app",
+        ]
+        assert inst.list_log_groups() == ["app", "web"]
+        inst.logs_client.list_logs.assert_called_once_with(parent="projects/my-project")
+        client.list_entries.assert_not_called()
 
     def test_empty(self, svc):
         inst, client = svc
-        client.list_entries.return_value = []
+        inst.logs_client.list_logs.return_value = []
         assert inst.list_log_groups() == []
 
+    def test_prefix_filtered(self, svc):
+        inst, client = svc
+        inst.logs_client.list_logs.return_value = [
+            "projects/my-project/logs/app-web",
+            "projects/my-project/logs/db",
+        ]
+        assert list(inst.iter_log_groups(prefix="app")) == ["app-web"]
+
+    def test_api_error(self, svc):
+        inst, client = svc
+        inst.logs_client.list_logs.side_effect = gcp_exceptions.InternalServerError("boom")
+        with pytest.raises(LoggingError):
+            inst.list_log_groups()
+
 
 # --- write_log ---
 
@@ -112,8 +127,9 @@ class TestWriteLog:
         mock_logger = MagicMock()
         client.logger.return_value = mock_logger
         inst.write_log("my-log", "msg", labels={"env": "prod"})
-        call_kwargs = mock_logger.log_text.call_args[1]
-        assert call_kwargs["labels"] == {"env": "prod"}
+        mock_logger.log_text.assert_called_once_with(
+            "msg", severity="INFO", labels={"env": "prod"}
+        )
 
     def test_error(self, svc):
         inst, client = svc
@@ -123,17 +139,49 @@ class TestWriteLog:
         with pytest.raises(LoggingError):
             inst.write_log("my-log", "msg")
 
+    def test_severity_spellings(self, svc):
+        inst, client = svc
+        for given in ("warning", "Warning", "WARNING", "wArNiNg"):
+            inst.write_log("my-log", "msg", severity=given)
+            assert client.logger.return_value.log_text.call_args.kwargs["severity"] == "WARNING"
+        inst.write_log("my-log", "msg", severity="notice")
+        assert client.logger.return_value.log_text.call_args.kwargs["severity"] == "DEFAULT"
+
+    def test_logger_reused(self, svc):
+        inst, client = svc
+        inst.write_log("my-log", "a")
+        inst.write_log("my-log", "b")
+        inst.write_log("other", "c")
+        assert [c.args for c in client.logger.call_args_list] == [("my-log",), ("other",)]
+
+
+class TestWriteLogs:
+    def test_single_batch(self, svc):
+        inst, client = svc
+        batch = client.logger.return_value.batch.return_value.__enter__.return_value
+        inst.write_logs("my-log", ["a", "b"], severity="warning", labels={"env": "prod"})
+        assert [c.args for c in batch.log_text.call_args_list] == [("a",), ("b",)]
+        assert batch.log_text.call_args.kwargs == {
+            "severity": "WARNING", "labels": {"env": "prod"}
+        }
+        client.logger.return_value.log_text.assert_not_called()
+
+    def test_error(self, svc):
+        inst, client = svc
+        batch_cm = client.logger.return_value.batch.return_value
+        batch_cm.__exit__.side_effect = gcp_exceptions.InternalServerError("fail")
+        with pytest.raises(LoggingError):
+            inst.write_logs("my-log", ["a"])
+
 
 # --- read_logs ---
 
 class TestReadLogs:
     def test_success(self, svc):
         inst, client = svc
-        mock_entry = MagicMock()
-        mock_entry.timestamp = "2024-01-01T00:00:00Z"
-        mock_entry.payload = "Hello"
-        mock_entry.severity = "INFO"
-        client.list_entries.return_value = [mock_entry]
+        client.list_entries.return_value = [SimpleNamespace(
+            timestamp="2024-01-01T00:00:00Z", payload="Hello", severity="INFO"
+        )]
         logs = inst.read_logs("my-log")
         assert len(logs) == 1
         assert logs[0]["message"] == "Hello"
@@ -144,12 +192,31 @@ class TestReadLogs:
         client.list_entries.return_value = []
         assert inst.read_logs("my-log") == []
 
+    def test_structured_payloads_rendered_as_json(self, svc):
+        from google.protobuf import struct_pb2
+
+        inst, client = svc
+        proto = struct_pb2.Struct()
+        proto.update({"user_id": "u1"})
+        entries = []
+        for payload in ({"a": 1}, proto, None):
+            e = MagicMock(timestamp=None, severity=None)
+            e.payload = payload
+            entries.append(e)
+        client.list_entries.return_value = entries
+        messages = [log["message"] for log in inst.read_logs("my-log")]
+        assert messages[0] == '{"a": 1}'
+        assert json.loads(messages[1]) == {"user_id": "u1"}
+        assert messages[2] == ""
+
     def test_with_custom_filter(self, svc):
         inst, client = svc
         client.list_entries.return_value = []
         inst.read_logs("my-log", filter_pattern='severity="ERROR"')
-        call_kwargs = client.list_entries.call_args[1]
-        assert "ERROR" in call_kwargs["filter_"]
+        client.list_entries.assert_called_once_with(
+            filter_='logName="projects/my-project/logs/my-log" AND severity="ERROR"',
+            page_size=ANY,
+        )
 
     def test_error(self, svc):
         inst, client = svc
@@ -1,5 +1,8 @@
 """Tests for GCP Pub/Sub Queue service."""
 
+import asyncio
+from concurrent.futures import Future
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 import pytest
 
@@ -16,19 +19,34 @@ from cloudjack.base.exceptions import (
 
 
 @pytest.fixture
-def svc():
+def svc(gcp_config):
     with (
-        patch("cloudjack.gcp.queue.pubsub_v1.PublisherClient") as MockPub,
-        patch("cloudjack.gcp.queue.pubsub_v1.SubscriberClient") as MockSub,
+        patch("cloudjack.gcp.queue.pubsub_v1.PublisherClient", spec_set=True) as MockPub,
+        patch("cloudjack.gcp.queue.pubsub_v1.SubscriberClient", spec_set=True) as MockSub,
     ):
         mock_pub = MockPub.return_value
         mock_sub = MockSub.return_value
         mock_pub.topic_path.side_effect = lambda p, t: f"projects/{p}/topics/{t}"
         mock_sub.subscription_path.side_effect = lambda p, s: f"projects/{p}/subscriptions/{s}"
-        instance = Queue(GCPConfig(project_id="my-project"))
+        instance = Queue(gcp_config)
         yield instance, mock_pub, mock_sub
 
 
+class TestPublisherSettings:
+    def test_batching_and_flow_control(self):
+        from google.cloud.pubsub_v1 import types
+
+        with (
+            patch("cloudjack.gcp.queue.pubsub_v1.PublisherClient") as MockPub,
+            patch("cloudjack.gcp.queue.pubsub_v1.SubscriberClient"),
+        ):
+            Queue(GCPConfig(project_id="my-project"))
+        kwargs = MockPub.call_args.kwargs
+        assert kwargs["batch_settings"].max_messages == 100
+        flow = kwargs["publisher_options"].flow_control
+        assert flow.limit_exceeded_behavior == types.LimitExceededBehavior.BLOCK
+
+
 # --- create_queue ---
 
 class TestCreateQueue:
@@ -39,18 +57,19 @@ class TestCreateQueue:
         sub.create_subscription.assert_called_once()
         assert "my-queue-sub" in result
 
-    def test_already_exists(self, svc):
+    @pytest.mark.parametrize(
+        "error, exc",
+        [
+            (gcp_exceptions.AlreadyExists("exists"), QueueAlreadyExistsError),
+            (gcp_exceptions.InternalServerError("fail"), QueueError),
+        ],
+    )
+    def test_errors(self, svc, error, exc):
         inst, pub, sub = svc
-        pub.create_topic.side_effect = gcp_exceptions.AlreadyExists("exists")
-        with pytest.raises(QueueAlreadyExistsError):
+        pub.create_topic.side_effect = error
+        with pytest.raises(exc):
             inst.create_queue("dup")
 
-    def test_generic_error(self, svc):
-        inst, pub, sub = svc
-        pub.create_topic.side_effect = gcp_exceptions.InternalServerError("fail")
-        with pytest.raises(QueueError):
-            inst.create_queue("fail")
-
 
 # --- delete_queue ---
 
@@ -88,31 +107,38 @@ class TestDeleteQueue:
 class TestListQueues:
     def test_success(self, svc):
         inst, pub, sub = svc
-        mock_topic1 = MagicMock()
-        mock_topic1.name = "projects/my-project/topics/q1"
-        mock_topic2 = MagicMock()
-        mock_topic2.name = "projects/my-project/topics/q2"
-        pub.list_topics.return_value = [mock_topic1, mock_topic2]
+        pub.list_topics.return_value = [
+            SimpleNamespace(name="projects/my-project/topics/q1"),
+            SimpleNamespace(name="projects/my-project/topics/q2"),
+        ]
         result = inst.list_queues()
         assert result == ["q1", "q2"]
 
     def test_with_prefix(self, svc):
         inst, pub, sub = svc
-        mock_topic = MagicMock()
-        mock_topic.name = "projects/my-project/topics/test-q"
-        pub.list_topics.return_value = [mock_topic]
+        pub.list_topics.return_value = [
+            SimpleNamespace(name="projects/my-project/topics/test-q")
+        ]
         result = inst.list_queues(prefix="test")
         assert result == ["test-q"]
 
+    def test_iter_filters_lazily(self, svc):
+        inst, pub, sub = svc
+        pub.list_topics.return_value = iter(
+            SimpleNamespace(name=f"projects/my-project/topics/{name}")
+            for name in ("other", "test-a", "test-b")
+        )
+        it = inst.iter_queues(prefix="test")
+        assert next(it) == "test-a"
+        assert list(it) == ["test-b"]
+
 
 # --- send_message ---
 
 class TestSendMessage:
     def test_success(self, svc):
         inst, pub, sub = svc
-        future = MagicMock()
-        future.result.return_value = "msg-id-123"
-        pub.publish.return_value = future
+        pub.publish.return_value = _done_future("msg-id-123")
         mid = inst.send_message("my-queue", "hello")
         assert mid == "msg-id-123"
 
@@ -122,19 +148,87 @@ class TestSendMessage:
         with pytest.raises(MessageError):
             inst.send_message("q", "body")
 
+    def test_str_and_bytes_bodies(self, svc):
+        inst, pub, sub = svc
+        payload = b"\x00raw"
+        inst.send_message("q", "héllo")
+        inst.send_message("q", payload)
+        sent = [c.args[1] for c in pub.publish.call_args_list]
+        assert sent == ["héllo".encode("utf-8"), payload]
+        assert sent[1] is payload
+
+
+# --- send_message_batch ---
+
+def _done_future(result=None, exception=None):
+    future = Future()
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
+
+
+class TestSendMessageBatch:
+    def test_success(self, svc):
+        inst, pub, sub = svc
+        pub.publish.side_effect = [_done_future("m1"), _done_future("m2")]
+        assert inst.send_message_batch("q", ["a", "b"]) == ["m1", "m2"]
+        assert pub.publish.call_count == 2
+        pub.publish.assert_called_with("projects/my-project/topics/q", b"b")
+
+    def test_error(self, svc):
+        inst, pub, sub = svc
+        pub.publish.side_effect = [
+            _done_future("m1"),
+            _done_future(exception=gcp_exceptions.InternalServerError("fail")),
+        ]
+        with pytest.raises(MessageError):
+            inst.send_message_batch("q", ["a", "b"])
+
+
+class TestAsyncPublish:
+    def test_batch_awaits_publisher_futures(self, svc):
+        inst, pub, sub = svc
+        pending = [Future(), Future()]
+        pub.publish.side_effect = pending
+
+        async def run():
+            task = asyncio.ensure_future(inst.asend_message_batch("q", ["a", b"b"]))
+            while pub.publish.call_count < 2:
+                await asyncio.sleep(0)
+            # RPCs still in flight: the coroutine is waiting on the loop.
+            assert not task.done()
+            pending[1].set_result("m2")
+            pending[0].set_result("m1")
+            return await task
+
+        assert asyncio.run(run()) == ["m1", "m2"]
+        assert [c.args[1] for c in pub.publish.call_args_list] == [b"a", b"b"]
+
+    def test_single_message(self, svc):
+        inst, pub, sub = svc
+        pub.publish.return_value = _done_future("m1")
+        assert asyncio.run(inst.asend_message("q", "a")) == "m1"
+
+    def test_error(self, svc):
+        inst, pub, sub = svc
+        pub.publish.return_value = _done_future(
+            exception=gcp_exceptions.InternalServerError("fail")
+        )
+        with pytest.raises(MessageError):
+            asyncio.run(inst.asend_message("q", "a"))
+
 
 # --- receive_messages ---
 
 class TestReceiveMessages:
     def test_success(self, svc):
         inst, pub, sub = svc
-        mock_msg = MagicMock()
-        mock_msg.message.message_id = "m1"
-        mock_msg.message.data = b"body"
-        mock_msg.ack_id = "ack1"
-        mock_resp = MagicMock()
-        mock_resp.received_messages = [mock_msg]
-        sub.pull.return_value = mock_resp
+        sub.pull.return_value = SimpleNamespace(received_messages=[SimpleNamespace(
+            ack_id="ack1",
+            message=SimpleNamespace(message_id="m1", data=b"body"),
+        )])
         msgs = inst.receive_messages("q")
         assert len(msgs) == 1
         assert msgs[0]["message_id"] == "m1"
@@ -149,14 +243,119 @@ class TestReceiveMessages:
 
 # --- delete_message ---
 
+class TestReceiveMessagesStream:
+    @staticmethod
+    def _pull_response(*ids):
+        resp = MagicMock()
+        msgs = []
+        for i in ids:
+            m = MagicMock()
+            m.message.message_id = i
+            m.message.data = i.encode()
+            m.ack_id = f"ack-{i}"
+            msgs.append(m)
+        resp.received_messages = msgs
+        return resp
+
+    def test_yields_across_pulls(self, svc):
+        inst, pub, sub = svc
+        sub.pull.side_effect = [
+            self._pull_response("m1", "m2"),
+            self._pull_response(),
+            self._pull_response("m3"),
+        ] + [self._pull_response()] * 10
+        stream = inst.receive_messages_stream("q", max_messages=5)
+        got = [next(stream)["message_id"] for _ in range(3)]
+        stream.close()
+        assert got == ["m1", "m2", "m3"]
+        assert sub.pull.call_args_list[0].kwargs["request"]["max_messages"] == 5
+
+    def test_errors_surface(self, svc):
+        inst, pub, sub = svc
+        sub.pull.side_effect = gcp_exceptions.NotFound("no sub")
+        with pytest.raises(QueueNotFoundError):
+            next(inst.receive_messages_stream("q"))
+
+
+class TestSubscribe:
+    @staticmethod
+    def _message():
+        msg = MagicMock()
+        msg.message_id = "m1"
+        msg.data = b"hello"
+        msg.ack_id = "ack1"
+        return msg
+
+    def test_opens_stream_with_flow_control(self, svc):
+        inst, pub, sub = svc
+        future = inst.subscribe("q", lambda m: None, max_messages=50)
+        assert future is sub.subscribe.return_value
+        args, kwargs = sub.subscribe.call_args
+        assert args == ("projects/my-project/subscriptions/q-sub",)
+        assert kwargs["flow_control"].max_messages == 50
+
+    def test_acks_after_callback(self, svc):
+        inst, pub, sub = svc
+        seen = []
+        inst.subscribe("q", seen.append)
+        msg = self._message()
+        sub.subscribe.call_args.kwargs["callback"](msg)
+        assert seen == [{"message_id": "m1", "body": "hello", "receipt_handle": "ack1"}]
+        msg.ack.assert_called_once()
+        msg.nack.assert_not_called()
+
+    def test_nacks_when_callback_raises(self, svc):
+        inst, pub, sub = svc
+
+        def boom(m):
+            raise ValueError("bad")
+
+        inst.subscribe("q", boom)
+        msg = self._message()
+        sub.subscribe.call_args.kwargs["callback"](msg)
+        msg.nack.assert_called_once()
+        msg.ack.assert_not_called()
+
+
 class TestDeleteMessage:
     def test_success(self, svc):
         inst, pub, sub = svc
         inst.delete_message("q", "ack1")
-        sub.acknowledge.assert_called_once()
+        sub.acknowledge.assert_called_once_with(
+            request={
+                "subscription": "projects/my-project/subscriptions/q-sub",
+                "ack_ids": ["ack1"],
+            }
+        )
 
     def test_error(self, svc):
         inst, pub, sub = svc
         sub.acknowledge.side_effect = gcp_exceptions.InternalServerError("ack failed")
         with pytest.raises(MessageError):
             inst.delete_message("q", "bad-ack")
+
+
+# --- delete_messages ---
+
+class TestDeleteMessages:
+    def test_success(self, svc):
+        inst, pub, sub = svc
+        inst.delete_messages("q", ["ack1", "ack2"])
+        sub.acknowledge.assert_called_once_with(
+            request={
+                "subscription": "projects/my-project/subscriptions/q-sub",
+                "ack_ids": ["ack1", "ack2"],
+            }
+        )
+
+    def test_chunks_large_batches(self, svc):
+        inst, pub, sub = svc
+        inst.delete_messages("q", [f"ack{i}" for i in range(1500)])
+        sizes = [len(c.kwargs["request"]["ack_ids"]) for c in sub.acknowledge.call_args_list]
+        assert sizes == [1000, 500]
+
+    def test_error(self, svc):
+        inst, pub, sub = svc
+        sub.acknowledge.side_effect = gcp_exceptions.InternalServerError("ack failed")
+        with pytest.raises(MessageError):
+            inst.delete_messages("q", ["bad-ack"])
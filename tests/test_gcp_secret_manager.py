@@ -2,8 +2,14 @@ from unittest.mock import patch, MagicMock
 import pytest
 from google.api_core.exceptions import (
     AlreadyExists,
+    DeadlineExceeded,
+    FailedPrecondition,
     InternalServerError,
+    InvalidArgument,
     NotFound,
+    PermissionDenied,
+    ServiceUnavailable,
+    TooManyRequests,
 )
 
 from cloudjack.gcp.secret_manager import SecretManager
@@ -16,11 +22,11 @@ from cloudjack.base.exceptions import (
 
 
 @pytest.fixture
-def sm():
+def sm(gcp_config):
     with patch("cloudjack.gcp.secret_manager.secretmanager_v1") as mock_sm:
         mock_client = MagicMock()
         mock_sm.SecretManagerServiceClient.return_value = mock_client
-        instance = SecretManager(GCPConfig(project_id="my-project"))
+        instance = SecretManager(gcp_config)
         yield instance, mock_client
 
 
@@ -38,17 +44,135 @@ class TestGetSecret:
             name="projects/my-project/secrets/my_secret/versions/latest"
         )
 
-    def test_not_found(self, sm):
+    @pytest.mark.parametrize(
+        "error, exc",
+        [
+            (NotFound("not found"), SecretNotFoundError),
+            (InternalServerError("boom"), SecretManagerError),
+        ],
+    )
+    def test_errors(self, sm, error, exc):
         instance, client = sm
-        client.access_secret_version.side_effect = NotFound("not found")
-        with pytest.raises(SecretNotFoundError):
+        client.access_secret_version.side_effect = error
+        with pytest.raises(exc):
             instance.get_secret("missing")
 
-    def test_generic_error(self, sm):
+
+class TestSecretCache:
+    @staticmethod
+    def _respond(client, value):
+        client.access_secret_version.return_value.payload.data = value
+
+    def test_hit_skips_api(self, sm):
+        instance, client = sm
+        self._respond(client, b"v1")
+        assert instance.get_secret("s") == "v1"
+        assert instance.get_secret("s") == "v1"
+        client.access_secret_version.assert_called_once()
+
+    def test_fresh_bypasses_cache(self, sm):
+        instance, client = sm
+        self._respond(client, b"v1")
+        instance.get_secret("s")
+        self._respond(client, b"v2")
+        assert instance.get_secret("s", fresh=True) == "v2"
+        assert instance.get_secret("s") == "v2"
+
+    def test_expired_entry_refetched(self, sm):
+        instance, client = sm
+        self._respond(client, b"v1")
+        with patch("cloudjack.gcp.secret_manager.time.monotonic", side_effect=[0.0, 61.0]):
+            instance.get_secret("s")
+            instance.get_secret("s")
+        assert client.access_secret_version.call_count == 2
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            InternalServerError("boom"),
+            ServiceUnavailable("down"),
+            DeadlineExceeded("slow"),
+            TooManyRequests("throttled"),
+        ],
+    )
+    def test_stale_value_served_on_transient_error(self, sm, error):
+        instance, client = sm
+        self._respond(client, b"v1")
+        instance.get_secret("s")
+        client.access_secret_version.side_effect = error
+        assert instance.get_secret("s", fresh=True) == "v1"
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            PermissionDenied("revoked"),
+            FailedPrecondition("version destroyed"),
+            InvalidArgument("bad"),
+        ],
+    )
+    def test_stale_value_dropped_on_other_errors(self, sm, error):
         instance, client = sm
-        client.access_secret_version.side_effect = InternalServerError("boom")
+        self._respond(client, b"v1")
+        instance.get_secret("s")
+        client.access_secret_version.side_effect = error
         with pytest.raises(SecretManagerError):
-            instance.get_secret("fail")
+            instance.get_secret("s", fresh=True)
+        self._respond(client, b"v2")
+        client.access_secret_version.side_effect = None
+        assert instance.get_secret("s") == "v2"
+
+    def test_not_found_is_not_masked(self, sm):
+        instance, client = sm
+        self._respond(client, b"v1")
+        instance.get_secret("s")
+        client.access_secret_version.side_effect = NotFound("gone")
+        with pytest.raises(SecretNotFoundError):
+            instance.get_secret("s", fresh=True)
+
+    def test_update_invalidates(self, sm):
+        instance, client = sm
+        self._respond(client, b"v1")
+        instance.get_secret("s")
+        instance.update_secret("s", "v2")
+        instance.get_secret("s")
+        assert client.access_secret_version.call_count == 2
+
+    def test_delete_invalidates(self, sm):
+        instance, client = sm
+        self._respond(client, b"v1")
+        instance.get_secret("s")
+        instance.delete_secret("s")
+        instance.get_secret("s")
+        assert client.access_secret_version.call_count == 2
+
+    @pytest.mark.parametrize(
+        "write, rpc",
+        [
+            (lambda inst: inst.update_secret("s", "v2"), "add_secret_version"),
+            (lambda inst: inst.delete_secret("s"), "delete_secret"),
+        ],
+        ids=["update", "delete"],
+    )
+    def test_concurrent_read_during_write_not_cached(self, sm, write, rpc):
+        instance, client = sm
+        self._respond(client, b"v1")
+
+        def racing_read(*args, **kwargs):
+            # A get_secret that lands while the write RPC is in flight.
+            instance.get_secret("s")
+
+        getattr(client, rpc).side_effect = racing_read
+        write(instance)
+        assert "s" not in instance._secret_cache
+
+    def test_zero_ttl_disables_cache(self):
+        with patch("cloudjack.gcp.secret_manager.secretmanager_v1") as mock_sm:
+            client = mock_sm.SecretManagerServiceClient.return_value
+            instance = SecretManager(GCPConfig(project_id="my-project", secret_ttl=0))
+            self._respond(client, b"v1")
+            instance.get_secret("s")
+            instance.get_secret("s")
+        assert client.access_secret_version.call_count == 2
 
 
 # --- create_secret ---
@@ -61,18 +185,19 @@ class TestCreateSecret:
         client.create_secret.assert_called_once()
         client.add_secret_version.assert_called_once()
 
-    def test_already_exists(self, sm):
+    @pytest.mark.parametrize(
+        "error, exc",
+        [
+            (AlreadyExists("exists"), SecretAlreadyExistsError),
+            (InternalServerError("boom"), SecretManagerError),
+        ],
+    )
+    def test_errors(self, sm, error, exc):
         instance, client = sm
-        client.create_secret.side_effect = AlreadyExists("exists")
-        with pytest.raises(SecretAlreadyExistsError):
+        client.create_secret.side_effect = error
+        with pytest.raises(exc):
             instance.create_secret("dup", "value")
 
-    def test_generic_error(self, sm):
-        instance, client = sm
-        client.create_secret.side_effect = InternalServerError("boom")
-        with pytest.raises(SecretManagerError):
-            instance.create_secret("fail", "value")
-
 
 # --- update_secret ---
 
@@ -81,23 +206,27 @@ class TestUpdateSecret:
     def test_success(self, sm):
         instance, client = sm
         instance.update_secret("existing", "new_val")
-        client.get_secret.assert_called_once_with(
-            name="projects/my-project/secrets/existing"
+        client.get_secret.assert_not_called()
+        client.add_secret_version.assert_called_once_with(
+            request={
+                "parent": "projects/my-project/secrets/existing",
+                "payload": {"data": b"new_val"},
+            }
         )
-        client.add_secret_version.assert_called_once()
 
-    def test_not_found(self, sm):
+    @pytest.mark.parametrize(
+        "error, exc",
+        [
+            (NotFound("not found"), SecretNotFoundError),
+            (InternalServerError("boom"), SecretManagerError),
+        ],
+    )
+    def test_errors(self, sm, error, exc):
         instance, client = sm
-        client.get_secret.side_effect = NotFound("not found")
-        with pytest.raises(SecretNotFoundError):
+        client.add_secret_version.side_effect = error
+        with pytest.raises(exc):
             instance.update_secret("missing", "val")
 
-    def test_generic_error(self, sm):
-        instance, client = sm
-        client.get_secret.side_effect = InternalServerError("boom")
-        with pytest.raises(SecretManagerError):
-            instance.update_secret("fail", "val")
-
 
 # --- delete_secret ---
 
@@ -110,14 +239,15 @@ class TestDeleteSecret:
             name="projects/my-project/secrets/existing"
         )
 
-    def test_not_found(self, sm):
+    @pytest.mark.parametrize(
+        "error, exc",
+        [
+            (NotFound("not found"), SecretNotFoundError),
+            (InternalServerError("boom"), SecretManagerError),
+        ],
+    )
+    def test_errors(self, sm, error, exc):
         instance, client = sm
-        client.delete_secret.side_effect = NotFound("not found")
-        with pytest.raises(SecretNotFoundError):
+        client.delete_secret.side_effect = error
+        with pytest.raises(exc):
             instance.delete_secret("missing")
-
-    def test_generic_error(self, sm):
-        instance, client = sm
-        client.delete_secret.side_effect = InternalServerError("boom")
-        with pytest.raises(SecretManagerError):
-            instance.delete_secret("fail")
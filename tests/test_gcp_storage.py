@@ -1,11 +1,15 @@
-from unittest.mock import patch, MagicMock, call
+from types import SimpleNamespace
+from unittest.mock import Mock, patch, MagicMock
 from datetime import timedelta
 import pytest
-from google.api_core.exceptions import NotFound, Conflict
+from google.api_core.exceptions import NotFound, Conflict, RequestRangeNotSatisfiable
 from google.cloud.exceptions import GoogleCloudError
 
+from google.auth.credentials import Signing
+from google.cloud.storage import Blob, Bucket
+from google.auth.exceptions import RefreshError
+
 from cloudjack.gcp.storage import Storage
-from cloudjack.base.config import GCPConfig
 from cloudjack.base.exceptions import (
     StorageError,
     BucketNotFoundError,
@@ -14,15 +18,37 @@ from cloudjack.base.exceptions import (
 )
 
 
+# What generate_signed_url forwards to the blob when the caller passes nothing.
+SIGNED_URL_DEFAULTS = {
+    "method": "GET",
+    "content_type": None,
+    "response_disposition": None,
+    "response_type": None,
+    "version": "v4",
+    "scheme": "https",
+}
+
+
 @pytest.fixture
-def storage():
-    with patch("cloudjack.gcp.storage.gcs") as mock_gcs:
-        mock_client = MagicMock()
-        mock_gcs.Client.return_value = mock_client
-        instance = Storage(GCPConfig(project_id="my-project"))
+def storage(gcp_config):
+    with patch("cloudjack.gcp.storage.gcs.Client", spec=True) as MockClient:
+        mock_client = MockClient.return_value
+        mock_client._credentials = MagicMock(spec=Signing)
+        instance = Storage(gcp_config)
         yield instance, mock_client
 
 
+@pytest.fixture
+def blob(storage):
+    """Route every bucket/blob lookup to one spec'd blob."""
+    instance, client = storage
+    mock_bucket = Mock(spec_set=Bucket)
+    mock_blob = Mock(spec_set=Blob)
+    client.bucket.return_value = mock_bucket
+    mock_bucket.blob.return_value = mock_blob
+    return instance, mock_blob
+
+
 # --- Bucket operations ---
 
 
@@ -32,23 +58,24 @@ class TestCreateBucket:
         instance.create_bucket("my-bucket")
         client.create_bucket.assert_called_once_with("my-bucket")
 
-    def test_conflict(self, storage):
+    @pytest.mark.parametrize(
+        "error, exc",
+        [
+            (Conflict("exists"), BucketAlreadyExistsError),
+            (GoogleCloudError("fail"), StorageError),
+        ],
+    )
+    def test_errors(self, storage, error, exc):
         instance, client = storage
-        client.create_bucket.side_effect = Conflict("exists")
-        with pytest.raises(BucketAlreadyExistsError):
-            instance.create_bucket("dup")
-
-    def test_generic_error(self, storage):
-        instance, client = storage
-        client.create_bucket.side_effect = GoogleCloudError("fail")
-        with pytest.raises(StorageError):
-            instance.create_bucket("fail")
+        client.create_bucket.side_effect = error
+        with pytest.raises(exc):
+            instance.create_bucket("my-bucket")
 
 
 class TestDeleteBucket:
     def test_success(self, storage):
         instance, client = storage
-        mock_bucket = MagicMock()
+        mock_bucket = Mock(spec_set=Bucket)
         client.get_bucket.return_value = mock_bucket
         instance.delete_bucket("my-bucket")
         client.get_bucket.assert_called_once_with("my-bucket")
@@ -64,9 +91,10 @@ class TestDeleteBucket:
 class TestListBuckets:
     def test_success(self, storage):
         instance, client = storage
-        b1, b2 = MagicMock(), MagicMock()
-        b1.name, b2.name = "a", "b"
-        client.list_buckets.return_value = [b1, b2]
+        client.list_buckets.return_value = [
+            SimpleNamespace(name="a"),
+            SimpleNamespace(name="b"),
+        ]
         assert instance.list_buckets() == ["a", "b"]
 
     def test_empty(self, storage):
@@ -85,71 +113,116 @@ class TestListBuckets:
 
 
 class TestUploadObjectFromFile:
-    def test_success(self, storage):
-        instance, client = storage
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-        client.get_bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
+    def test_success(self, blob):
+        instance, mock_blob = blob
         instance.upload_object_from_file("bucket", "key", "/tmp/file")
         mock_blob.upload_from_filename.assert_called_once_with("/tmp/file")
 
     def test_bucket_not_found(self, storage):
         instance, client = storage
-        client.get_bucket.side_effect = NotFound("bucket not found")
-        with pytest.raises((BucketNotFoundError, ObjectNotFoundError)):
+        blob = client.bucket.return_value.blob.return_value
+        blob.upload_from_filename.side_effect = NotFound("bucket not found")
+        with pytest.raises(BucketNotFoundError):
             instance.upload_object_from_file("missing", "key", "/tmp/file")
 
+    def test_large_file_uploaded_in_parallel_chunks(self, storage, tmp_path):
+        instance, client = storage
+        path = tmp_path / "big.bin"
+        with open(path, "wb") as f:
+            f.truncate(200 * 1024 * 1024)  # sparse file, no real disk usage
+        blob = client.bucket.return_value.blob.return_value
+        with patch("cloudjack.gcp.storage.transfer_manager") as tm:
+            instance.upload_object_from_file("bucket", "key", str(path))
+        tm.upload_chunks_concurrently.assert_called_once_with(
+            str(path),
+            blob,
+            chunk_size=32 * 1024 * 1024,
+            worker_type=tm.THREAD,
+            max_workers=8,
+        )
+        blob.upload_from_filename.assert_not_called()
+
 
 class TestDownloadFile:
-    def test_success(self, storage):
-        instance, client = storage
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-        client.get_bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
+    def test_success(self, blob):
+        instance, mock_blob = blob
         instance.download_file("bucket", "key", "/tmp/dest")
         mock_blob.download_to_filename.assert_called_once_with("/tmp/dest")
 
     def test_not_found(self, storage):
         instance, client = storage
-        client.get_bucket.side_effect = NotFound("not found")
-        with pytest.raises((BucketNotFoundError, ObjectNotFoundError)):
+        blob = client.bucket.return_value.blob.return_value
+        blob.download_to_filename.side_effect = NotFound("not found")
+        with pytest.raises(ObjectNotFoundError):
             instance.download_file("bucket", "missing", "/tmp/dest")
 
 
 class TestDeleteObject:
-    def test_success(self, storage):
-        instance, client = storage
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-        client.get_bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
+    def test_success(self, blob):
+        instance, mock_blob = blob
         instance.delete_object("bucket", "key")
         mock_blob.delete.assert_called_once()
 
-    def test_not_found(self, storage):
-        instance, client = storage
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-        client.get_bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
+    def test_not_found(self, blob):
+        instance, mock_blob = blob
         mock_blob.delete.side_effect = NotFound("not found")
         with pytest.raises((BucketNotFoundError, ObjectNotFoundError)):
             instance.delete_object("bucket", "missing")
 
 
+class TestDeleteObjects:
+    def test_deletes_each_object(self, storage):
+        instance, client = storage
+        mock_bucket = Mock(spec_set=Bucket)
+        client.bucket.return_value = mock_bucket
+        assert instance.delete_objects("bucket", iter(["a", "b"])) == ["a", "b"]
+        assert sorted(c.args[0] for c in mock_bucket.blob.call_args_list) == ["a", "b"]
+
+    def test_not_found(self, storage):
+        instance, client = storage
+        blob = client.bucket.return_value.blob.return_value
+        blob.delete.side_effect = NotFound("bucket not found")
+        with pytest.raises(BucketNotFoundError):
+            instance.delete_objects("missing", ["a"])
+
+
+class TestMultiFileTransfers:
+    def test_upload_files(self, storage):
+        instance, client = storage
+        bucket = client.bucket.return_value
+        instance.upload_files("bucket", [("a", "/tmp/a"), ("b", "/tmp/b")])
+        assert sorted(c.args[0] for c in bucket.blob.call_args_list) == ["a", "b"]
+        assert bucket.blob.return_value.upload_from_filename.call_count == 2
+
+    def test_download_files(self, storage):
+        instance, client = storage
+        blob = client.bucket.return_value.blob.return_value
+        instance.download_files("bucket", [("a", "/tmp/a"), ("b", "/tmp/b")])
+        assert sorted(
+            c.args[0] for c in blob.download_to_filename.call_args_list
+        ) == ["/tmp/a", "/tmp/b"]
+
+    def test_failure_raised_after_all_calls(self, storage):
+        instance, client = storage
+        blob = client.bucket.return_value.blob.return_value
+        blob.upload_from_filename.side_effect = [NotFound("bucket not found"), None, None]
+        with pytest.raises(BucketNotFoundError):
+            instance.upload_files("bucket", [("a", "/a"), ("b", "/b"), ("c", "/c")])
+        assert blob.upload_from_filename.call_count == 3
+
+
 class TestListObjects:
     def test_success(self, storage):
         instance, client = storage
-        b1, b2 = MagicMock(), MagicMock()
-        b1.name, b2.name = "a.txt", "b.txt"
-        client.list_blobs.return_value = [b1, b2]
+        client.list_blobs.return_value.pages = [
+            [SimpleNamespace(name="a.txt")],
+            [SimpleNamespace(name="b.txt")],
+        ]
         assert instance.list_objects("bucket") == ["a.txt", "b.txt"]
 
     def test_with_prefix(self, storage):
         instance, client = storage
-        client.list_blobs.return_value = []
+        client.list_blobs.return_value.pages = []
         instance.list_objects("bucket", prefix="data/")
         client.list_blobs.assert_called_once_with("bucket", prefix="data/")
 
@@ -159,113 +232,190 @@ class TestListObjects:
         with pytest.raises((BucketNotFoundError, ObjectNotFoundError)):
             instance.list_objects("missing")
 
+    def test_iter_is_lazy(self, storage):
+        instance, client = storage
+        client.list_blobs.return_value.pages = iter(
+            [[SimpleNamespace(name="a.txt")], [SimpleNamespace(name="b.txt")]]
+        )
+        it = instance.iter_objects("bucket", prefix="a")
+        client.list_blobs.assert_not_called()
+        assert next(it) == "a.txt"
+        client.list_blobs.assert_called_once_with("bucket", prefix="a")
 
-class TestGetObject:
-    def test_success(self, storage):
+    def test_iter_maps_errors_from_later_pages(self, storage):
         instance, client = storage
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-        client.get_bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
+        def pages():
+            yield [SimpleNamespace(name="a.txt")]
+            raise NotFound("bucket not found")
+
+        client.list_blobs.return_value.pages = pages()
+        it = instance.iter_objects("bucket")
+        assert next(it) == "a.txt"
+        with pytest.raises(BucketNotFoundError):
+            next(it)
+
+    def test_iter_maps_errors(self, storage):
+        instance, client = storage
+        client.list_blobs.side_effect = NotFound("bucket not found")
+        with pytest.raises(BucketNotFoundError):
+            next(instance.iter_objects("missing"))
+
+
+class TestGetObject:
+    def test_success(self, blob):
+        instance, mock_blob = blob
         mock_blob.download_as_bytes.return_value = b"hello"
         assert instance.get_object("bucket", "key") == b"hello"
 
+    def test_small_object_is_one_request(self, blob):
+        instance, mock_blob = blob
+        mock_blob.download_as_bytes.return_value = b"hello"
+        instance.get_object("bucket", "key")
+        mock_blob.download_as_bytes.assert_called_once()
+        mock_blob.reload.assert_not_called()
+
+    def test_empty_object(self, blob):
+        instance, mock_blob = blob
+        mock_blob.download_as_bytes.side_effect = RequestRangeNotSatisfiable("416")
+        assert instance.get_object("bucket", "empty") == b""
+
     def test_not_found(self, storage):
         instance, client = storage
-        client.get_bucket.side_effect = NotFound("not found")
-        with pytest.raises((BucketNotFoundError, ObjectNotFoundError)):
+        blob = client.bucket.return_value.blob.return_value
+        blob.download_as_bytes.side_effect = NotFound("not found")
+        with pytest.raises(ObjectNotFoundError):
             instance.get_object("bucket", "missing")
 
+    def test_large_object_read_in_parallel_ranges(self, storage):
+        instance, client = storage
+        data = b"abcdefghij"
+        blobs = []
+
+        def make_blob(name, generation=None):
+            blob = MagicMock(generation=generation, content_encoding=None)
+
+            def download(start, end):
+                blob.generation = 7  # read from the response headers
+                return data[start : end + 1]
+
+            blob.download_as_bytes.side_effect = download
+
+            def reload():
+                blob.size = len(data)
+
+            blob.reload.side_effect = reload
+            blobs.append(blob)
+            return blob
+
+        client.bucket.return_value.blob.side_effect = make_blob
+        with patch("cloudjack.gcp.storage._RANGE_CHUNK_SIZE", 4):
+            assert instance.get_object("bucket", "big") == data
+        ranges = sorted(
+            c.kwargs["start"] for b in blobs for c in b.download_as_bytes.call_args_list
+        )
+        assert ranges == [0, 4, 8]
+        assert all(b.generation == 7 for b in blobs[1:])
+        assert [b.reload.call_count for b in blobs] == [0, 1, 0, 0]
+        assert [c.kwargs for c in client.bucket.return_value.blob.call_args_list[1:]] == [
+            {"generation": 7}
+        ] * 3
+
 
 class TestGenerateSignedUrl:
-    def test_defaults(self, storage):
-        instance, client = storage
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-        client.get_bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
+    @pytest.mark.parametrize(
+        "kwargs, expiration",
+        [
+            ({}, 3600),
+            ({"method": "PUT", "content_type": "application/json"}, 7200),
+            (
+                {
+                    "response_disposition": 'attachment; filename="f.txt"',
+                    "response_type": "application/octet-stream",
+                },
+                3600,
+            ),
+            ({"version": "v2", "scheme": "http"}, 900),
+        ],
+        ids=["defaults", "put_with_content_type", "response_params", "v2_http"],
+    )
+    def test_signs_request(self, blob, kwargs, expiration):
+        instance, mock_blob = blob
         mock_blob.generate_signed_url.return_value = "https://signed-url"
-        url = instance.generate_signed_url("bucket", "key", 3600)
+        url = instance.generate_signed_url("bucket", "key", expiration, **kwargs)
         assert url == "https://signed-url"
         mock_blob.generate_signed_url.assert_called_once_with(
-            expiration=timedelta(seconds=3600),
-            method="GET",
-            content_type=None,
-            response_disposition=None,
-            response_type=None,
-            version="v4",
-            scheme="https",
+            expiration=timedelta(seconds=expiration),
+            **{**SIGNED_URL_DEFAULTS, **kwargs},
         )
 
-    def test_custom_method_and_content_type(self, storage):
+    def test_error(self, storage):
         instance, client = storage
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-        client.get_bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.generate_signed_url.return_value = "https://put-url"
-        url = instance.generate_signed_url(
-            "bucket", "key", 7200,
-            method="PUT",
-            content_type="application/json",
-        )
-        assert url == "https://put-url"
-        mock_blob.generate_signed_url.assert_called_once_with(
-            expiration=timedelta(seconds=7200),
-            method="PUT",
-            content_type="application/json",
-            response_disposition=None,
-            response_type=None,
-            version="v4",
-            scheme="https",
-        )
+        blob = client.bucket.return_value.blob.return_value
+        blob.generate_signed_url.side_effect = GoogleCloudError("fail")
+        with pytest.raises(StorageError):
+            instance.generate_signed_url("bucket", "key", 3600)
+
+
+class TestClose:
+    def test_close_shuts_down_pool(self, storage):
+        instance, _ = storage
+        instance.close()
+        with pytest.raises(RuntimeError):
+            instance._pool.submit(print)
 
-    def test_response_params(self, storage):
+    def test_context_manager_closes(self, storage):
+        instance, _ = storage
+        with instance as entered:
+            assert entered is instance
+        assert instance._pool._shutdown
+
+
+class TestBucketHandles:
+    def test_handle_built_once_without_metadata_fetch(self, storage):
         instance, client = storage
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-        client.get_bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.generate_signed_url.return_value = "https://dl-url"
-        url = instance.generate_signed_url(
-            "bucket", "key", 3600,
-            response_disposition='attachment; filename="f.txt"',
-            response_type="application/octet-stream",
-        )
-        assert url == "https://dl-url"
-        mock_blob.generate_signed_url.assert_called_once_with(
-            expiration=timedelta(seconds=3600),
-            method="GET",
-            content_type=None,
-            response_disposition='attachment; filename="f.txt"',
-            response_type="application/octet-stream",
-            version="v4",
-            scheme="https",
-        )
+        instance.upload_object_from_bytes("bucket", "a", b"1")
+        instance.get_object("bucket", "a")
+        instance.delete_object("bucket", "a")
+        client.bucket.assert_called_once_with("bucket")
+        client.get_bucket.assert_not_called()
 
-    def test_v2_and_http_scheme(self, storage):
+    def test_delete_bucket_drops_handle(self, storage):
         instance, client = storage
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
-        client.get_bucket.return_value = mock_bucket
-        mock_bucket.blob.return_value = mock_blob
-        mock_blob.generate_signed_url.return_value = "http://v2-url"
-        url = instance.generate_signed_url(
-            "bucket", "key", 900, version="v2", scheme="http",
-        )
-        assert url == "http://v2-url"
-        mock_blob.generate_signed_url.assert_called_once_with(
-            expiration=timedelta(seconds=900),
-            method="GET",
-            content_type=None,
-            response_disposition=None,
-            response_type=None,
-            version="v2",
-            scheme="http",
-        )
+        instance.get_object("bucket", "a")
+        instance.delete_bucket("bucket")
+        instance.get_object("bucket", "a")
+        assert client.bucket.call_count == 2
 
-    def test_error(self, storage):
+
+class TestSignedUrlWithoutKey:
+    @staticmethod
+    def _token_creds(client, valid=True):
+        creds = MagicMock(valid=valid, token="tok", service_account_email="sa@p.iam")
+        client._credentials = creds
+        return creds
+
+    def test_signs_through_iam(self, storage):
         instance, client = storage
-        client.get_bucket.side_effect = GoogleCloudError("fail")
-        with pytest.raises(StorageError):
-            instance.generate_signed_url("bucket", "key", 3600)
+        self._token_creds(client)
+        blob = client.bucket.return_value.blob.return_value
+        instance.generate_signed_url("bucket", "key", 60)
+        kwargs = blob.generate_signed_url.call_args.kwargs
+        assert kwargs["service_account_email"] == "sa@p.iam"
+        assert kwargs["access_token"] == "tok"
+
+    def test_refreshes_expired_token_with_one_request(self, storage):
+        instance, client = storage
+        creds = self._token_creds(client, valid=False)
+        with patch("cloudjack.gcp.storage.AuthRequest") as MockRequest:
+            instance.generate_signed_url("bucket", "key", 60)
+            instance.generate_signed_url("bucket", "key", 60)
+        MockRequest.assert_called_once_with()
+        assert creds.refresh.call_count == 2
+
+    def test_refresh_error_mapped(self, storage):
+        instance, client = storage
+        creds = self._token_creds(client, valid=False)
+        creds.refresh.side_effect = RefreshError("no metadata server")
+        with patch("cloudjack.gcp.storage.AuthRequest"):
+            with pytest.raises(StorageError):
+                instance.generate_signed_url("bucket", "key", 60)